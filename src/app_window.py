@@ -11,6 +11,7 @@ from google_maps_settings import GoogleMapsSettings
 from icon_utils import refresh_icons
 from map_preview_widget import MapPreviewWidget, WEBENGINE_AVAILABLE
 from resource_paths import find_icon_path
+from services import shutdown_file_fingerprints
 from settings_dialog import SettingsDialog
 from theme import ThemeController, apply_card_shadows
 
@@ -124,6 +125,9 @@ class App(QMainWindow):
         self.debris_page.simulation_busy_changed.connect(
             self._on_debris_simulation_busy_changed
         )
+        self.transpose_page.transposition_busy_changed.connect(
+            self._on_transposition_busy_changed
+        )
 
         self.page_scrolls = {
             self.transpose_page: self._create_page_scroll(self.transpose_page),
@@ -440,8 +444,16 @@ class App(QMainWindow):
         if not busy and self._close_pending:
             QTimer.singleShot(0, self.close)
 
+    def _on_transposition_busy_changed(self, busy):
+        if not busy and self._close_pending:
+            QTimer.singleShot(0, self.close)
+
     def closeEvent(self, event):
-        if not self.debris_page.has_active_simulation():
+        simulating = self.debris_page.has_active_simulation()
+        transposing = self.transpose_page.has_active_transposition()
+        if not (simulating or transposing):
+            self.transpose_page.runway_analysis_queue.shutdown()
+            shutdown_file_fingerprints()
             self.map_preview.shutdown()
             event.accept()
             return
@@ -450,10 +462,16 @@ class App(QMainWindow):
             event.ignore()
             return
 
+        if simulating:
+            title = "Simulation in progress"
+            text = "Cancel the running debris simulation and close the application?"
+        else:
+            title = "Transposition in progress"
+            text = "Cancel the running transposition and close the application?"
         choice = QMessageBox.question(
             self,
-            "Simulation in progress",
-            "Cancel the running debris simulation and close the application?",
+            title,
+            text,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
@@ -462,5 +480,8 @@ class App(QMainWindow):
             return
 
         self._close_pending = True
-        self.debris_page.cancel_simulation(silent=True)
+        if simulating:
+            self.debris_page.cancel_simulation(silent=True)
+        if transposing:
+            self.transpose_page.cancel_transposition(silent=True)
         event.ignore()
@@ -1,5 +1,6 @@
 """Tasmead Display Tools application entry point."""
 
+import multiprocessing
 import sys
 
 from webengine_runtime import configure_webengine_runtime
@@ -12,7 +13,8 @@ from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication
 
 from app_window import App
-from resource_paths import find_icon_path
+from resource_paths import app_cache_path, find_icon_path
+from services import configure_parsed_track_cache
 from theme import ThemeController
 
 
@@ -20,6 +22,10 @@ def main():
     app = QApplication(sys.argv)
     app.setOrganizationName("Tasmead")
     app.setApplicationName("Tasmead Display Tools")
+    try:
+        configure_parsed_track_cache(sidecar_dir=app_cache_path("parsed-tracks"))
+    except OSError:
+        pass
     app_icon = find_icon_path()
     if app_icon:
         app.setWindowIcon(QIcon(app_icon))
@@ -31,4 +37,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Batch transposition prepares large inputs in spawned worker processes.
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, replace
+import gzip
+import hashlib
 import json
 import re
 import secrets
@@ -24,7 +27,14 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from services.map_preview import PreviewScene, TraceAdjustment, preview_payload
+from services.map_preview import (
+    PREVIEW_PAYLOAD_VERSIONS,
+    PreparedTrace,
+    PreviewScene,
+    TraceAdjustment,
+    preview_tolerance,
+    trace_payload,
+)
 
 try:  # WebEngine is optional until the user requests a preview.
     from PyQt6.QtWebChannel import QWebChannel
@@ -37,13 +47,16 @@ except ImportError:  # pragma: no cover - exercised on installations without Web
 
 
 WEBENGINE_AVAILABLE = QWebEngineView is not None
-_CHUNK_SIZE = 128 * 1024
 _MAX_PAYLOAD_BYTES = 64 * 1024 * 1024
+_GZIP_MIN_BYTES = 1024
 _MAX_CSP_DIAGNOSTICS = 32
 _SHELL_READY_TIMEOUT_MS = 10_000
 _PRESENTATION_REFRESH_INTERVAL_MS = 33
 _NONCE_PATTERN = re.compile(r"[A-Za-z0-9_-]{16,128}")
 _GENERATION_QUERY_PATTERN = re.compile(r"generation=([1-9][0-9]{0,9})")
+_SCENE_TARGET_PATTERN = re.compile(
+    r"/([1-9][0-9]{0,9})/(0|[1-9][0-9]{0,9})/([A-Za-z0-9_-]{32})"
+)
 _MAX_GENERATION = 2_147_483_647
 _CSP_DIRECTIVES = frozenset(
     {
@@ -109,8 +122,12 @@ def _validated_nonce(nonce: str) -> str:
     return value
 
 
+def _preview_html_bytes(nonce: str) -> bytes:
+    return _validated_nonce(nonce).encode("ascii").join(_PREVIEW_HTML_PARTS)
+
+
 def _render_preview_html(nonce: str) -> str:
-    return _PREVIEW_HTML.replace("__NONCE__", _validated_nonce(nonce))
+    return _preview_html_bytes(nonce).decode("utf-8")
 
 
 def _content_security_policy(nonce: str) -> str:
@@ -197,6 +214,116 @@ def _generation_from_request_target(
     return generation if generation <= _MAX_GENERATION else None
 
 
+def _scene_from_request_target(
+    request_target: str,
+    scene_path: str,
+) -> tuple[int, int, str] | None:
+    """Return the generation, revision and one-time token of a scene request."""
+    try:
+        request = urlsplit(str(request_target))
+    except (TypeError, ValueError):
+        return None
+    if (
+        request.scheme
+        or request.netloc
+        or request.query
+        or request.fragment
+        or not request.path.startswith(scene_path)
+    ):
+        return None
+    match = _SCENE_TARGET_PATTERN.fullmatch(request.path[len(scene_path):])
+    if match is None:
+        return None
+    generation, revision = int(match.group(1)), int(match.group(2))
+    if generation > _MAX_GENERATION or revision > _MAX_GENERATION:
+        return None
+    return generation, revision, match.group(3)
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    for item in str(accept_encoding or "").split(","):
+        coding, _, parameter = item.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() != "q":
+            return True
+        try:
+            return float(value) > 0.0
+        except ValueError:
+            return False
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class _PublishedScene:
+    """One scene update held for a single fetch; ``body`` is ``None`` once superseded."""
+
+    generation: int
+    revision: int
+    body: bytes | None
+
+
+@dataclass(frozen=True, slots=True)
+class _EncodedTrace:
+    """One trace's serialized Maps payload and the digest the page keys it by."""
+
+    trace: PreparedTrace
+    version: int
+    tolerance_m: float
+    data: bytes
+    digest: str
+    simplification: dict[str, Any] | None
+
+
+def _encode_trace(
+    trace: PreparedTrace,
+    version: int,
+    tolerance_m: float,
+) -> _EncodedTrace:
+    payload = trace_payload(trace, version=version, tolerance_m=tolerance_m)
+    text = json.dumps(
+        payload,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    data = text.encode("utf-8")
+    return _EncodedTrace(
+        trace,
+        version,
+        tolerance_m,
+        data,
+        hashlib.sha256(data).hexdigest()[:32],
+        payload["simplification"],
+    )
+
+
+def _simplification_summary(encoded_traces: list[_EncodedTrace]) -> str:
+    simplified = [
+        encoded for encoded in encoded_traces if encoded.simplification is not None
+    ]
+    if not simplified:
+        return ""
+    details = "; ".join(
+        f"{encoded.trace.label}: {encoded.simplification['vertexCount']:,} of "
+        f"{encoded.simplification['sourceVertexCount']:,} vertices, within "
+        f"{encoded.simplification['maxDeviationM']:.3f} m"
+        for encoded in simplified
+    )
+    return (
+        f"Simplified for display only ({details}). "
+        "Applied offsets and KML export keep every vertex."
+    )
+
+
+def _negotiated_payload_version(page_version: int) -> int:
+    """Pick the newest payload version both this module and the page decode."""
+    return max(
+        (version for version in PREVIEW_PAYLOAD_VERSIONS if version <= page_version),
+        default=PREVIEW_PAYLOAD_VERSIONS[0],
+    )
+
+
 def _normalised_web_failure(kind: str, message: str) -> tuple[str, str]:
     safe_kind = str(kind).strip().lower()
     if safe_kind not in _WEB_FAILURE_MESSAGES:
@@ -237,10 +364,16 @@ _PREVIEW_HTML = r"""<!doctype html>
       ? Math.min(2147483647, Number(generationMatch[1]))
       : 0;
     const state = {
-      bridge: null, googleReady: false, chunks: new Map(), pending: null,
-      map: null, payload: null, latestRevision: -1, renderTimeout: null,
+      bridge: null, googleReady: false, loading: Promise.resolve(), pending: null,
+      map: null, traces: new Map(), elements: new Map(), anchors: new Map(),
+      fitPending: false, steady: false, awaitingRevision: -1,
+      latestRevision: -1, renderTimeout: null,
       generation: initialGeneration, cspFailed: false, cspDiagnostics: new Map()
     };
+    // Packed paths are little-endian float64; fall back to JSON objects on a
+    // page that cannot view them in place.
+    const payloadVersion = typeof atob === 'function'
+      && new Uint8Array(new Float64Array([1]).buffer)[7] === 0x3f ? 2 : 1;
     const status = document.getElementById('state');
     const host = document.getElementById('map-host');
     const cspDirectives = new Set([
@@ -346,18 +479,18 @@ _PREVIEW_HTML = r"""<!doctype html>
     function altitudeMode(AltitudeMode, value) {
       return AltitudeMode[value] || value;
     }
-    function allCoordinates(payload) {
+    function allCoordinates() {
       const points = [];
-      for (const trace of payload.traces || []) {
-        for (const geometry of trace.geometries || []) points.push(...(geometry.coordinates || []));
+      for (const {payload} of state.traces.values()) {
+        for (const geometry of payload.geometries || []) points.push(...(geometry.coordinates || []));
       }
       return points;
     }
     function fitScene() {
-      if (!state.map || !state.payload) return;
-      const points = allCoordinates(state.payload);
+      if (!state.map || !state.traces.size) return;
+      const points = allCoordinates();
       if (!points.length) return;
-      const anchor = state.payload.traces[0].anchor;
+      const anchor = state.traces.values().next().value.payload.anchor;
       const originLat = Number(anchor.lat);
       const originLng = Number(anchor.lng);
       let eastMin = 0, eastMax = 0, northMin = 0, northMax = 0;
@@ -387,9 +520,199 @@ _PREVIEW_HTML = r"""<!doctype html>
       state.map.tilt = 60;
       state.map.heading = 0;
     }
-    async function render(payload, revision) {
+    function decodePath(encoded) {
+      const binary = atob(String(encoded));
+      if (binary.length % 24 !== 0) throw new Error('Invalid packed path.');
+      const bytes = new Uint8Array(binary.length);
+      for (let index = 0; index < binary.length; index++) bytes[index] = binary.charCodeAt(index);
+      const values = new Float64Array(bytes.buffer);
+      const path = new Array(values.length / 3);
+      for (let index = 0, offset = 0; offset < values.length; index++, offset += 3) {
+        path[index] = {lat: values[offset], lng: values[offset + 1], altitude: values[offset + 2]};
+      }
+      return path;
+    }
+    function decodeTrace(trace, version) {
+      if (version === 2) {
+        for (const geometry of trace.geometries || []) {
+          geometry.coordinates = decodePath(geometry.path);
+          delete geometry.path;
+        }
+      }
+      return trace;
+    }
+    function applySceneUpdate(update) {
+      // An update lists every trace in the scene with its content digest but
+      // carries payloads only for traces the page does not already hold.
+      if (!update || !(update.version === 1 || update.version === payloadVersion)
+          || !Array.isArray(update.order) || !Array.isArray(update.traces)) {
+        return false;
+      }
+      const updates = new Map(
+        update.traces.map(trace => [String(trace.id), decodeTrace(trace, update.version)])
+      );
+      const traces = new Map();
+      for (const entry of update.order) {
+        if (!Array.isArray(entry) || entry.length !== 2) return false;
+        const id = String(entry[0]);
+        const digest = String(entry[1]);
+        const current = state.traces.get(id);
+        const payload = updates.has(id)
+          ? updates.get(id)
+          : current && current.digest === digest ? current.payload : null;
+        if (!payload) return false;
+        traces.set(id, {digest, payload});
+      }
+      state.traces = traces;
+      if (update.fit) state.fitPending = true;
+      return true;
+    }
+    function acknowledge(revision) {
+      if (state.cspFailed || revision !== state.awaitingRevision
+          || revision !== state.latestRevision) {
+        return;
+      }
+      state.awaitingRevision = -1;
+      if (state.renderTimeout) clearTimeout(state.renderTimeout);
+      state.renderTimeout = null;
+      setStatus('', true);
+      if (state.bridge) state.bridge.renderAcknowledged(state.generation, revision);
+    }
+    function createMap(maps3d, anchor) {
+      const {Map3DElement, MapMode} = maps3d;
+      const map = new Map3DElement({
+        center: {lat: anchor.lat, lng: anchor.lng, altitude: 0},
+        range: 1500,
+        tilt: 60,
+        heading: 0,
+        mode: (MapMode && MapMode.HYBRID) || 'HYBRID'
+      });
+      map.addEventListener('gmp-error', () => {
+        fail('render', 'Google Maps 3D could not initialise. Check WebGL support and the Google project configuration.');
+      });
+      map.addEventListener('gmp-map-id-error', () => {
+        fail('authentication', 'Google rejected the map configuration. Check the API key, restrictions, Maps JavaScript API access, and billing.');
+      });
+      map.addEventListener('gmp-steadychange', event => {
+        if (state.cspFailed) return;
+        state.steady = Boolean(event.isSteady);
+        if (state.bridge) {
+          state.bridge.presentationStateChanged(
+            state.generation, state.latestRevision, state.steady
+          );
+        }
+        if (state.steady) acknowledge(state.latestRevision);
+      });
+      host.replaceChildren(map);
+      return map;
+    }
+    function removeTraceElements(entry) {
+      for (const element of entry.elements) element.remove();
+      const anchor = state.anchors.get(entry.anchorKey);
+      if (anchor && --anchor.users === 0) {
+        if (anchor.marker) anchor.marker.remove();
+        state.anchors.delete(entry.anchorKey);
+      }
+    }
+    function addTraceElements(maps3d, markerLibrary, trace) {
+      const {AltitudeMode, Polyline3DElement, Polygon3DElement} = maps3d;
+      const elements = [];
+      for (const geometry of trace.geometries) {
+        const common = {
+          altitudeMode: altitudeMode(AltitudeMode, geometry.altitudeMode),
+          strokeColor: geometry.style.strokeColor,
+          strokeWidth: geometry.style.strokeWidth
+        };
+        let element = null;
+        if (geometry.type === 'polyline') {
+          element = new Polyline3DElement({
+            ...common,
+            path: geometry.coordinates,
+            extruded: Boolean(geometry.extrude),
+            geodesic: Boolean(geometry.tessellate)
+          });
+        } else if (geometry.type === 'polygon') {
+          element = new Polygon3DElement({
+            ...common,
+            path: geometry.coordinates,
+            // KML's default PolyStyle is opaque white when no polygon
+            // colour sub-style is supplied.
+            fillColor: geometry.style.fillColor || '#ffffffff'
+          });
+        }
+        if (element) {
+          state.map.append(element);
+          elements.push(element);
+        }
+      }
+      const anchorKey = JSON.stringify([
+        trace.anchor.lat, trace.anchor.lng, trace.anchor.altitude,
+        trace.anchor.altitudeMode
+      ]);
+      let anchor = state.anchors.get(anchorKey);
+      if (!anchor) {
+        anchor = {marker: null, users: 0};
+        const MarkerClass = maps3d.Marker3DElement;
+        if (MarkerClass) {
+          anchor.marker = new MarkerClass({
+            position: {lat: trace.anchor.lat, lng: trace.anchor.lng, altitude: trace.anchor.altitude},
+            altitudeMode: altitudeMode(AltitudeMode, trace.anchor.altitudeMode),
+            label: trace.anchor.label,
+            drawsWhenOccluded: true
+          });
+          if (markerLibrary.PinElement && anchor.marker.append) {
+            anchor.marker.append(new markerLibrary.PinElement({
+              background: '#ff00ff', borderColor: '#ffffff', glyphColor: '#ffffff', glyphText: 'A'
+            }));
+          }
+          state.map.append(anchor.marker);
+        }
+        state.anchors.set(anchorKey, anchor);
+      }
+      anchor.users += 1;
+      return {elements, anchorKey};
+    }
+    function syncTraces(maps3d, markerLibrary) {
+      // Only traces whose digest changed are rebuilt; the rest keep their
+      // existing map elements.
+      for (const [id, entry] of state.elements) {
+        const trace = state.traces.get(id);
+        if (trace && trace.digest === entry.digest) continue;
+        removeTraceElements(entry);
+        state.elements.delete(id);
+      }
+      for (const [id, trace] of state.traces) {
+        if (state.elements.has(id)) continue;
+        state.elements.set(id, {
+          digest: trace.digest,
+          ...addTraceElements(maps3d, markerLibrary, trace.payload)
+        });
+      }
+    }
+    async function loadScene(revision, url) {
+      let response;
+      try {
+        response = await fetch(url, {cache: 'no-store', credentials: 'omit'});
+        // Gone: a later update that carries every trace superseded this one.
+        if (response.status === 410) return;
+        if (!response.ok) throw new Error('Scene request failed.');
+      } catch (_) {
+        fail('transport', 'The preview scene was not transferred completely. Try again.');
+        return;
+      }
+      state.latestRevision = revision;
+      let applied;
+      try { applied = applySceneUpdate(await response.json()); }
+      catch (_) { fail('transport', 'The preview scene data was invalid.'); return; }
+      if (!applied) {
+        fail('transport', 'The preview scene was not transferred completely. Try again.');
+        return;
+      }
+      render(revision);
+    }
+    async function render(revision) {
       if (state.cspFailed) return;
-      if (!state.googleReady) { state.pending = {payload, revision}; return; }
+      if (!state.googleReady) { state.pending = revision; return; }
       try {
         setStatus('Rendering WGS84 trace geometry…');
         const [maps3d, markerLibrary] = await Promise.all([
@@ -397,101 +720,28 @@ _PREVIEW_HTML = r"""<!doctype html>
           google.maps.importLibrary('marker')
         ]);
         if (state.cspFailed || Number(revision) !== state.latestRevision) return;
-        const {Map3DElement, MapMode, AltitudeMode, Polyline3DElement, Polygon3DElement} = maps3d;
+        const {Map3DElement, Polyline3DElement, Polygon3DElement} = maps3d;
         if (!Map3DElement || !Polyline3DElement || !Polygon3DElement) {
           throw new Error('Required Maps 3D elements are unavailable.');
         }
-        host.replaceChildren();
-        const map = new Map3DElement({
-          center: {lat: payload.traces[0].anchor.lat, lng: payload.traces[0].anchor.lng, altitude: 0},
-          range: 1500,
-          tilt: 60,
-          heading: 0,
-          mode: (MapMode && MapMode.HYBRID) || 'HYBRID'
-        });
-        map.addEventListener('gmp-error', () => {
-          if (Number(revision) === state.latestRevision) {
-            fail('render', 'Google Maps 3D could not initialise. Check WebGL support and the Google project configuration.');
-          }
-        });
-        map.addEventListener('gmp-map-id-error', () => {
-          if (Number(revision) === state.latestRevision) {
-            fail('authentication', 'Google rejected the map configuration. Check the API key, restrictions, Maps JavaScript API access, and billing.');
-          }
-        });
-        let acknowledged = false;
-        map.addEventListener('gmp-steadychange', event => {
-          if (state.cspFailed || Number(revision) !== state.latestRevision) return;
-          const isSteady = Boolean(event.isSteady);
-          if (state.bridge) {
-            state.bridge.presentationStateChanged(
-              state.generation, Number(revision), isSteady
-            );
-          }
-          if (!isSteady || acknowledged) return;
-          acknowledged = true;
-          if (state.renderTimeout) clearTimeout(state.renderTimeout);
-          state.renderTimeout = null;
-          setStatus('', true);
-          if (state.bridge) state.bridge.renderAcknowledged(state.generation, Number(revision));
-        });
-        host.append(map);
-        state.map = map;
-        state.payload = payload;
-
-        const renderedAnchors = new Set();
-        for (const trace of payload.traces) {
-          for (const geometry of trace.geometries) {
-            const common = {
-              altitudeMode: altitudeMode(AltitudeMode, geometry.altitudeMode),
-              strokeColor: geometry.style.strokeColor,
-              strokeWidth: geometry.style.strokeWidth
-            };
-            if (geometry.type === 'polyline') {
-              map.append(new Polyline3DElement({
-                ...common,
-                path: geometry.coordinates,
-                extruded: Boolean(geometry.extrude),
-                geodesic: Boolean(geometry.tessellate)
-              }));
-            } else if (geometry.type === 'polygon') {
-              map.append(new Polygon3DElement({
-                ...common,
-                path: geometry.coordinates,
-                // KML's default PolyStyle is opaque white when no polygon
-                // colour sub-style is supplied.
-                fillColor: geometry.style.fillColor || '#ffffffff'
-              }));
-            }
-          }
-          const MarkerClass = maps3d.Marker3DElement;
-          const anchorKey = JSON.stringify([
-            trace.anchor.lat, trace.anchor.lng, trace.anchor.altitude,
-            trace.anchor.altitudeMode
-          ]);
-          if (MarkerClass && !renderedAnchors.has(anchorKey)) {
-            renderedAnchors.add(anchorKey);
-            const marker = new MarkerClass({
-              position: {lat: trace.anchor.lat, lng: trace.anchor.lng, altitude: trace.anchor.altitude},
-              altitudeMode: altitudeMode(AltitudeMode, trace.anchor.altitudeMode),
-              label: trace.anchor.label,
-              drawsWhenOccluded: true
-            });
-            if (markerLibrary.PinElement && marker.append) {
-              marker.append(new markerLibrary.PinElement({
-                background: '#ff00ff', borderColor: '#ffffff', glyphColor: '#ffffff', glyphText: 'A'
-              }));
-            }
-            map.append(marker);
-          }
+        if (!state.map) {
+          state.map = createMap(maps3d, state.traces.values().next().value.payload.anchor);
+        }
+        syncTraces(maps3d, markerLibrary);
+        if (state.fitPending) {
+          state.fitPending = false;
+          fitScene();
         }
-        fitScene();
+        state.awaitingRevision = Number(revision);
         if (state.renderTimeout) clearTimeout(state.renderTimeout);
         state.renderTimeout = setTimeout(() => {
-          if (!acknowledged && Number(revision) === state.latestRevision) {
+          if (state.awaitingRevision === Number(revision)) {
             fail('render', 'Google Maps did not reach a stable rendered state. Check WebGL support and try again.');
           }
         }, 20000);
+        // Elements added to an already steady map need not trigger another
+        // steady change, so acknowledge after the next frame in that case.
+        if (state.steady) requestAnimationFrame(() => acknowledge(Number(revision)));
       } catch (_) {
         if (Number(revision) === state.latestRevision) {
           fail('render', 'Google Maps could not render this 3D scene. Check Maps 3D availability and WebGL support.');
@@ -515,36 +765,23 @@ _PREVIEW_HTML = r"""<!doctype html>
           + '&v=quarterly&loading=async&libraries=maps3d,marker&auth_referrer_policy=origin&callback=tasmeadGoogleReady';
         document.head.append(script);
       },
-      beginScene(revision, total) { state.chunks.set(Number(revision), {total: Number(total), parts: []}); },
-      appendSceneChunk(revision, chunk) {
-        const item = state.chunks.get(Number(revision));
-        if (item) item.parts.push(String(chunk));
-      },
-      finishScene(revision) {
-        const key = Number(revision);
-        const item = state.chunks.get(key);
-        if (!item || item.parts.length !== item.total) {
-          fail('transport', 'The preview scene was not transferred completely. Try again.');
-          return;
-        }
-        state.chunks.delete(key);
-        state.latestRevision = key;
-        if (state.cspFailed) return;
-        try { render(JSON.parse(item.parts.join('')), key); }
-        catch (_) { fail('transport', 'The preview scene data was invalid.'); }
+      loadScene(revision, url) {
+        // Each update is a delta against the one before it, so updates are
+        // fetched and applied strictly in order.
+        state.loading = state.loading.then(() => loadScene(Number(revision), String(url)));
       },
       fitScene
     };
     window.tasmeadGoogleReady = () => {
       state.googleReady = true;
-      if (!state.cspFailed && state.pending) {
+      if (!state.cspFailed && state.pending !== null) {
         const pending = state.pending; state.pending = null;
-        render(pending.payload, pending.revision);
+        render(pending);
       }
     };
     new QWebChannel(qt.webChannelTransport, channel => {
       state.bridge = channel.objects.tasmeadBridge;
-      state.bridge.shellReady(state.generation);
+      state.bridge.shellReady(state.generation, payloadVersion);
       flushCspDiagnostics();
     });
   })();
@@ -552,6 +789,10 @@ _PREVIEW_HTML = r"""<!doctype html>
 </body>
 </html>
 """
+# Split once so each response only joins in its nonce.
+_PREVIEW_HTML_PARTS = tuple(
+    part.encode("utf-8") for part in _PREVIEW_HTML.split("__NONCE__")
+)
 
 
 class _PreviewRequestHandler(BaseHTTPRequestHandler):
@@ -559,6 +800,13 @@ class _PreviewRequestHandler(BaseHTTPRequestHandler):
 
     def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler API
         server = self.server
+        scene_request = _scene_from_request_target(
+            self.path,
+            server.scene_path,  # type: ignore[attr-defined]
+        )
+        if scene_request is not None:
+            self._send_scene(*scene_request)
+            return
         generation = _generation_from_request_target(
             self.path,
             server.preview_path,  # type: ignore[attr-defined]
@@ -567,7 +815,7 @@ class _PreviewRequestHandler(BaseHTTPRequestHandler):
             self.send_error(404)
             return
         nonce = secrets.token_urlsafe(24)
-        body = _render_preview_html(nonce).encode("utf-8")
+        body = _preview_html_bytes(nonce)
         content_security_policy = _content_security_policy(nonce)
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
@@ -584,18 +832,57 @@ class _PreviewRequestHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(body)
 
+    def _send_scene(self, generation: int, revision: int, token: str) -> None:
+        scene = self.server.take_scene(token)  # type: ignore[attr-defined]
+        if scene is None or (scene.generation, scene.revision) != (generation, revision):
+            self.send_error(404)
+            return
+        if scene.body is None:
+            # A newer update that carries every trace replaced this one.
+            self.send_error(410)
+            return
+        body = scene.body
+        compressed = (
+            len(body) >= _GZIP_MIN_BYTES
+            and _accepts_gzip(self.headers.get("Accept-Encoding"))
+        )
+        if compressed:
+            # Loopback bandwidth is cheap; favour compression speed.
+            body = gzip.compress(body, compresslevel=1)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Cache-Control", "no-store, max-age=0")
+        self.send_header("Pragma", "no-cache")
+        self.send_header("X-Content-Type-Options", "nosniff")
+        self.end_headers()
+        self.wfile.write(body)
+
     def log_message(self, _format: str, *args: object) -> None:
         return
 
 
 class PreviewLoopbackServer:
-    """Serve one non-sensitive shell from an unguessable loopback URL."""
+    """Serve one non-sensitive shell from an unguessable loopback URL.
+
+    Scene updates are published under the same token path, each behind its
+    own one-time token, and removed as soon as the page fetches them. An
+    update the page has not fetched is superseded, never dropped, by the
+    next one.
+    """
 
     def __init__(self) -> None:
         token = secrets.token_urlsafe(24)
+        self._scenes: dict[str, _PublishedScene] = {}
+        self._scene_lock = threading.Lock()
         self._server = ThreadingHTTPServer(("127.0.0.1", 0), _PreviewRequestHandler)
         self._server.daemon_threads = True
         self._server.preview_path = f"/{token}/preview"  # type: ignore[attr-defined]
+        self._server.scene_path = f"/{token}/scene"  # type: ignore[attr-defined]
+        self._server.take_scene = self._take_scene  # type: ignore[attr-defined]
         self._thread = threading.Thread(
             target=self._server.serve_forever,
             name="tasmead-preview-loopback",
@@ -620,18 +907,51 @@ class PreviewLoopbackServer:
     def port(self) -> int:
         return int(self._server.server_address[1])
 
+    def has_pending_scene(self, generation: int) -> bool:
+        """Return whether the page has yet to fetch an update of ``generation``."""
+        with self._scene_lock:
+            return any(
+                scene.generation == generation and scene.body is not None
+                for scene in self._scenes.values()
+            )
+
+    def publish_scene(self, generation: int, revision: int, body: bytes) -> str:
+        """Hold ``body`` for one fetch and return its same-origin path."""
+        generation = int(generation)
+        revision = int(revision)
+        if not 1 <= generation <= _MAX_GENERATION or not 0 <= revision <= _MAX_GENERATION:
+            raise ValueError("Preview scene generation or revision is out of range.")
+        token = secrets.token_urlsafe(24)
+        with self._scene_lock:
+            # Only the current page can fetch updates. Its unfetched updates
+            # are answered with 410 so it can skip them for this one, which
+            # the caller makes self-contained; see has_pending_scene.
+            for key, scene in list(self._scenes.items()):
+                if scene.generation != generation:
+                    del self._scenes[key]
+                elif scene.body is not None:
+                    self._scenes[key] = replace(scene, body=None)
+            self._scenes[token] = _PublishedScene(generation, revision, bytes(body))
+        return f"{self._server.scene_path}/{generation}/{revision}/{token}"  # type: ignore[attr-defined]
+
+    def _take_scene(self, token: str) -> _PublishedScene | None:
+        with self._scene_lock:
+            return self._scenes.pop(token, None)
+
     def stop(self) -> None:
         if self._server is None:
             return
         server = self._server
         self._server = None
+        with self._scene_lock:
+            self._scenes.clear()
         server.shutdown()
         server.server_close()
         self._thread.join(timeout=2)
 
 
 class MapPreviewBridge(QObject):
-    shell_ready = pyqtSignal(int)
+    shell_ready = pyqtSignal(int, int)
     render_acknowledged = pyqtSignal(int, int)
     render_failed = pyqtSignal(int, str, str)
     presentation_state_changed = pyqtSignal(int, int, bool)
@@ -639,12 +959,19 @@ class MapPreviewBridge(QObject):
         int, str, str, str, str, int, int, int
     )
 
-    @pyqtSlot(int)
-    def shellReady(self, generation: int) -> None:  # noqa: N802 - called from JavaScript
+    @pyqtSlot(int, int)
+    def shellReady(  # noqa: N802 - called from JavaScript
+        self,
+        generation: int,
+        payload_version: int,
+    ) -> None:
         self.shell_ready.emit(
             _clamped_diagnostic_number(
                 generation, minimum=0, maximum=2_147_483_647
-            )
+            ),
+            _clamped_diagnostic_number(
+                payload_version, minimum=0, maximum=2_147_483_647
+            ),
         )
 
     @pyqtSlot(int, int)
@@ -747,6 +1074,14 @@ class MapPreviewWidget(QWidget):
         self._api_key = ""
         self._revision = 0
         self._acknowledged_revision = -1
+        # Encoded payloads by trace ID, reused while the trace object is
+        # unchanged, and the digests the current page already holds.
+        self._encoded_traces: dict[str, _EncodedTrace] = {}
+        self._page_trace_digests: dict[str, str] = {}
+        self._payload_version = PREVIEW_PAYLOAD_VERSIONS[0]
+        self._simplification_summary = ""
+        self._fit_requested = False
+        self._published_fit = False
         self._page_generation = 0
         self._failed_generation: int | None = None
         self._csp_failed_generation: int | None = None
@@ -974,6 +1309,7 @@ class MapPreviewWidget(QWidget):
         self._scene = scene
         self._committed_scene = scene
         self._api_key = key
+        self._fit_requested = True
         self.trace_selector.blockSignals(True)
         self.trace_selector.clear()
         for trace in scene.traces:
@@ -1005,6 +1341,9 @@ class MapPreviewWidget(QWidget):
         self._failed_generation = None
         self._csp_failed_generation = None
         self._csp_diagnostics.clear()
+        self._page_trace_digests = {}
+        self._payload_version = PREVIEW_PAYLOAD_VERSIONS[0]
+        self._fit_requested = True
         return self._page_generation
 
     def _reload_shell(self) -> bool:
@@ -1054,7 +1393,7 @@ class MapPreviewWidget(QWidget):
             "The secure local preview shell did not initialise. Retry the preview; KML export remains available.",
         )
 
-    def _on_shell_ready(self, generation: int) -> None:
+    def _on_shell_ready(self, generation: int, payload_version: int) -> None:
         if (
             generation != self._page_generation
             or self._failed_generation == generation
@@ -1062,6 +1401,7 @@ class MapPreviewWidget(QWidget):
             return
         self._shell_ready_timer.stop()
         self._shell_ready = True
+        self._payload_version = _negotiated_payload_version(payload_version)
         if not self._api_key:
             self._show_error("missing-key", "No Google Maps API key is configured.")
             return
@@ -1099,26 +1439,79 @@ class MapPreviewWidget(QWidget):
             or self._csp_failed_generation == self._page_generation
         ):
             return
-        encoded = json.dumps(
-            preview_payload(self._scene),
-            separators=(",", ":"),
-            ensure_ascii=False,
-        )
-        byte_count = len(encoded.encode("utf-8"))
+        encoded_traces = self._encoded_scene_traces()
+        self._simplification_summary = _simplification_summary(encoded_traces)
+        byte_count = sum(len(trace.data) for trace in encoded_traces)
         if byte_count > _MAX_PAYLOAD_BYTES:
             self._show_error(
                 "oversized",
-                "This scene is too large for the embedded preview. No vertices were simplified; export remains available.",
+                "This scene is too large for the embedded preview even after "
+                "simplifying it for display; export remains available."
+                if self._simplification_summary
+                else "This scene is too large for the embedded preview. No vertices were simplified; export remains available.",
             )
             return
-        chunks = [encoded[index:index + _CHUNK_SIZE] for index in range(0, len(encoded), _CHUNK_SIZE)] or [""]
-        revision = self._revision
-        self._run_javascript(f"window.tasmead.beginScene({revision}, {len(chunks)});")
-        for chunk in chunks:
-            self._run_javascript(
-                f"window.tasmead.appendSceneChunk({revision}, {json.dumps(chunk)});"
+        if self._server is None:
+            return
+        if self._server.has_pending_scene(self._page_generation):
+            # This update supersedes one the page has not fetched, so it
+            # carries every trace and any camera fit the other requested.
+            self._page_trace_digests = {}
+            self._fit_requested = self._fit_requested or self._published_fit
+        # The page keeps every trace it has already been sent, keyed by
+        # digest, so only changed traces are serialized into this update.
+        changed = [
+            trace.data
+            for trace in encoded_traces
+            if self._page_trace_digests.get(trace.trace.trace_id) != trace.digest
+        ]
+        order = json.dumps(
+            [[trace.trace.trace_id, trace.digest] for trace in encoded_traces],
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        fit = self._fit_requested
+        body = b"".join(
+            (
+                f'{{"version":{self._payload_version},"fit":{json.dumps(fit)},'
+                f'"order":{order},"traces":['.encode("utf-8"),
+                b",".join(changed),
+                b"]}",
             )
-        self._run_javascript(f"window.tasmead.finishScene({revision});")
+        )
+        # The page fetches the update from the loopback server, so scene data
+        # never crosses the runJavaScript bridge.
+        revision = self._revision
+        scene_path = self._server.publish_scene(self._page_generation, revision, body)
+        self._run_javascript(
+            f"window.tasmead.loadScene({revision}, {json.dumps(scene_path)});"
+        )
+        self._page_trace_digests = {
+            trace.trace.trace_id: trace.digest for trace in encoded_traces
+        }
+        self._published_fit = fit
+        self._fit_requested = False
+
+    def _encoded_scene_traces(self) -> list[_EncodedTrace]:
+        # One scene-wide tolerance keeps the preview within its vertex
+        # budget; it depends only on the base geometry, so adjusting a trace
+        # leaves the other traces' cached payloads valid.
+        tolerance_m = preview_tolerance(self._scene)
+        encoded_traces: list[_EncodedTrace] = []
+        for trace in self._scene.traces:
+            encoded = self._encoded_traces.get(trace.trace_id)
+            if (
+                encoded is None
+                or encoded.trace is not trace
+                or encoded.version != self._payload_version
+                or encoded.tolerance_m != tolerance_m
+            ):
+                encoded = _encode_trace(trace, self._payload_version, tolerance_m)
+            encoded_traces.append(encoded)
+        self._encoded_traces = {
+            encoded.trace.trace_id: encoded for encoded in encoded_traces
+        }
+        return encoded_traces
 
     def _run_javascript(self, source: str) -> None:
         if self._web_view is not None:
@@ -1142,7 +1535,12 @@ class MapPreviewWidget(QWidget):
             and self._server is not None
         )
         self.status_label.setText(
-            "Preview matches the quantized WGS84 geometry that will be exported. "
+            (
+                f"{self._simplification_summary} "
+                "The magenta anchor is a preview-only guide."
+            )
+            if self._simplification_summary
+            else "Preview matches the quantized WGS84 geometry that will be exported. "
             "The magenta anchor is a preview-only guide."
         )
         self.retry_button.hide()
@@ -1161,6 +1559,9 @@ class MapPreviewWidget(QWidget):
             "initialisation", "dependency", "oversized", "missing-key",
             "security-policy",
         }
+        # The page may not hold what it was last sent, so the next update
+        # to it carries every trace.
+        self._page_trace_digests = {}
         self._show_error(kind if kind in allowed else "render", message)
 
     def _on_presentation_state_changed(
@@ -1320,7 +1721,7 @@ class MapPreviewWidget(QWidget):
             yaw_deg=self.axis_controls["yaw_deg"].value(),
         )
         traces = list(self._scene.traces)
-        traces[index] = traces[index].with_adjustment(adjustment)
+        traces[index] = traces[index].with_adjustment(adjustment, live_preview=True)
         self._scene = PreviewScene(tuple(traces))
         self.up_warning.setVisible(adjustment.up_m != 0)
         self._schedule_render()
@@ -1356,6 +1757,8 @@ class MapPreviewWidget(QWidget):
             and self._failed_generation != self._page_generation
             and self._csp_failed_generation != self._page_generation
         ):
+            # Sliders preview on the fast frame; commit the exact geometry.
+            self._scene = self._scene.exact()
             self._committed_scene = self._scene
             self.scene_applied.emit(self._scene)
 
@@ -1366,6 +1769,7 @@ class MapPreviewWidget(QWidget):
             and self._failed_generation != self._page_generation
             and self._csp_failed_generation != self._page_generation
         ):
+            self._scene = self._scene.exact()
             self._committed_scene = self._scene
             self.scene_export_requested.emit(self._scene)
 
@@ -1,5 +1,4 @@
 import os
-import hashlib
 from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
@@ -21,8 +20,9 @@ from icon_utils import AppIcon, set_button_icon
 from resource_paths import app_data_path, resource_path
 from services import (
     CoordinateInputError, DebrisSimulationRequest, DebrisSimulationResult,
-    KmlLineString, PreparedTrace, PreviewScene, PresetType,
-    SimulationProgress, TraceAdjustment, export_kml, parse_kml_track,
+    FileFingerprint, KmlLineString, PreparedTrace, PreviewScene, PresetType,
+    SimulationProgress, TraceAdjustment, cached_parse_kml_track, export_kml,
+    file_fingerprint,
 )
 from workers import CancellationToken, DebrisSimulationWorker, SimulationFailure
 from pages.coordinate_input import CoordinatePairInput
@@ -81,7 +81,7 @@ class DebrisKmlState:
     path: str = ""
     coordinates: tuple[float, float, float, float] | None = None
     final_altitude_m: float | None = None
-    fingerprint: tuple[int, int, str] | None = None
+    fingerprint: FileFingerprint | None = None
     error: str | None = None
 
     @property
@@ -381,7 +381,7 @@ class DebrisPage(PresetUiMixin, QWidget):
 
         try:
             fingerprint_before = self._kml_file_fingerprint(selected_path)
-            track = parse_kml_track(selected_path)
+            track = cached_parse_kml_track(selected_path)
             fingerprint_after = self._kml_file_fingerprint(selected_path)
             if fingerprint_before is None or fingerprint_after != fingerprint_before:
                 raise ValueError(
@@ -424,17 +424,11 @@ class DebrisPage(PresetUiMixin, QWidget):
         return True
 
     @staticmethod
-    def _kml_file_fingerprint(path) -> tuple[int, int, str] | None:
-        source = os.fspath(path)
+    def _kml_file_fingerprint(path) -> FileFingerprint | None:
         try:
-            stat = os.stat(source)
-            digest = hashlib.sha256()
-            with open(source, "rb") as handle:
-                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                    digest.update(chunk)
+            return file_fingerprint(path)
         except OSError:
             return None
-        return stat.st_size, stat.st_mtime_ns, digest.hexdigest()
 
     def _ensure_selected_kml_fresh(self) -> bool:
         if self.flight_mode != "kml" or not self.kml_input_path:
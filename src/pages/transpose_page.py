@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass, replace
+from enum import Enum
+from functools import partial
 import math
 import os
-import hashlib
 from pathlib import Path
 from uuid import UUID
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QThread, Qt, pyqtSignal
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -23,6 +24,7 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QSplitter,
     QStyle,
@@ -52,6 +54,7 @@ from services import (
     AirfieldPresetData,
     AirfieldPresetError,
     CoordinateInputError,
+    PreparationCache,
     PresetImportExportService,
     PresetRecord,
     PresetRepository,
@@ -60,15 +63,29 @@ from services import (
     PreparedTranspositionFile,
     RunwayInferenceResult,
     RunwayReference,
+    TranspositionPhase,
+    TranspositionProgress,
     apply_source_runways,
+    cached_parse_kml_track,
     create_transposition_plan,
+    create_transposition_plans,
     customize_transposition_plan,
     export_prepared_transposition,
+    export_prepared_transpositions,
+    file_fingerprint,
     infer_departure_runway,
     normalise_runway_designator,
     parse_coordinate_pair,
-    parse_kml_track,
+    prefetch_file_fingerprints,
     prepare_transposition,
+    prepare_transposition_targets,
+)
+from workers import (
+    CancellationToken,
+    RunwayAnalysis,
+    RunwayInferenceQueue,
+    SimulationFailure,
+    TranspositionWorker,
 )
 
 
@@ -104,6 +121,15 @@ TransposePage QLabel#statusBadge {
 """
 
 
+ANALYSING_PROVENANCE = "Analysing…"
+
+
+class TranspositionUiState(str, Enum):
+    IDLE = "idle"
+    RUNNING = "running"
+    CANCELLING = "cancelling"
+
+
 @dataclass(slots=True)
 class SourceAirfieldState:
     path: Path
@@ -213,6 +239,77 @@ class TranspositionInputDialog(QDialog):
         self.accept()
 
 
+class TranspositionTargetsDialog(QDialog):
+    """Choose the airfield presets one transposition is fanned out to."""
+
+    def __init__(self, presets, parent=None):
+        super().__init__(parent)
+        self.selected_ids: tuple[str, ...] = ()
+        self.setWindowTitle("Choose Target Airfields")
+        self.resize(560, min(520, 180 + len(presets) * 32))
+
+        layout = QVBoxLayout(self)
+        instruction = QLabel(
+            "Choose the airfield presets to transpose the selected files to. "
+            "Each airfield receives its own set of output files."
+        )
+        instruction.setWordWrap(True)
+        layout.addWidget(instruction)
+
+        self.airfield_list = QListWidget()
+        self.airfield_list.setAccessibleName("Target airfields")
+        for record in sorted(presets, key=lambda item: item.preset.name.casefold()):
+            item = QListWidgetItem(record.preset.name)
+            item.setData(Qt.ItemDataRole.UserRole, str(record.preset.id))
+            item.setFlags(
+                Qt.ItemFlag.ItemIsEnabled
+                | Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsUserCheckable
+            )
+            item.setCheckState(Qt.CheckState.Unchecked)
+            self.airfield_list.addItem(item)
+        self.airfield_list.itemChanged.connect(self._selection_changed)
+        layout.addWidget(self.airfield_list)
+
+        self.error_label = QLabel()
+        self.error_label.setObjectName("errorText")
+        self.error_label.setAccessibleName("Target airfield selection error")
+        layout.addWidget(self.error_label)
+
+        self.buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok
+            | QDialogButtonBox.StandardButton.Cancel
+        )
+        self.continue_button = self.buttons.button(QDialogButtonBox.StandardButton.Ok)
+        self.continue_button.setText("Continue")
+        self.buttons.accepted.connect(self._validate_and_accept)
+        self.buttons.rejected.connect(self.reject)
+        layout.addWidget(self.buttons)
+        self._selection_changed()
+
+    def _checked_ids(self) -> tuple[str, ...]:
+        return tuple(
+            str(item.data(Qt.ItemDataRole.UserRole))
+            for row in range(self.airfield_list.count())
+            if (item := self.airfield_list.item(row)).checkState()
+            == Qt.CheckState.Checked
+        )
+
+    def _selection_changed(self, _item=None) -> None:
+        has_selection = bool(self._checked_ids())
+        self.continue_button.setEnabled(has_selection)
+        if has_selection:
+            self.error_label.clear()
+
+    def _validate_and_accept(self) -> None:
+        selected = self._checked_ids()
+        if not selected:
+            self.error_label.setText("Select at least one target airfield to continue.")
+            return
+        self.selected_ids = selected
+        self.accept()
+
+
 class TranspositionOutputDialog(QDialog):
     """Edit and validate every output filename in a transposition batch."""
 
@@ -366,6 +463,8 @@ class TransposePage(QWidget):
     """Two-column workspace for reviewed runway-to-runway transposition."""
 
     preview_requested = pyqtSignal(object)
+    transposition_busy_changed = pyqtSignal(bool)
+    worker_class = TranspositionWorker
 
     def __init__(self):
         super().__init__()
@@ -377,9 +476,21 @@ class TransposePage(QWidget):
         self._rendering_source = False
         self._prepared_batch = None
         self._prepared_signature = None
+        self._preparation_cache = PreparationCache()
         self._accepted_signature = None
         self._committed_adjustments = {}
         self._last_transposition_selection: tuple[str, ...] | None = None
+        self._transposition_state = TranspositionUiState.IDLE
+        self._transposition_thread = None
+        self._transposition_worker = None
+        self._cancellation_token = None
+        self._terminal_outcome = None
+        self._transposition_handlers = None
+        self._batch_paths: tuple[str, ...] = ()
+        self._suppress_terminal_dialogs = False
+        self.runway_analysis_queue = RunwayInferenceQueue(self._read_source, parent=self)
+        self.runway_analysis_queue.started.connect(self._source_analysis_started)
+        self.runway_analysis_queue.analysed.connect(self._source_analysed)
 
         self.preset_repository = PresetRepository(
             app_data_path("presets/airfield"),
@@ -500,10 +611,36 @@ class TransposePage(QWidget):
         self.preview_btn = QPushButton("View preview")
         set_button_icon(self.preview_btn, AppIcon.MONITOR)
         self.preview_btn.clicked.connect(self.open_preview)
+        self.multi_target_btn = QPushButton("Several airfields…")
+        self.multi_target_btn.setToolTip(
+            "Transpose the chosen files to several airfield presets in one pass"
+        )
+        self.multi_target_btn.clicked.connect(self.run_multi_target_transposition_ui)
         actions.addWidget(self.preview_btn)
+        actions.addWidget(self.multi_target_btn)
         actions.addWidget(self.run_btn)
         self.target_card.layout().addLayout(actions)
 
+        self.transposition_progress_bar = QProgressBar()
+        self.transposition_progress_bar.setRange(0, 100)
+        self.transposition_progress_bar.setValue(0)
+        self.transposition_progress_bar.hide()
+        self.transposition_status_label = QLabel()
+        self.transposition_status_label.setObjectName("mutedText")
+        self.transposition_status_label.setWordWrap(True)
+        self.transposition_status_label.hide()
+        self.cancel_transposition_btn = QPushButton("Cancel")
+        self.cancel_transposition_btn.setObjectName("dangerButton")
+        self.cancel_transposition_btn.clicked.connect(
+            lambda: self.cancel_transposition()
+        )
+        self.cancel_transposition_btn.hide()
+        progress_row = QHBoxLayout()
+        progress_row.addWidget(self.transposition_progress_bar, 1)
+        progress_row.addWidget(self.cancel_transposition_btn)
+        self.target_card.layout().addLayout(progress_row)
+        self.target_card.layout().addWidget(self.transposition_status_label)
+
         # Stable aliases for extensions that used the former target widgets.
         self.airfield_name_input = self.target_card.name_input
         self.coordinate_input = self.target_card.coordinate_input
@@ -667,6 +804,7 @@ class TransposePage(QWidget):
     def add_files_to_list(self, files) -> None:
         existing = {self._path_key(path) for path in self.input_files}
         first_new: QListWidgetItem | None = None
+        added = []
         for raw_path in files:
             path = str(Path(raw_path).resolve(strict=False))
             key = self._path_key(path)
@@ -681,19 +819,32 @@ class TransposePage(QWidget):
             )
             self.file_list.addItem(item)
             self.input_files.append(path)
-            self.source_states[path] = SourceAirfieldState(Path(path))
+            self.source_states[path] = SourceAirfieldState(
+                Path(path),
+                provenance=ANALYSING_PROVENANCE,
+            )
             existing.add(key)
+            added.append(path)
             if first_new is None:
                 first_new = item
+        # Hash new inputs in the background so preview and transpose
+        # staleness checks find their digests already memoized.
+        prefetch_file_fingerprints(added)
+        self.runway_analysis_queue.enqueue(added)
+        for path in added:
+            self._set_file_item_status(path, None)
         self._update_file_count()
         if self.file_list.currentItem() is None and first_new is not None:
             self.file_list.setCurrentItem(first_new)
 
     def remove_selected_files(self) -> None:
+        if self.has_active_transposition():
+            return
         self._commit_current_source()
         items = list(self.file_list.selectedItems())
         for item in items:
             path = str(item.data(Qt.ItemDataRole.UserRole))
+            self.runway_analysis_queue.discard(path)
             self.source_states.pop(path, None)
             self._committed_adjustments.pop(self._path_key(path), None)
             if path in self.input_files:
@@ -735,33 +886,77 @@ class TransposePage(QWidget):
             return
         state = self.source_states.setdefault(
             self._current_source_path,
-            SourceAirfieldState(Path(self._current_source_path)),
+            SourceAirfieldState(
+                Path(self._current_source_path),
+                provenance=ANALYSING_PROVENANCE,
+            ),
         )
         if not state.analysed:
-            self._analyse_source(state)
+            self.runway_analysis_queue.prioritise(self._current_source_path)
         self._render_source_state(state)
 
+    @staticmethod
+    def _read_source(path: str) -> RunwayAnalysis:
+        """Parse one input and infer its runway; runs on an analysis worker."""
+
+        track = cached_parse_kml_track(path)
+        return RunwayAnalysis(
+            path,
+            altitude_mode=track.altitude_mode,
+            inference=infer_departure_runway(track),
+        )
+
+    def _source_analysis_started(self, path: str) -> None:
+        self._set_file_item_status(path, None)
+
+    def _source_analysed(self, analysis: RunwayAnalysis) -> None:
+        state = self.source_states.get(analysis.path)
+        if state is None or state.analysed:
+            return
+        self._apply_source_analysis(state, analysis)
+        self._set_file_item_status(analysis.path, None)
+        if analysis.path == self._current_source_path:
+            self._render_source_state(state)
+
     def _analyse_source(self, state: SourceAirfieldState) -> None:
-        state.analysed = True
-        state.parse_error = None
+        """Analyse a source now, for runs started before its result arrived."""
+
+        path = str(state.path)
+        self.runway_analysis_queue.discard(path)
         try:
-            track = parse_kml_track(state.path)
-            state.altitude_mode = track.altitude_mode
-            inference = infer_departure_runway(track)
-            state.inference = inference
+            analysis = self._read_source(path)
         except Exception as error:
-            state.parse_error = str(error)
+            analysis = RunwayAnalysis(path, error=str(error))
+        self._apply_source_analysis(state, analysis)
+        self._set_file_item_status(path, None)
+
+    def _apply_source_analysis(
+        self,
+        state: SourceAirfieldState,
+        analysis: RunwayAnalysis,
+    ) -> None:
+        state.analysed = True
+        state.parse_error = None
+        state.altitude_mode = analysis.altitude_mode
+        state.inference = analysis.inference
+        # Edits or presets applied while the file was queued win over the
+        # inferred values, which remain available through "restore".
+        keep_values = state.provenance not in (ANALYSING_PROVENANCE, "Needs input")
+        if analysis.error is not None:
+            state.parse_error = analysis.error
             state.transposition_error = None
             state.transposition_error_correctable = False
             state.provenance = "File error"
-            state.details = str(error)
+            state.details = analysis.error
             self._sync_file_item_error(str(state.path))
             return
 
+        inference = analysis.inference
         candidate = inference.candidate
         warnings = list(inference.warnings)
         if candidate is None:
-            state.provenance = "Needs input"
+            if not keep_values:
+                state.provenance = "Needs input"
             state.details = "\n".join(
                 filter(None, (inference.error or "", *warnings))
             )
@@ -778,8 +973,9 @@ class TransposePage(QWidget):
             elevation_m=format_optional_number(reference.elevation_m, 2),
         )
         state.auto_values = auto_values
-        state.values = auto_values
-        state.provenance = "Auto-detected"
+        if not keep_values:
+            state.values = auto_values
+            state.provenance = "Auto-detected"
         evidence = ["Evidence:", *candidate.evidence]
         combined_warnings = list(dict.fromkeys((*warnings, *candidate.warnings)))
         if combined_warnings:
@@ -1051,7 +1247,7 @@ class TransposePage(QWidget):
         self.target_card.set_error("")
         return reference
 
-    def _nonstandard_runways(self, paths=None):
+    def _nonstandard_runways(self, paths=None, *, include_target: bool = True):
         entries: list[tuple[str, str, QWidget, str | None]] = []
         requested_paths = tuple(paths) if paths is not None else tuple(self.input_files)
         for raw_path in requested_paths:
@@ -1080,7 +1276,7 @@ class TransposePage(QWidget):
                     )
                 )
         target = normalise_runway_designator(self.target_card.runway_input.text())
-        if target.value and not target.conventional:
+        if include_target and target.value and not target.conventional:
             entries.append(
                 (
                     "Target airfield",
@@ -1096,8 +1292,9 @@ class TransposePage(QWidget):
         paths=None,
         *,
         action: str = "transpose these files",
+        include_target: bool = True,
     ) -> bool:
-        entries = self._nonstandard_runways(paths)
+        entries = self._nonstandard_runways(paths, include_target=include_target)
         if confirm_nonstandard_runways(
             self,
             tuple((context, value, widget) for context, value, widget, _ in entries),
@@ -1170,16 +1367,10 @@ class TransposePage(QWidget):
     def _source_fingerprint(path: str | Path):
         """Return a content-backed identity for stale-scene and offset checks."""
 
-        source = Path(path)
         try:
-            stat = source.stat()
-            digest = hashlib.sha256()
-            with source.open("rb") as handle:
-                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                    digest.update(chunk)
+            return file_fingerprint(path)
         except OSError:
             return None
-        return stat.st_size, stat.st_mtime_ns, digest.hexdigest()
 
     def _apply_committed_adjustments(self, batch):
         items = []
@@ -1200,29 +1391,215 @@ class TransposePage(QWidget):
             items.append(item)
         return replace(batch, items=tuple(items))
 
-    def _prepare_current_batch(
-        self,
-        input_files,
-        target_runway,
-        reviewed_runways,
-        signature,
-    ):
-        if (
+    def _prepared_batch_is_current(self, signature) -> bool:
+        return (
             self._prepared_batch is not None
             and self._accepted_signature == signature
             and self._prepared_signature == signature
-        ):
-            return self._prepared_batch
-        batch = prepare_transposition(
-            input_files=input_files,
-            source_runways=reviewed_runways,
-            target_runway=target_runway,
         )
+
+    def _store_prepared_batch(self, batch, signature):
         batch = self._apply_committed_adjustments(batch)
         self._prepared_batch = batch
         self._prepared_signature = signature
         return batch
 
+    def has_active_transposition(self) -> bool:
+        return self._transposition_state is not TranspositionUiState.IDLE
+
+    def _start_transposition(
+        self,
+        task,
+        input_files,
+        *,
+        on_success,
+        on_failure,
+        description: str,
+    ) -> bool:
+        """Run a preparation or export task on a worker thread.
+
+        Exactly one of ``on_success`` (with the task's result) or
+        ``on_failure`` (with a :class:`SimulationFailure`) is called on the
+        GUI thread once the thread has finished, unless the batch was
+        cancelled.
+        """
+        if self.has_active_transposition():
+            return False
+
+        token = CancellationToken()
+        thread = QThread(self)
+        worker = self.worker_class(task, token)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.progress.connect(
+            self._on_transposition_progress,
+            Qt.ConnectionType.QueuedConnection,
+        )
+        worker.succeeded.connect(
+            self._on_transposition_succeeded,
+            Qt.ConnectionType.QueuedConnection,
+        )
+        worker.cancelled.connect(
+            self._on_transposition_cancelled,
+            Qt.ConnectionType.QueuedConnection,
+        )
+        worker.failed.connect(
+            self._on_transposition_failed,
+            Qt.ConnectionType.QueuedConnection,
+        )
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(self._on_transposition_thread_finished)
+        thread.finished.connect(thread.deleteLater)
+
+        self._transposition_thread = thread
+        self._transposition_worker = worker
+        self._cancellation_token = token
+        self._terminal_outcome = None
+        self._suppress_terminal_dialogs = False
+        self._transposition_handlers = (on_success, on_failure)
+        self._batch_paths = tuple(
+            str(Path(path).resolve(strict=False)) for path in input_files
+        )
+        for path in self._batch_paths:
+            self._set_file_item_status(path, "Queued")
+        self._set_transposition_state(TranspositionUiState.RUNNING, description)
+        thread.start()
+        return True
+
+    def cancel_transposition(self, *, silent: bool = False) -> bool:
+        if not self.has_active_transposition():
+            return False
+        if silent:
+            self._suppress_terminal_dialogs = True
+        if self._transposition_state is TranspositionUiState.RUNNING:
+            self._set_transposition_state(TranspositionUiState.CANCELLING)
+            self._cancellation_token.cancel()
+        return True
+
+    def _set_transposition_state(
+        self,
+        state: TranspositionUiState,
+        message: str = "",
+    ) -> None:
+        previous_busy = self.has_active_transposition()
+        self._transposition_state = state
+        busy = self.has_active_transposition()
+
+        self.run_btn.setEnabled(not busy)
+        self.multi_target_btn.setEnabled(not busy)
+        self.preview_btn.setEnabled(not busy)
+        self.remove_files_btn.setEnabled(not busy)
+        self.cancel_transposition_btn.setVisible(busy)
+        self.cancel_transposition_btn.setEnabled(
+            state is TranspositionUiState.RUNNING
+        )
+        self.transposition_progress_bar.setVisible(busy)
+        self.transposition_status_label.setVisible(busy)
+        if state is TranspositionUiState.RUNNING:
+            self.transposition_progress_bar.setValue(0)
+            self.transposition_status_label.setText(message)
+        elif state is TranspositionUiState.CANCELLING:
+            self.transposition_status_label.setText("Cancelling after the current file…")
+        if previous_busy != busy:
+            self.transposition_busy_changed.emit(busy)
+
+    def _set_file_item_status(self, path: str | Path, status: str | None) -> None:
+        """Badge a list item; ``None`` falls back to its analysis status."""
+
+        item = self._file_item_for_path(path)
+        if item is None:
+            return
+        item_path = str(item.data(Qt.ItemDataRole.UserRole))
+        if status is None:
+            state = self.source_states.get(item_path)
+            if state is not None and not state.analysed:
+                status = (
+                    "Analysing…"
+                    if self.runway_analysis_queue.is_running(item_path)
+                    else "Queued"
+                )
+        name = Path(item_path).name
+        item.setText(f"{name} — {status}" if status else name)
+
+    def _on_transposition_progress(self, progress) -> None:
+        if not isinstance(progress, TranspositionProgress):
+            return
+        percentage = int(progress.completed * 100 / max(progress.total, 1))
+        self.transposition_progress_bar.setValue(percentage)
+        if progress.input_path is not None:
+            self._set_file_item_status(
+                progress.input_path,
+                "Prepared"
+                if progress.phase is TranspositionPhase.PREPARING
+                else "Written",
+            )
+        if self._transposition_state is TranspositionUiState.RUNNING:
+            self.transposition_status_label.setText(progress.message)
+
+    def _record_terminal_outcome(self, kind, payload=None) -> None:
+        if self._terminal_outcome is None:
+            self._terminal_outcome = (kind, payload)
+
+    def _on_transposition_succeeded(self, result) -> None:
+        self._record_terminal_outcome("success", result)
+
+    def _on_transposition_cancelled(self, partial_result) -> None:
+        self._record_terminal_outcome("cancelled", partial_result)
+
+    def _on_transposition_failed(self, failure) -> None:
+        self._record_terminal_outcome("failure", failure)
+
+    def _on_transposition_thread_finished(self) -> None:
+        outcome = self._terminal_outcome
+        if outcome is None:
+            outcome = (
+                "failure",
+                SimulationFailure(
+                    exception_type="WorkerTerminalError",
+                    message="The transposition thread ended without a terminal result.",
+                    traceback="",
+                ),
+            )
+        handlers = self._transposition_handlers
+        suppressed = self._suppress_terminal_dialogs
+        # A cancelled result holds only finished files, so count the batch.
+        batch_count = len(self._batch_paths)
+        for path in self._batch_paths:
+            self._set_file_item_status(path, None)
+
+        self._transposition_thread = None
+        self._transposition_worker = None
+        self._cancellation_token = None
+        self._terminal_outcome = None
+        self._transposition_handlers = None
+        self._batch_paths = ()
+        self._set_transposition_state(TranspositionUiState.IDLE)
+
+        if suppressed or handlers is None:
+            return
+        on_success, on_failure = handlers
+        kind, payload = outcome
+        if kind == "success":
+            on_success(payload)
+        elif kind == "failure":
+            on_failure(payload)
+        elif payload is not None and payload.successful:
+            saved = "\n".join(str(output.output_path) for output in payload.successful)
+            QMessageBox.information(
+                self,
+                "Transposition cancelled",
+                f"Saved {payload.success_count} of {batch_count} KML "
+                f"file(s) before cancelling:\n{saved}",
+            )
+        elif payload is not None:
+            QMessageBox.information(
+                self,
+                "Transposition cancelled",
+                f"Saved none of the {batch_count} KML file(s) before cancelling.",
+            )
+
     def _record_preparation_failures(self, batch):
         failures = []
         for item in batch.failed_items:
@@ -1266,6 +1643,8 @@ class TransposePage(QWidget):
         )
 
     def open_preview(self) -> None:
+        if self.has_active_transposition():
+            return
         current_path = self._current_source_path
         if current_path is None:
             QMessageBox.warning(
@@ -1284,20 +1663,26 @@ class TransposePage(QWidget):
             target_runway,
             reviewed_runways,
         )
-        try:
-            batch = prepare_transposition(
+        self._start_transposition(
+            partial(
+                prepare_transposition,
                 input_files=input_files,
                 source_runways=reviewed_runways,
                 target_runway=target_runway,
-            )
-            batch = self._apply_committed_adjustments(batch)
-        except Exception as error:
-            QMessageBox.critical(
+                cache=self._preparation_cache,
+            ),
+            input_files,
+            on_success=partial(self._preview_prepared, input_files, signature),
+            on_failure=lambda failure: QMessageBox.critical(
                 self,
                 "Preview preparation failed",
-                str(error) or "The transposition preview could not be prepared.",
-            )
-            return
+                failure.message or "The transposition preview could not be prepared.",
+            ),
+            description="Preparing preview…",
+        )
+
+    def _preview_prepared(self, input_files, signature, batch) -> None:
+        batch = self._apply_committed_adjustments(batch)
         failures = self._record_preparation_failures(batch)
         if failures:
             self._show_source_failures(
@@ -1341,7 +1726,7 @@ class TransposePage(QWidget):
         self._accepted_signature = self._prepared_signature
 
     def export_committed_scene(self) -> None:
-        if self._prepared_batch is None:
+        if self._prepared_batch is None or self.has_active_transposition():
             return
         input_files = tuple(
             str(item.input_path.resolve(strict=False))
@@ -1351,12 +1736,16 @@ class TransposePage(QWidget):
             self._run_transposition_for_paths(input_files)
 
     def run_transposition_ui(self) -> None:
+        if self.has_active_transposition():
+            return
         input_files = self._choose_transposition_inputs()
         if input_files is None:
             return
         self._run_transposition_for_paths(input_files)
 
     def _run_transposition_for_paths(self, input_files) -> None:
+        if self.has_active_transposition():
+            return
         validated = self._validated_inputs_for_paths(input_files)
         if validated is None:
             return
@@ -1366,21 +1755,42 @@ class TransposePage(QWidget):
             target_runway,
             reviewed_runways,
         )
-        try:
-            prepared_batch = self._prepare_current_batch(
+        if self._prepared_batch_is_current(signature):
+            self._transpose_prepared_batch(
                 input_files,
-                target_runway,
                 reviewed_runways,
-                signature,
+                self._prepared_batch,
             )
-        except Exception as error:
-            QMessageBox.critical(
+            return
+
+        def prepared(batch):
+            batch = self._store_prepared_batch(batch, signature)
+            self._transpose_prepared_batch(input_files, reviewed_runways, batch)
+
+        self._start_transposition(
+            partial(
+                prepare_transposition,
+                input_files=input_files,
+                source_runways=reviewed_runways,
+                target_runway=target_runway,
+                cache=self._preparation_cache,
+            ),
+            input_files,
+            on_success=prepared,
+            on_failure=lambda failure: QMessageBox.critical(
                 self,
                 "Error",
-                f"Could not prepare transposition: {error}",
-            )
-            return
+                f"Could not prepare transposition: {failure.message}",
+            ),
+            description="Preparing transposition…",
+        )
 
+    def _transpose_prepared_batch(
+        self,
+        input_files,
+        reviewed_runways,
+        prepared_batch,
+    ) -> None:
         failures = self._record_preparation_failures(prepared_batch)
         if failures:
             self._show_source_failures(
@@ -1429,12 +1839,19 @@ class TransposePage(QWidget):
         if plan is None:
             return
 
-        try:
-            result = export_prepared_transposition(prepared_batch, plan)
-        except Exception as error:
-            QMessageBox.critical(self, "Error", f"Transposition failed: {error}")
-            return
+        self._start_transposition(
+            partial(export_prepared_transposition, prepared_batch, plan),
+            [item.input_path for item in prepared_batch.prepared],
+            on_success=partial(self._show_transposition_result, output_dir),
+            on_failure=lambda failure: QMessageBox.critical(
+                self,
+                "Error",
+                f"Transposition failed: {failure.message}",
+            ),
+            description="Writing KML files…",
+        )
 
+    def _show_transposition_result(self, output_dir, result) -> None:
         processing_warnings = "\n".join(
             f"{outcome.input_path.name}:\n"
             + "\n".join(f"- {warning}" for warning in outcome.warnings)
@@ -1487,6 +1904,164 @@ class TransposePage(QWidget):
             f"Failed inputs:\n{failed_paths}{warning_section}",
         )
 
+    def _choose_transposition_targets(self) -> tuple[tuple[str, RunwayReference], ...] | None:
+        """Return ``(airfield name, runway)`` pairs for the chosen presets."""
+
+        if not self.presets:
+            QMessageBox.warning(
+                self,
+                "No airfield presets",
+                "Save the target airfields as presets to transpose to several at once.",
+            )
+            return None
+        dialog = TranspositionTargetsDialog(tuple(self.presets.values()), self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return None
+        targets = []
+        problems = []
+        for preset_id in dialog.selected_ids:
+            record = self.presets[UUID(preset_id)]
+            try:
+                payload, _warnings = AirfieldPresetData.from_mapping(record.preset.data)
+                values = self._values_from_preset(payload)
+                runway = self._reference_from_values(
+                    values,
+                    label=record.preset.name,
+                    elevation_required=False,
+                )
+            except (AirfieldPresetError, ValueError) as error:
+                problems.append(f"• {record.preset.name}: {error}")
+                continue
+            targets.append((payload.airfield_name.strip() or record.preset.name, runway))
+        if problems:
+            QMessageBox.warning(
+                self,
+                "Target airfields need attention",
+                "These presets cannot be used as transposition targets:\n\n"
+                + "\n".join(problems),
+            )
+            return None
+        return tuple(targets)
+
+    def run_multi_target_transposition_ui(self) -> None:
+        """Transpose the chosen files to several airfield presets in one pass."""
+
+        if self.has_active_transposition():
+            return
+        input_files = self._choose_transposition_inputs()
+        if input_files is None:
+            return
+        targets = self._choose_transposition_targets()
+        if targets is None:
+            return
+        reviewed_runways = self._review_source_runways(paths=input_files)
+        self._start_transposition(
+            partial(
+                prepare_transposition_targets,
+                tuple(runway for _, runway in targets),
+                input_files=input_files,
+                source_runways=reviewed_runways,
+            ),
+            input_files,
+            on_success=partial(
+                self._transpose_to_targets, input_files, reviewed_runways, targets
+            ),
+            on_failure=lambda failure: QMessageBox.critical(
+                self,
+                "Error",
+                f"Could not prepare transposition: {failure.message}",
+            ),
+            description=f"Preparing transposition for {len(targets)} airfields…",
+        )
+
+    def _transpose_to_targets(self, input_files, reviewed_runways, targets, batches) -> None:
+        # Parse and source-runway failures are shared by every target, so the
+        # first batch with a failure describes what needs attention.
+        failing = next((batch for batch in batches if batch.failed_items), batches[0])
+        failures = self._record_preparation_failures(failing)
+        if failures:
+            self._show_source_failures(
+                failures,
+                title="Selected files need attention",
+                introduction=(
+                    "No files were transposed because the following selected "
+                    "inputs need attention:"
+                ),
+            )
+            return
+        if not self._confirm_runway_overrides(input_files, include_target=False):
+            return
+
+        output_dir = QFileDialog.getExistingDirectory(
+            self,
+            "Select Output Folder",
+            self._initial_output_directory(),
+        )
+        if not output_dir:
+            return
+        remember_directory(
+            FileDialogWorkflow.TRANSPOSITION,
+            FileDialogDirection.OUTPUT,
+            output_dir,
+        )
+        try:
+            plans = tuple(
+                apply_source_runways(plan, reviewed_runways)
+                for plan in create_transposition_plans(
+                    input_files,
+                    output_dir,
+                    tuple(name for name, _ in targets),
+                )
+            )
+        except Exception as error:
+            QMessageBox.critical(self, "Error", f"Could not plan outputs: {error}")
+            return
+
+        self._start_transposition(
+            partial(export_prepared_transpositions, tuple(zip(batches, plans))),
+            input_files,
+            on_success=partial(self._show_multi_target_result, output_dir, targets),
+            on_failure=lambda failure: QMessageBox.critical(
+                self,
+                "Error",
+                f"Transposition failed: {failure.message}",
+            ),
+            description=f"Writing KML files for {len(targets)} airfields…",
+        )
+
+    def _show_multi_target_result(self, output_dir, targets, results) -> None:
+        saved = sum(result.success_count for result in results)
+        total = sum(result.total_count for result in results)
+        summary = "\n".join(
+            f"• {name}: {result.success_count} of {result.total_count} saved"
+            for (name, _), result in zip(targets, results)
+        )
+        failed_paths = "\n".join(
+            f"{name} — {outcome.input_path.name}: {outcome.error.message}"
+            for (name, _), result in zip(targets, results)
+            for outcome in result.failed_outcomes
+        )
+        if saved == total:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"Transposition complete!\nSaved {saved} KML file(s) to:\n"
+                f"{output_dir}\n\n{summary}",
+            )
+        elif saved == 0:
+            QMessageBox.critical(
+                self,
+                "Transposition failed",
+                f"No KML files were produced.\n\nFailed inputs:\n{failed_paths}",
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Transposition partially complete",
+                f"Saved {saved} of {total} KML file(s) to:\n{output_dir}\n\n"
+                f"{summary}\n\nFailed inputs:\n{failed_paths}",
+            )
+
     def capture_preset_data(self) -> dict[str, object]:
         """Return canonical target data; target elevation is intentionally absent."""
         values = self.target_card.values()
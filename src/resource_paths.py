@@ -21,6 +21,16 @@ def app_data_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def app_cache_path(relative_path):
+    """Return a writable, per-user path for disposable cached data."""
+    base_path = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.CacheLocation
+    )
+    if not base_path:
+        raise OSError("No writable application cache location is available")
+    return os.path.join(base_path, relative_path)
+
+
 def _select_icon_name():
     if sys.platform == "darwin":
         return "app.icns"
@@ -14,6 +14,15 @@ from .coordinate_input import (
     format_coordinate_value,
     parse_coordinate_pair,
 )
+from .debris_ensemble import (
+    DebrisEnsembleRequest,
+    DebrisEnsembleResult,
+    DebrisFootprint,
+    EnsembleDistanceStatistics,
+    UniformRange,
+    run_debris_ensemble_request,
+)
+from .debris_trajectory_buffer import TrajectoryBuffer, TrajectoryPhase
 from .debris_trajectory_calculator import (
     DebrisSimulationRequest,
     DebrisSimulationResult,
@@ -21,13 +30,34 @@ from .debris_trajectory_calculator import (
     SimulationCancelled,
     SimulationPhase,
     SimulationProgress,
+    TrajectoryIntegrator,
     run_debris_simulation_request,
 )
+from .file_fingerprints import (
+    FileFingerprint,
+    FileFingerprintCacheInfo,
+    FileFingerprintService,
+    clear_file_fingerprint_cache,
+    file_fingerprint,
+    file_fingerprint_cache_info,
+    prefetch_file_fingerprints,
+    shutdown_file_fingerprints,
+)
 from .geodesy import (
+    EnuBlock,
     EnuCoordinate,
+    EnuFrameCacheInfo,
+    EnuTransposition,
+    FastLocalEnuFrame,
     LocalEnuFrame,
+    cached_enu_transposition,
+    cached_local_enu_frame,
+    clear_enu_frame_cache,
     destination_point,
+    destination_point_array,
+    enu_frame_cache_info,
     inverse_distance_bearing,
+    inverse_distance_bearing_array,
     transpose_wgs84_enu_points,
 )
 from .kml_file_handling import (
@@ -36,11 +66,22 @@ from .kml_file_handling import (
     KmlPoint,
     KmlStructureError,
     KmlTrack,
+    KmlTrackPoints,
     KmlXmlError,
     load_last_two_points_from_kml,
     parse_kml,
     parse_kml_track,
 )
+from .kml_track_cache import (
+    ParsedTrackCache,
+    ParsedTrackCacheInfo,
+    ParsedTrackKey,
+    cached_parse_kml_track,
+    clear_parsed_track_cache,
+    configure_parsed_track_cache,
+    parsed_track_cache_info,
+    parsed_track_key,
+)
 from .kml_export import (
     ATR_MAGENTA_TRACK_STYLE,
     KmlCoordinate,
@@ -51,15 +92,20 @@ from .kml_export import (
     KmlStyle,
     export_kml,
     render_kml,
+    validate_kml_document,
 )
 from .map_preview import (
+    PREVIEW_PAYLOAD_VERSIONS,
+    PREVIEW_VERTEX_BUDGET,
     PreparedTrace,
     PreviewScene,
     TraceAdjustment,
     apply_enu_adjustment,
     kml_colour_to_css,
     preview_payload,
+    preview_tolerance,
     quantize_kml_document,
+    trace_payload,
 )
 from .runway_alignment import (
     RunwayCandidate,
@@ -96,22 +142,30 @@ from .preset_store import (
     PresetStore,
 )
 from .transpose_coordinates import (
+    PreparationCache,
+    PreparationKey,
     PreparedTranspositionBatch,
     PreparedTranspositionFailure,
     PreparedTranspositionFile,
     TranspositionBatchResult,
+    TranspositionCancelled,
     TranspositionError,
     TranspositionErrorCode,
     TranspositionFileOutcome,
     TranspositionFileStatus,
     TranspositionJob,
     TranspositionOutput,
+    TranspositionPhase,
     TranspositionPlan,
+    TranspositionProgress,
     apply_source_runways,
     create_transposition_plan,
+    create_transposition_plans,
     customize_transposition_plan,
     export_prepared_transposition,
+    export_prepared_transpositions,
     prepare_transposition,
+    prepare_transposition_targets,
     run_transposition,
 )
 
@@ -122,11 +176,22 @@ __all__ = [
     "ATR_MAGENTA_TRACK_STYLE",
     "CoordinateInputError",
     "CoordinatePair",
+    "DebrisEnsembleRequest",
+    "DebrisEnsembleResult",
+    "DebrisFootprint",
     "DebrisSimulationRequest",
     "DebrisSimulationResult",
     "DebrisTrajectoryCalculator",
+    "EnsembleDistanceStatistics",
+    "EnuBlock",
     "EnuCoordinate",
+    "EnuFrameCacheInfo",
+    "EnuTransposition",
+    "FastLocalEnuFrame",
     "ImportInspection",
+    "FileFingerprint",
+    "FileFingerprintCacheInfo",
+    "FileFingerprintService",
     "KmlCoordinateError",
     "KmlCoordinate",
     "KmlDocument",
@@ -138,8 +203,11 @@ __all__ = [
     "KmlStyle",
     "KmlStructureError",
     "KmlTrack",
+    "KmlTrackPoints",
     "KmlXmlError",
     "LocalEnuFrame",
+    "PREVIEW_PAYLOAD_VERSIONS",
+    "PREVIEW_VERTEX_BUDGET",
     "Preset",
     "PresetAlreadyExistsError",
     "PresetDestinationExistsError",
@@ -162,6 +230,11 @@ __all__ = [
     "RunwayDesignator",
     "RunwayInferenceResult",
     "RunwayReference",
+    "ParsedTrackCache",
+    "ParsedTrackCacheInfo",
+    "ParsedTrackKey",
+    "PreparationCache",
+    "PreparationKey",
     "PreparedTrace",
     "PreparedTranspositionBatch",
     "PreparedTranspositionFailure",
@@ -170,43 +243,73 @@ __all__ = [
     "SimulationCancelled",
     "SimulationPhase",
     "SimulationProgress",
+    "TrajectoryBuffer",
+    "TrajectoryIntegrator",
+    "TrajectoryPhase",
     "TranspositionBatchResult",
+    "TranspositionCancelled",
     "TranspositionError",
     "TranspositionErrorCode",
     "TranspositionFileOutcome",
     "TranspositionFileStatus",
     "TranspositionJob",
     "TranspositionOutput",
+    "TranspositionPhase",
     "TranspositionPlan",
+    "TranspositionProgress",
     "TraceAdjustment",
+    "UniformRange",
     "UnsupportedPresetVersionError",
     "UnsafePresetPathError",
     "canonical_filename",
     "canonical_stem",
     "apply_source_runways",
     "apply_enu_adjustment",
+    "cached_enu_transposition",
+    "cached_local_enu_frame",
+    "cached_parse_kml_track",
+    "clear_enu_frame_cache",
+    "clear_file_fingerprint_cache",
+    "clear_parsed_track_cache",
+    "configure_parsed_track_cache",
     "create_transposition_plan",
+    "create_transposition_plans",
     "customize_transposition_plan",
     "destination_point",
+    "destination_point_array",
+    "enu_frame_cache_info",
     "export_kml",
     "export_prepared_transposition",
+    "export_prepared_transpositions",
+    "file_fingerprint",
+    "file_fingerprint_cache_info",
     "format_coordinate_pair",
     "format_coordinate_value",
     "infer_departure_runway",
     "inverse_distance_bearing",
+    "inverse_distance_bearing_array",
     "kml_colour_to_css",
     "load_last_two_points_from_kml",
     "normalise_runway_designator",
     "parse_kml",
     "parse_kml_track",
     "parse_coordinate_pair",
+    "parsed_track_cache_info",
+    "parsed_track_key",
+    "prefetch_file_fingerprints",
     "prepare_transposition",
+    "prepare_transposition_targets",
     "preview_payload",
+    "preview_tolerance",
     "quantize_kml_document",
     "readable_export_filename",
     "render_kml",
+    "run_debris_ensemble_request",
     "run_debris_simulation_request",
     "run_transposition",
+    "shutdown_file_fingerprints",
+    "trace_payload",
     "transpose_geodesic_points",
     "transpose_wgs84_enu_points",
+    "validate_kml_document",
 ]
@@ -0,0 +1,469 @@
+"""Vectorized Monte Carlo ensembles for the debris trajectory model.
+
+Every ensemble member follows exactly the same forward-Euler impact and
+bounce rules, and the same closed-form slide, as
+:meth:`DebrisTrajectoryCalculator.simulate_3d`.  Members are stepped together
+as NumPy arrays and removed from the working set once they start to slide,
+so thousands of fragments cost roughly the same number of Python iterations
+as the slowest single fragment.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Callable
+
+import numpy as np
+
+from .debris_trajectory_calculator import (
+    CANCELLATION_CHECK_INTERVAL,
+    SURFACE_PRESETS,
+    closed_form_slide,
+    DebrisSimulationRequest,
+    SimulationPhase,
+    SimulationProgress,
+    TrajectoryIntegrator,
+    _calculator_from_request,
+    _ProgressReporter,
+    _raise_if_cancelled,
+)
+
+
+DEFAULT_ENSEMBLE_PERCENTILES = (5.0, 50.0, 95.0)
+MAX_ENSEMBLE_MEMBERS = 1_000_000
+_KNOTS_TO_METRES_PER_SECOND = 0.514444444
+_MAX_SIMULATED_TIME_S = 3600.0
+
+
+@dataclass(frozen=True, slots=True)
+class UniformRange:
+    """An inclusive uniform sampling range for one uncertain input."""
+
+    minimum: float
+    maximum: float
+
+    def __post_init__(self) -> None:
+        minimum = float(self.minimum)
+        maximum = float(self.maximum)
+        if not all(math.isfinite(value) for value in (minimum, maximum)):
+            raise ValueError("Ensemble ranges must be finite numbers.")
+        if minimum > maximum:
+            raise ValueError("Ensemble range minimum must not exceed its maximum.")
+        object.__setattr__(self, "minimum", minimum)
+        object.__setattr__(self, "maximum", maximum)
+
+
+@dataclass(frozen=True, slots=True)
+class DebrisEnsembleRequest:
+    """A base debris request plus the inputs sampled for each member.
+
+    Inputs without a range keep the base request value.  ``surfaces`` is
+    sampled uniformly; an empty tuple keeps ``base.surface`` for every member.
+    """
+
+    base: DebrisSimulationRequest
+    member_count: int = 1000
+    seed: int = 0
+    mass_kg: UniformRange | None = None
+    area_m2: UniformRange | None = None
+    Cd: UniformRange | None = None
+    ktas: UniformRange | None = None
+    surfaces: tuple[str, ...] = ()
+    percentiles: tuple[float, ...] = DEFAULT_ENSEMBLE_PERCENTILES
+    footprint_cell_m: float = 5.0
+    max_steps: int = 300000
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.base, DebrisSimulationRequest):
+            raise TypeError("base must be a DebrisSimulationRequest.")
+        if self.base.integrator is not TrajectoryIntegrator.EULER:
+            raise ValueError("Debris ensembles use the forward-Euler integrator.")
+        if not 1 <= int(self.member_count) <= MAX_ENSEMBLE_MEMBERS:
+            raise ValueError(
+                f"Ensemble member count must be between 1 and {MAX_ENSEMBLE_MEMBERS}."
+            )
+        surfaces = tuple(self.surfaces)
+        unknown = [surface for surface in surfaces if surface not in SURFACE_PRESETS]
+        if unknown:
+            raise ValueError(f'Unknown debris surface "{unknown[0]}".')
+        percentiles = tuple(float(value) for value in self.percentiles)
+        if not percentiles or not all(0.0 <= value <= 100.0 for value in percentiles):
+            raise ValueError("Ensemble percentiles must be between 0 and 100.")
+        cell = float(self.footprint_cell_m)
+        if not math.isfinite(cell) or cell <= 0.0:
+            raise ValueError("Footprint cell size must be a positive, finite number.")
+        if int(self.max_steps) < 1:
+            raise ValueError("Ensemble step limit must be at least one.")
+        # Every member draws from the range, or takes the base value.
+        lowest = {
+            name: float(getattr(self.base, name)) if sampled is None else sampled.minimum
+            for name, sampled in (
+                ("mass_kg", self.mass_kg),
+                ("area_m2", self.area_m2),
+                ("Cd", self.Cd),
+                ("ktas", self.ktas),
+            )
+        }
+        if not lowest["mass_kg"] > 0.0:
+            raise ValueError("Ensemble mass must be positive.")
+        for name, label in (
+            ("area_m2", "area"),
+            ("Cd", "drag coefficient"),
+            ("ktas", "airspeed"),
+        ):
+            if not lowest[name] >= 0.0:
+                raise ValueError(f"Ensemble {label} must not be negative.")
+        object.__setattr__(self, "member_count", int(self.member_count))
+        object.__setattr__(self, "seed", int(self.seed))
+        object.__setattr__(self, "surfaces", surfaces)
+        object.__setattr__(self, "percentiles", percentiles)
+        object.__setattr__(self, "footprint_cell_m", cell)
+        object.__setattr__(self, "max_steps", int(self.max_steps))
+
+
+@dataclass(frozen=True, slots=True)
+class EnsembleDistanceStatistics:
+    """Ground-planar distance percentiles, aligned with ``percentiles``."""
+
+    percentiles: tuple[float, ...]
+    air_distance_m: tuple[float, ...]
+    ground_distance_m: tuple[float, ...]
+    total_distance_m: tuple[float, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DebrisFootprint:
+    """Rest-position probabilities on a regular along/cross-track grid.
+
+    ``probabilities[i, j]`` is the fraction of members resting in the cell
+    bounded by ``along_track_edges_m[i:i + 2]`` and
+    ``cross_track_edges_m[j:j + 2]``.  Axes match ``simulate_3d``: along-track
+    follows the heading and cross-track is positive to its right.
+    """
+
+    cell_size_m: float
+    along_track_edges_m: np.ndarray = field(compare=False, repr=False)
+    cross_track_edges_m: np.ndarray = field(compare=False, repr=False)
+    probabilities: np.ndarray = field(compare=False, repr=False)
+
+
+@dataclass(frozen=True, slots=True)
+class DebrisEnsembleResult:
+    """Summary statistics and per-member rest positions for one ensemble."""
+
+    heading: float
+    member_count: int
+    statistics: EnsembleDistanceStatistics
+    footprint: DebrisFootprint
+    impacts: np.ndarray = field(compare=False, repr=False)
+    rest_along_track_m: np.ndarray = field(compare=False, repr=False)
+    rest_cross_track_m: np.ndarray = field(compare=False, repr=False)
+
+
+@dataclass(frozen=True, slots=True)
+class _EnsembleOutcome:
+    x: np.ndarray
+    y: np.ndarray
+    air_distance_m: np.ndarray
+    ground_distance_m: np.ndarray
+    impacts: np.ndarray
+
+
+def _sampled(
+    generator: np.random.Generator,
+    value_range: UniformRange | None,
+    base_value: float,
+    count: int,
+) -> np.ndarray:
+    if value_range is None:
+        return np.full(count, float(base_value))
+    return generator.uniform(value_range.minimum, value_range.maximum, count)
+
+
+def _surface_parameters(
+    generator: np.random.Generator,
+    surfaces: tuple[str, ...],
+    base_surface: str,
+    count: int,
+) -> dict[str, np.ndarray]:
+    names = surfaces or (base_surface,)
+    if names[0] not in SURFACE_PRESETS:
+        raise ValueError(f'Unknown debris surface "{names[0]}".')
+    choices = (
+        generator.integers(0, len(names), count)
+        if len(names) > 1
+        else np.zeros(count, dtype=np.intp)
+    )
+    return {
+        key: np.array([SURFACE_PRESETS[name][key] for name in names])[choices]
+        for key in ("mu_imp", "mu_slide", "e0", "einf", "vc")
+    }
+
+
+def _clamp_eps(values: np.ndarray, eps: float = 1e-12) -> np.ndarray:
+    return np.where(np.abs(values) < eps, 0.0, values)
+
+
+def _simulate_ensemble(
+    *,
+    mass: np.ndarray,
+    area: np.ndarray,
+    Cd: np.ndarray,
+    ktas: np.ndarray,
+    surface: dict[str, np.ndarray],
+    rho: float,
+    g: float,
+    dt: float,
+    alt_m: float,
+    include_ground_drag: bool,
+    vz_bounce_min: float,
+    max_steps: int,
+    reporter: _ProgressReporter,
+    cancellation_check: Callable[[], bool] | None,
+) -> _EnsembleOutcome:
+    count = mass.size
+    rest_x = np.zeros(count)
+    rest_y = np.zeros(count)
+    impact_x = np.zeros(count)
+    impact_y = np.zeros(count)
+    impacted = np.zeros(count, dtype=bool)
+    impacts = np.zeros(count, dtype=np.int64)
+
+    # Working arrays hold only members that are still airborne.
+    live = np.arange(count)
+    K = 0.5 * rho * Cd * area / mass
+    mu_imp = surface["mu_imp"]
+    mu_slide = surface["mu_slide"]
+    e0 = surface["e0"]
+    einf = surface["einf"]
+    vc = np.maximum(1e-6, surface["vc"])
+    x = np.zeros(count)
+    y = np.zeros(count)
+    z = np.full(count, float(alt_m))
+    vx = ktas * _KNOTS_TO_METRES_PER_SECOND
+    vy = np.zeros(count)
+    vz = np.zeros(count)
+    live_impacted = np.zeros(count, dtype=bool)
+    live_impact_x = np.zeros(count)
+    live_impact_y = np.zeros(count)
+    live_impacts = np.zeros(count, dtype=np.int64)
+
+    t = 0.0
+    for step in range(max_steps):
+        if live.size == 0:
+            break
+        if step % CANCELLATION_CHECK_INTERVAL == 0:
+            _raise_if_cancelled(cancellation_check)
+            reporter.report(
+                SimulationPhase.SIMULATING,
+                count - live.size,
+                count,
+                "Simulating debris ensemble…",
+            )
+
+        # Quadratic drag and gravity (vz positive = down).
+        vmag = np.sqrt(vx * vx + vy * vy + vz * vz)
+        vx_air = _clamp_eps(vx + (-K * vmag * vx) * dt)
+        vy_air = _clamp_eps(vy + (-K * vmag * vy) * dt)
+        vz_air = _clamp_eps(vz + (g - K * vmag * vz) * dt)
+        x_air = x + vx_air * dt
+        y_air = y + vy_air * dt
+        z_air = np.maximum(0.0, z - vz_air * dt)
+
+        impact = (z > 0.0) & (z_air <= 0.0)
+        vn_pre = np.abs(vz_air)
+        restitution = np.clip(
+            einf + (e0 - einf) * np.exp(-np.maximum(0.0, vn_pre) / vc),
+            0.0,
+            1.0,
+        )
+        vt_pre = np.sqrt(vx_air * vx_air + vy_air * vy_air)
+        dv_t = mu_imp * (1.0 + restitution) * vn_pre
+        safe_vt_pre = np.where(vt_pre > 0.0, vt_pre, 1.0)
+        scale = np.where(
+            vt_pre > 0.0,
+            np.maximum(0.0, (vt_pre - dv_t) / safe_vt_pre),
+            0.0,
+        )
+        vx_air = np.where(impact, _clamp_eps(vx_air * scale), vx_air)
+        vy_air = np.where(impact, _clamp_eps(vy_air * scale), vy_air)
+        vz_air = np.where(impact, _clamp_eps(-restitution * vz_air), vz_air)
+        z_air = np.where(impact, 0.0, z_air)
+
+        first_impact = impact & ~live_impacted
+        live_impact_x = np.where(first_impact, x_air, live_impact_x)
+        live_impact_y = np.where(first_impact, y_air, live_impact_y)
+        live_impacted |= impact
+        live_impacts += impact
+
+        x, y, z, vx, vy, vz = x_air, y_air, z_air, vx_air, vy_air, vz_air
+
+        # Members whose bounce is negligible slide to rest in closed form.
+        stopped = impact & (np.abs(vz) < vz_bounce_min)
+        if stopped.any():
+            time_limit = max(0.0, _MAX_SIMULATED_TIME_S - (t + dt))
+            for index in np.flatnonzero(stopped):
+                speed = math.hypot(vx[index], vy[index])
+                if speed <= 1e-6:
+                    continue
+                _, distance = closed_form_slide(
+                    speed,
+                    mu_slide[index] * g,
+                    K[index] if include_ground_drag else 0.0,
+                    time_limit,
+                )
+                x[index] += distance * vx[index] / speed
+                y[index] += distance * vy[index] / speed
+
+            done = live[stopped]
+            rest_x[done] = x[stopped]
+            rest_y[done] = y[stopped]
+            impact_x[done] = live_impact_x[stopped]
+            impact_y[done] = live_impact_y[stopped]
+            impacted[done] = live_impacted[stopped]
+            impacts[done] = live_impacts[stopped]
+            keep = ~stopped
+            live = live[keep]
+            K, mu_imp, mu_slide, e0, einf, vc = (
+                K[keep], mu_imp[keep], mu_slide[keep],
+                e0[keep], einf[keep], vc[keep],
+            )
+            x, y, z, vx, vy, vz = (
+                x[keep], y[keep], z[keep], vx[keep], vy[keep], vz[keep],
+            )
+            live_impacted = live_impacted[keep]
+            live_impact_x = live_impact_x[keep]
+            live_impact_y = live_impact_y[keep]
+            live_impacts = live_impacts[keep]
+
+        t += dt
+        if t > _MAX_SIMULATED_TIME_S:  # hard stop (1 hour)
+            break
+
+    # Members still airborne at the step or time limit keep their last state.
+    rest_x[live] = x
+    rest_y[live] = y
+    impact_x[live] = live_impact_x
+    impact_y[live] = live_impact_y
+    impacted[live] = live_impacted
+    impacts[live] = live_impacts
+
+    air_distance = np.where(
+        impacted,
+        np.hypot(impact_x, impact_y),
+        np.hypot(rest_x, rest_y),
+    )
+    ground_distance = np.where(
+        impacted,
+        np.hypot(rest_x - impact_x, rest_y - impact_y),
+        0.0,
+    )
+    return _EnsembleOutcome(
+        x=rest_x,
+        y=rest_y,
+        air_distance_m=air_distance,
+        ground_distance_m=ground_distance,
+        impacts=impacts,
+    )
+
+
+def _footprint(x: np.ndarray, y: np.ndarray, cell_size_m: float) -> DebrisFootprint:
+    def edges(values: np.ndarray) -> np.ndarray:
+        low = math.floor(float(values.min()) / cell_size_m) * cell_size_m
+        high = math.floor(float(values.max()) / cell_size_m) * cell_size_m + cell_size_m
+        cells = max(1, int(round((high - low) / cell_size_m)))
+        return low + cell_size_m * np.arange(cells + 1)
+
+    along_edges = edges(x)
+    cross_edges = edges(y)
+    counts, _, _ = np.histogram2d(x, y, bins=(along_edges, cross_edges))
+    return DebrisFootprint(
+        cell_size_m=cell_size_m,
+        along_track_edges_m=along_edges,
+        cross_track_edges_m=cross_edges,
+        probabilities=counts / x.size,
+    )
+
+
+def run_debris_ensemble_request(
+    request: DebrisEnsembleRequest,
+    *,
+    progress_callback: Callable[[SimulationProgress], None] | None = None,
+    cancellation_check: Callable[[], bool] | None = None,
+) -> DebrisEnsembleResult:
+    """Simulate every ensemble member at once and summarise where they rest."""
+    base = request.base
+    heading = _calculator_from_request(base).az_deg
+    count = request.member_count
+    generator = np.random.default_rng(request.seed)
+    mass = _sampled(generator, request.mass_kg, base.mass_kg, count)
+    area = _sampled(generator, request.area_m2, base.area_m2, count)
+    Cd = _sampled(generator, request.Cd, base.Cd, count)
+    ktas = _sampled(generator, request.ktas, base.ktas, count)
+    surface = _surface_parameters(generator, request.surfaces, base.surface, count)
+
+    reporter = _ProgressReporter(progress_callback)
+    reporter.report(
+        SimulationPhase.SIMULATING,
+        0,
+        count,
+        "Simulating debris ensemble…",
+        force=True,
+    )
+    outcome = _simulate_ensemble(
+        mass=mass,
+        area=area,
+        Cd=Cd,
+        ktas=ktas,
+        surface=surface,
+        rho=float(base.rho),
+        g=float(base.g),
+        dt=float(base.dt),
+        alt_m=float(base.altitude_m) - float(base.terrain_m),
+        include_ground_drag=bool(base.include_ground_drag),
+        vz_bounce_min=float(base.slide_physics),
+        max_steps=request.max_steps,
+        reporter=reporter,
+        cancellation_check=cancellation_check,
+    )
+    _raise_if_cancelled(cancellation_check)
+    reporter.report(
+        SimulationPhase.SIMULATING,
+        count,
+        count,
+        "Debris ensemble complete.",
+        force=True,
+    )
+
+    total_distance = outcome.air_distance_m + outcome.ground_distance_m
+    percentiles = request.percentiles
+
+    def at_percentiles(values: np.ndarray) -> tuple[float, ...]:
+        return tuple(float(value) for value in np.percentile(values, percentiles))
+
+    return DebrisEnsembleResult(
+        heading=float(heading),
+        member_count=count,
+        statistics=EnsembleDistanceStatistics(
+            percentiles=percentiles,
+            air_distance_m=at_percentiles(outcome.air_distance_m),
+            ground_distance_m=at_percentiles(outcome.ground_distance_m),
+            total_distance_m=at_percentiles(total_distance),
+        ),
+        footprint=_footprint(outcome.x, outcome.y, request.footprint_cell_m),
+        impacts=outcome.impacts,
+        rest_along_track_m=outcome.x,
+        rest_cross_track_m=outcome.y,
+    )
+
+
+__all__ = [
+    "DEFAULT_ENSEMBLE_PERCENTILES",
+    "DebrisEnsembleRequest",
+    "DebrisEnsembleResult",
+    "DebrisFootprint",
+    "EnsembleDistanceStatistics",
+    "UniformRange",
+    "run_debris_ensemble_request",
+]
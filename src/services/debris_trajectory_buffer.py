@@ -0,0 +1,158 @@
+"""Growable columnar storage for simulated debris trajectory samples.
+
+Each step of a simulation writes one row of float64 state plus two small
+integer codes. Rows live in a single Fortran-ordered array so every column
+is contiguous and can be handed to NumPy consumers without copying.
+"""
+
+from enum import IntEnum
+
+import numpy as np
+
+
+DEFAULT_TRAJECTORY_CAPACITY = 4096
+NO_EVENT = 0
+
+_STATE_COLUMNS = ("t", "x", "y", "z", "vx", "vy", "vz")
+
+
+class TrajectoryPhase(IntEnum):
+    AIR = 0
+    SLIDE = 1
+
+
+class TrajectoryBuffer:
+    """Append-only trajectory rows with amortised doubling growth.
+
+    The event column stores the impact number of the step, or ``NO_EVENT``.
+    Column properties return read-only views of the committed rows.
+    """
+
+    __slots__ = ("_state", "_phase", "_event", "_size")
+
+    def __init__(self, capacity=DEFAULT_TRAJECTORY_CAPACITY):
+        capacity = int(capacity)
+        if capacity < 1:
+            raise ValueError("Trajectory buffer capacity must be at least one row.")
+        self._state = np.empty((capacity, len(_STATE_COLUMNS)), dtype=np.float64, order="F")
+        self._phase = np.empty(capacity, dtype=np.int8)
+        self._event = np.empty(capacity, dtype=np.int32)
+        self._size = 0
+
+    @classmethod
+    def from_columns(cls, *, x, y, z, phase, t=None, vx=None, vy=None, vz=None, event=None):
+        """Build a buffer from equal-length column sequences."""
+        x = np.asarray(x, dtype=np.float64)
+        row_count = x.size
+        buffer = cls(max(row_count, 1))
+
+        def column(values, dtype):
+            if values is None:
+                return np.zeros(row_count, dtype=dtype)
+            array = np.asarray(values, dtype=dtype)
+            if array.shape != (row_count,):
+                raise ValueError("Trajectory columns must all have the same length.")
+            return array
+
+        for index, values in enumerate((t, x, y, z, vx, vy, vz)):
+            buffer._state[:row_count, index] = column(values, np.float64)
+        buffer._phase[:row_count] = column(phase, np.int8)
+        buffer._event[:row_count] = column(event, np.int32)
+        buffer._size = row_count
+        return buffer
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        return self._state.shape[0]
+
+    def append(self, t, x, y, z, vx, vy, vz, phase, event=NO_EVENT):
+        index = self._size
+        if index == self._state.shape[0]:
+            self._grow()
+        self._state[index] = (t, x, y, z, vx, vy, vz)
+        self._phase[index] = phase
+        self._event[index] = event
+        self._size = index + 1
+
+    def extend(self, t, x, y, z, vx, vy, vz, phase, event=NO_EVENT):
+        """Append equal-length column arrays; scalars broadcast to every row."""
+        t = np.asarray(t, dtype=np.float64)
+        count = t.size
+        start = self._size
+        while start + count > self._state.shape[0]:
+            self._grow()
+        rows = slice(start, start + count)
+        for index, values in enumerate((t, x, y, z, vx, vy, vz)):
+            self._state[rows, index] = values
+        self._phase[rows] = phase
+        self._event[rows] = event
+        self._size = start + count
+
+    def _grow(self):
+        capacity = self._state.shape[0] * 2
+        state = np.empty((capacity, len(_STATE_COLUMNS)), dtype=np.float64, order="F")
+        state[: self._size] = self._state[: self._size]
+        self._state = state
+        self._phase = np.resize(self._phase, capacity)
+        self._event = np.resize(self._event, capacity)
+
+    def _column(self, index):
+        view = self._state[: self._size, index]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def t(self):
+        return self._column(0)
+
+    @property
+    def x(self):
+        return self._column(1)
+
+    @property
+    def y(self):
+        return self._column(2)
+
+    @property
+    def z(self):
+        return self._column(3)
+
+    @property
+    def vx(self):
+        return self._column(4)
+
+    @property
+    def vy(self):
+        return self._column(5)
+
+    @property
+    def vz(self):
+        return self._column(6)
+
+    @property
+    def phase(self):
+        view = self._phase[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def event(self):
+        view = self._event[: self._size]
+        view.flags.writeable = False
+        return view
+
+    def event_label(self, index):
+        """Return the legacy ``impact#N`` label for a row, or ``None``."""
+        code = int(self.event[index])
+        return None if code == NO_EVENT else f"impact#{code}"
+
+
+__all__ = [
+    "DEFAULT_TRAJECTORY_CAPACITY",
+    "NO_EVENT",
+    "TrajectoryBuffer",
+    "TrajectoryPhase",
+]
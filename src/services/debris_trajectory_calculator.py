@@ -4,8 +4,13 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Callable
 
-import pandas as pd
+import numpy as np
 
+from .debris_trajectory_buffer import (
+    DEFAULT_TRAJECTORY_CAPACITY,
+    TrajectoryBuffer,
+    TrajectoryPhase,
+)
 from .kml_export import (
     KmlCoordinate,
     KmlDocument,
@@ -15,11 +20,18 @@ from .kml_export import (
     KmlStyle,
     export_kml,
 )
-from .geodesy import EnuCoordinate, LocalEnuFrame
+from .geodesy import cached_local_enu_frame
 
 
 CANCELLATION_CHECK_INTERVAL = 256
 
+#surface parameter presets (impact friction, slide friction, restitution curve)
+SURFACE_PRESETS = {
+    "concrete": dict(mu_imp=0.55, mu_slide=0.50, e0=0.20, einf=0.05, vc=15.0),
+    "asphalt":  dict(mu_imp=0.45, mu_slide=0.40, e0=0.18, einf=0.05, vc=12.0),
+    "grass":    dict(mu_imp=0.35, mu_slide=0.55, e0=0.12, einf=0.03, vc=8.0),
+}
+
 
 class SimulationPhase(str, Enum):
     SIMULATING = "simulating"
@@ -27,6 +39,20 @@ class SimulationPhase(str, Enum):
     WRITING = "writing"
 
 
+class TrajectoryIntegrator(str, Enum):
+    """Integration scheme used for the airborne and slide phases.
+
+    ``EULER`` is the fixed-step reference.  ``ADAPTIVE`` uses Dormand-Prince
+    5(4) steps under error control, locates ground contact by root finding,
+    and samples its airborne output every ``dt`` seconds.  Distances agree
+    with the Euler reference to well under 0.1 % once the reference ``dt`` is
+    1 ms or smaller.  Both integrators solve the slide in closed form.
+    """
+
+    EULER = "euler"
+    ADAPTIVE = "adaptive"
+
+
 @dataclass(frozen=True, slots=True)
 class DebrisSimulationRequest:
     mass_kg: float
@@ -44,6 +70,10 @@ class DebrisSimulationRequest:
     input_coords: tuple[float, float, float, float] | None
     input_bearing: tuple[float, float, float] | None
     output_file: str | os.PathLike[str] | None = None
+    integrator: TrajectoryIntegrator = TrajectoryIntegrator.EULER
+
+    def __post_init__(self):
+        object.__setattr__(self, "integrator", TrajectoryIntegrator(self.integrator))
 
 
 @dataclass(frozen=True, slots=True)
@@ -120,6 +150,195 @@ def _raise_if_cancelled(cancellation_check):
         raise SimulationCancelled("Simulation cancelled.")
 
 
+SLIDE_SAMPLE_SPACING_M = 1.0
+MAX_SLIDE_SAMPLES = 4096
+
+
+def closed_form_slide(speed, friction, drag, time_limit=math.inf):
+    """Return ``(duration_s, distance_m)`` of a straight ground run.
+
+    The slide decelerates at ``friction + drag * v**2``, where ``friction`` is
+    the Coulomb term ``mu * g`` and ``drag`` the quadratic drag factor K (zero
+    without ground drag).  It ends at rest or after ``time_limit`` seconds.
+    """
+    if friction > 0.0 and drag > 0.0:
+        rate = math.sqrt(friction * drag)
+        angle = math.atan(speed * math.sqrt(drag / friction))
+        duration = angle / rate
+        if duration <= time_limit:
+            return duration, math.log1p(drag * speed * speed / friction) / (2.0 * drag)
+        return time_limit, math.log(
+            math.cos(angle - rate * time_limit) / math.cos(angle)
+        ) / drag
+    if friction > 0.0:
+        duration = speed / friction
+        if duration <= time_limit:
+            return duration, speed * speed / (2.0 * friction)
+        return time_limit, speed * time_limit - 0.5 * friction * time_limit * time_limit
+    if drag > 0.0:
+        return time_limit, math.log1p(drag * speed * time_limit) / drag
+    return time_limit, speed * time_limit
+
+
+def _slide_samples(speed, friction, drag, time_limit):
+    """Sample a closed-form slide every ``SLIDE_SAMPLE_SPACING_M`` metres."""
+    duration, length = closed_form_slide(speed, friction, drag, time_limit)
+    count = min(MAX_SLIDE_SAMPLES, max(2, math.ceil(length / SLIDE_SAMPLE_SPACING_M) + 1))
+    distances = np.linspace(0.0, length, count)
+    if drag > 0.0 and friction > 0.0:
+        terminal = friction / drag
+        speeds = np.sqrt(np.maximum(
+            0.0, (speed * speed + terminal) * np.exp(-2.0 * drag * distances) - terminal
+        ))
+        ratio = math.sqrt(drag / friction)
+        times = (math.atan(speed * ratio) - np.arctan(speeds * ratio)) / math.sqrt(friction * drag)
+    elif friction > 0.0:
+        speeds = np.sqrt(np.maximum(0.0, speed * speed - 2.0 * friction * distances))
+        times = (speed - speeds) / friction
+    elif drag > 0.0:
+        speeds = speed * np.exp(-drag * distances)
+        times = (1.0 / speeds - 1.0 / speed) / drag
+    else:
+        speeds = np.full(count, speed)
+        times = distances / speed
+    times[-1] = duration
+    if duration < time_limit:
+        speeds[-1] = 0.0
+    return times, distances, speeds
+
+
+# Dormand-Prince 5(4) tableau; the fifth-order row doubles as the last stage.
+_DP_NODES = (
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_ERROR = (
+    71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40,
+)
+ADAPTIVE_RELATIVE_TOLERANCE = 1e-9
+ADAPTIVE_ABSOLUTE_TOLERANCE = 1e-9
+
+
+def _dormand_prince_step(derivative, state, slope, h):
+    """Return the fifth-order state, its slope and the scaled error norm."""
+    stages = [slope]
+    for weights in _DP_NODES:
+        stages.append(
+            derivative(
+                tuple(
+                    value + h * sum(w * k[i] for w, k in zip(weights, stages))
+                    for i, value in enumerate(state)
+                )
+            )
+        )
+    result = tuple(
+        value + h * sum(w * k[i] for w, k in zip(_DP_NODES[-1], stages))
+        for i, value in enumerate(state)
+    )
+    error = 0.0
+    for i, (before, after) in enumerate(zip(state, result)):
+        estimate = h * sum(w * k[i] for w, k in zip(_DP_ERROR, stages))
+        scale = ADAPTIVE_ABSOLUTE_TOLERANCE + ADAPTIVE_RELATIVE_TOLERANCE * max(
+            abs(before), abs(after)
+        )
+        error = max(error, abs(estimate) / scale)
+    return result, stages[-1], error
+
+
+def _step_scale(error):
+    if error == 0.0:
+        return 5.0
+    return min(5.0, max(0.2, 0.9 * error ** -0.2))
+
+
+def _root_on_step(function, lower, upper, iterations=100):
+    """Illinois false position for ``function(lower) > 0 >= function(upper)``."""
+    f_lower = function(lower)
+    f_upper = function(upper)
+    side = 0
+    for _ in range(iterations):
+        if upper - lower <= 1e-12 * max(1.0, upper):
+            break
+        middle = upper - f_upper * (upper - lower) / (f_upper - f_lower)
+        f_middle = function(middle)
+        if f_middle > 0.0:
+            lower, f_lower = middle, f_middle
+            if side == -1:
+                f_upper *= 0.5
+            side = -1
+        else:
+            upper, f_upper = middle, f_middle
+            if side == 1:
+                f_lower *= 0.5
+            side = 1
+        if f_middle == 0.0:
+            break
+    return upper
+
+
+def _ground_contact_step(derivative, state, slope, h):
+    """Return ``(step, state)`` where the step reaches the ground, if bracketed."""
+
+    def height(step):
+        return _dormand_prince_step(derivative, state, slope, step)[0][2]
+
+    lower = 0.0
+    if state[2] <= 0.0:
+        # Just bounced: find any point of the arc above ground before the end.
+        for index in range(1, 16):
+            if height(h * index / 16) > 0.0:
+                lower = h * index / 16
+                break
+        else:
+            return None
+    contact = _root_on_step(height, lower, h)
+    contact_state = _dormand_prince_step(derivative, state, slope, contact)[0]
+    return contact, contact_state[:2] + (0.0,) + contact_state[3:]
+
+
+def _hermite(s, h, y0, f0, y1, f1):
+    s2 = s * s
+    s3 = s2 * s
+    return (
+        (2.0 * s3 - 3.0 * s2 + 1.0) * y0
+        + (s3 - 2.0 * s2 + s) * h * f0
+        + (3.0 * s2 - 2.0 * s3) * y1
+        + (s3 - s2) * h * f1
+    )
+
+
+class _TrajectorySampler:
+    """Write interpolated rows at whole multiples of the output interval."""
+
+    def __init__(self, trajectory, interval):
+        self._trajectory = trajectory
+        self._interval = interval
+        self._next = 1
+
+    def _fractions(self, t0, h):
+        last = math.floor((t0 + h) / self._interval + 1e-9)
+        if last < self._next:
+            return None, None
+        times = np.arange(self._next, last + 1) * self._interval
+        self._next = last + 1
+        return times, (times - t0) / h
+
+    def air(self, t0, h, y0, f0, y1, f1):
+        times, s = self._fractions(t0, h)
+        if times is None:
+            return
+        x, y, z, vx, vy, vz = (
+            _hermite(s, h, a, da, b, db) for a, da, b, db in zip(y0, f0, y1, f1)
+        )
+        self._trajectory.extend(
+            times, x, y, np.maximum(z, 0.0), vx, vy, vz, TrajectoryPhase.AIR
+        )
+
+
 class DebrisTrajectoryCalculator:
     def __init__(self,
                 mass_kg,
@@ -137,6 +356,7 @@ class DebrisTrajectoryCalculator:
                 input_coords,
                 input_bearing,
                 output_file=None,
+                integrator=TrajectoryIntegrator.EULER,
                 ):
 
         #CONFIG INPUTS
@@ -181,13 +401,12 @@ class DebrisTrajectoryCalculator:
 
         #file directory
         self.output_file = output_file
+        self.integrator = TrajectoryIntegrator(integrator)
 
         #surface parameter presets (impact friction, slide friction, restitution curve)
         self.SURFSETS = {
-        "concrete": dict(mu_imp=0.55, mu_slide=0.50, e0=0.20, einf=0.05, vc=15.0),
-        "asphalt":  dict(mu_imp=0.45, mu_slide=0.40, e0=0.18, einf=0.05, vc=12.0),
-        "grass":    dict(mu_imp=0.35, mu_slide=0.55, e0=0.12, einf=0.03, vc=8.0),
-         }
+            name: dict(values) for name, values in SURFACE_PRESETS.items()
+        }
 
     @staticmethod
     def bearing_deg(lat1, lon1, lat2, lon2):
@@ -213,13 +432,23 @@ class DebrisTrajectoryCalculator:
     alt_m, ktas, angle_deg, surface="grass",
     vz0=0.0, include_ground_drag=True,
     vz_bounce_min=0.5, max_steps=300000,
-    *, progress_callback=None, cancellation_check=None
+    *, integrator=TrajectoryIntegrator.EULER,
+    progress_callback=None, cancellation_check=None
     ):
         """
         3D point-mass with quadratic drag, wind = 0.
         Axes: x (Display Line), y (Crowd), z (Height above ground).
-        Euler forward integration with event-based impact, bounce, and slide.
+        Euler forward integration with event-based impact and bounce; the
+        slide is solved in closed form.  Returns the summary and a columnar TrajectoryBuffer of every step.
         """
+        if TrajectoryIntegrator(integrator) is TrajectoryIntegrator.ADAPTIVE:
+            return self._simulate_3d_adaptive(
+                m, A, Cd, rho, g, dt, alt_m, ktas, angle_deg, surface,
+                vz0, include_ground_drag, vz_bounce_min, max_steps,
+                progress_callback=progress_callback,
+                cancellation_check=cancellation_check,
+            )
+
         # Unit conversions & initial conditions
         V = float(ktas) * 0.514444444  # kt -> m/s
         theta = math.radians(angle_deg)
@@ -242,7 +471,7 @@ class DebrisTrajectoryCalculator:
         def clamp_eps(u, eps=1e-12):
             return 0.0 if abs(u) < eps else u
 
-        rows = []
+        trajectory = TrajectoryBuffer(min(max_steps, DEFAULT_TRAJECTORY_CAPACITY))
         impact_recorded = False
         x_imp = y_imp = None
         impacts = 0
@@ -255,7 +484,9 @@ class DebrisTrajectoryCalculator:
             force=True,
         )
 
+        steps = 0
         for step in range(max_steps):
+            steps = step + 1
             if step % CANCELLATION_CHECK_INTERVAL == 0:
                 _raise_if_cancelled(cancellation_check)
                 reporter.report(
@@ -306,13 +537,12 @@ class DebrisTrajectoryCalculator:
                     vx, vy, vz = clamp_eps(vx_post), clamp_eps(vy_post), clamp_eps(vz_post)
 
                     impacts += 1
-                    event_note = f"impact#{impacts}"
 
                     if not impact_recorded:
                         x_imp, y_imp = x, y
                         impact_recorded = True
 
-                    rows.append(dict(t=t+dt, x=x, y=y, z=z, vx=vx, vy=vy, vz=vz, phase="air", event=event_note))
+                    trajectory.append(t+dt, x, y, z, vx, vy, vz, TrajectoryPhase.AIR, impacts)
 
                     # Transition to slide if bounce is negligible
                     if abs(vz) < vz_bounce_min:
@@ -322,42 +552,22 @@ class DebrisTrajectoryCalculator:
                     # No impact this step
                     x, y, z = x_new, y_new, z_new
                     vx, vy, vz = vx_new, vy_new, vz_new
-                    rows.append(dict(t=t+dt, x=x, y=y, z=z, vx=vx, vy=vy, vz=vz, phase="air", event=None))
+                    trajectory.append(t+dt, x, y, z, vx, vy, vz, TrajectoryPhase.AIR)
 
             else:
-                # Ground slide (z = 0)
+                # Ground slide (z = 0), straight along the touchdown heading
                 vt_mag = math.sqrt(vx*vx + vy*vy)
                 if vt_mag <= 1e-6:
                     vx = vy = 0.0
-                    rows.append(dict(t=t+dt, x=x, y=y, z=0.0, vx=vx, vy=vy, vz=0.0, phase="slide", event=None))
+                    trajectory.append(t+dt, x, y, 0.0, vx, vy, 0.0, TrajectoryPhase.SLIDE)
                     break
 
-                # Kinetic friction
-                ax_fric_x = -mu_slide * g * (vx / vt_mag)
-                ax_fric_y = -mu_slide * g * (vy / vt_mag)
-
-                # Optional aero drag during slide
-                ax_drag = ay_drag = 0.0
-                if include_ground_drag:
-                    vmag = vt_mag
-                    ax_drag = -K * vmag * vx
-                    ay_drag = -K * vmag * vy
-
-                ax = ax_fric_x + ax_drag
-                ay = ax_fric_y + ay_drag
-
-                vx = clamp_eps(vx + ax * dt)
-                vy = clamp_eps(vy + ay * dt)
-
-                # Prevent numeric reversal
-                if vx * (vx + ax*dt) < 0: vx = 0.0
-                if vy * (vy + ay*dt) < 0: vy = 0.0
-
-                x = x + vx * dt
-                y = y + vy * dt
-                z = 0.0
-
-                rows.append(dict(t=t+dt, x=x, y=y, z=z, vx=vx, vy=vy, vz=0.0, phase="slide", event=None))
+                # Kinetic friction plus optional aero drag, solved in closed form
+                x, y = self._append_closed_form_slide(
+                    trajectory, t, x, y, vx, vy, vt_mag,
+                    mu_slide * g, K if include_ground_drag else 0.0,
+                )
+                break
 
             t += dt
             if t > 3600.0:  # hard stop (1 hour)
@@ -372,17 +582,27 @@ class DebrisTrajectoryCalculator:
             force=True,
         )
 
-        df = pd.DataFrame(rows)
+        summary = self._trajectory_summary(
+            alt_m, ktas, angle_deg, surface, m, A, Cd,
+            (x, y), (x_imp, y_imp) if impact_recorded else None, impacts, steps,
+        )
+        return summary, trajectory
 
+    def _trajectory_summary(
+        self, alt_m, ktas, angle_deg, surface, m, A, Cd,
+        rest, first_impact, impacts, steps,
+    ):
+        x, y = rest
         # Distances in ground plane
-        if impact_recorded:
+        if first_impact is not None:
+            x_imp, y_imp = first_impact
             air_dist_xy = math.hypot(x_imp, y_imp)
             ground_dist_xy = math.hypot(x - x_imp, y - y_imp)
         else:
             air_dist_xy = math.hypot(x, y)
             ground_dist_xy = 0.0
 
-        summary = dict(
+        return dict(
             alt_m=alt_m,
             ktas=ktas,
             angle_deg=angle_deg,
@@ -394,9 +614,156 @@ class DebrisTrajectoryCalculator:
             ground_dist_xy_m=ground_dist_xy,
             total_dist_xy_m=air_dist_xy + ground_dist_xy,
             impacts=impacts,
+            steps=steps,
             heading=self.az_deg
         )
-        return summary, df
+
+    @staticmethod
+    def _append_closed_form_slide(trajectory, t, x, y, vx, vy, speed, friction, drag):
+        """Append slide rows sampled along the ground run; return the rest point."""
+        times, distances, speeds = _slide_samples(
+            speed, friction, drag, max(0.0, 3600.0 - t)
+        )
+        ux, uy = vx / speed, vy / speed
+        trajectory.extend(
+            t + times[1:],
+            x + distances[1:] * ux,
+            y + distances[1:] * uy,
+            0.0,
+            speeds[1:] * ux,
+            speeds[1:] * uy,
+            0.0,
+            TrajectoryPhase.SLIDE,
+        )
+        return x + distances[-1] * ux, y + distances[-1] * uy
+
+    def _simulate_3d_adaptive(self,
+    m, A, Cd, rho, g, dt,
+    alt_m, ktas, angle_deg, surface,
+    vz0, include_ground_drag, vz_bounce_min, max_steps,
+    *, progress_callback=None, cancellation_check=None
+    ):
+        """
+        Same model as simulate_3d, with the airborne phase integrated by
+        error-controlled Dormand-Prince steps.  Ground contact is located by
+        root finding on the step length; airborne rows are sampled every dt
+        seconds from the cubic Hermite interpolant of each step.
+        """
+        V = float(ktas) * 0.514444444  # kt -> m/s
+        theta = math.radians(angle_deg)
+
+        s = self.SURFSETS[surface]
+        mu_imp, mu_slide, e0, einf, vc = s["mu_imp"], s["mu_slide"], s["e0"], s["einf"], s["vc"]
+        K = 0.5 * rho * Cd * A / m
+
+        def air_derivative(state):
+            _, _, _, vx, vy, vz = state
+            vmag = math.sqrt(vx*vx + vy*vy + vz*vz)
+            return (vx, vy, -vz, -K * vmag * vx, -K * vmag * vy, g - K * vmag * vz)
+
+        trajectory = TrajectoryBuffer(min(max_steps, DEFAULT_TRAJECTORY_CAPACITY))
+        sampler = _TrajectorySampler(trajectory, dt)
+        reporter = _ProgressReporter(progress_callback)
+        reporter.report(
+            SimulationPhase.SIMULATING,
+            0,
+            max_steps,
+            "Simulating trajectory…",
+            force=True,
+        )
+
+        t = 0.0
+        state = (0.0, 0.0, alt_m, V * math.cos(theta), V * math.sin(theta), vz0)
+        slope = air_derivative(state)
+        h = dt
+        airborne = True
+        first_impact = None
+        impacts = 0
+        steps = 0
+
+        while airborne:
+            if steps >= max_steps or t > 3600.0:
+                break
+            _raise_if_cancelled(cancellation_check)
+            reporter.report(
+                SimulationPhase.SIMULATING,
+                steps,
+                max_steps,
+                "Simulating trajectory…",
+            )
+            candidate, candidate_slope, error = _dormand_prince_step(
+                air_derivative, state, slope, h
+            )
+            steps += 1
+            if error > 1.0:
+                h *= _step_scale(error)
+                continue
+
+            if candidate[2] > 0.0:
+                sampler.air(t, h, state, slope, candidate, candidate_slope)
+                t += h
+                state, slope = candidate, candidate_slope
+                h *= _step_scale(error)
+                continue
+
+            contact = _ground_contact_step(air_derivative, state, slope, h)
+            if contact is None:
+                # The step jumps a whole bounce arc; retry with a shorter one.
+                h *= 0.5
+                continue
+            h_contact, contact_state = contact
+            contact_slope = air_derivative(contact_state)
+            sampler.air(t, h_contact, state, slope, contact_state, contact_slope)
+            t += h_contact
+
+            x, y, _, vx, vy, vz = contact_state
+            vn_pre = abs(vz)
+            eN = self.en_exp(vn_pre, e0, einf, vc)
+            vz_post = -eN * vz
+            vt_mag_pre = math.sqrt(vx*vx + vy*vy)
+            dv_t = mu_imp * (1.0 + eN) * vn_pre
+            if vt_mag_pre > 0.0:
+                scale = max(0.0, (vt_mag_pre - dv_t) / vt_mag_pre)
+                vx, vy = vx * scale, vy * scale
+            else:
+                vx = vy = 0.0
+
+            impacts += 1
+            if first_impact is None:
+                first_impact = (x, y)
+            state = (x, y, 0.0, vx, vy, vz_post)
+            slope = air_derivative(state)
+            trajectory.append(t, *state, TrajectoryPhase.AIR, impacts)
+            # A bounce shorter than one output sample cannot be plotted or
+            # bracketed reliably, so it settles into the slide as well.
+            if abs(vz_post) < vz_bounce_min or 2.0 * abs(vz_post) < g * dt:
+                airborne = False
+
+        x, y, _, vx, vy, _ = state
+        speed = math.sqrt(vx*vx + vy*vy)
+        if not airborne and speed > 1e-6:
+            steps += 1
+            x, y = self._append_closed_form_slide(
+                trajectory, t, x, y, vx, vy, speed,
+                mu_slide * g, K if include_ground_drag else 0.0,
+            )
+        elif not airborne:
+            trajectory.append(t, x, y, 0.0, 0.0, 0.0, 0.0, TrajectoryPhase.SLIDE)
+
+        _raise_if_cancelled(cancellation_check)
+        reporter.report(
+            SimulationPhase.SIMULATING,
+            max_steps,
+            max_steps,
+            "Trajectory simulation complete.",
+            force=True,
+        )
+
+        summary = self._trajectory_summary(
+            alt_m, ktas, angle_deg, surface, m, A, Cd,
+            (x, y), first_impact, impacts, steps,
+        )
+        return summary, trajectory
 
     def prepare_debris_trajectory(
         self, *, progress_callback=None, cancellation_check=None
@@ -404,18 +771,16 @@ class DebrisTrajectoryCalculator:
         """Calculate an immutable KML document without publishing a file."""
         reporter = _ProgressReporter(progress_callback)
 
-        summary, df = self.simulate_3d(
+        summary, trajectory = self.simulate_3d(
             m=self.mass_kg, A=self.area_m2, Cd=self.Cd, rho=self.rho, g=self.g, dt=self.dt,
             alt_m=self.alt_m_relative, ktas=self.ktas, angle_deg=0.0, surface=self.surface,
             vz0=0.0, include_ground_drag=self.include_ground_drag, vz_bounce_min=self.vz_bounce_min,
+            integrator=self.integrator,
             progress_callback=progress_callback, cancellation_check=cancellation_check,
         )
 
-        local_frame = LocalEnuFrame(self.final_lat, self.final_lon)
-        coords_air = [(self.final_lon, self.final_lat, self.altitude_m)]
-        coords_ground = []
-
-        projection_total = max(len(df) - 1, 1)
+        local_frame = cached_local_enu_frame(self.final_lat, self.final_lon)
+        projection_total = max(len(trajectory) - 1, 1)
         reporter.report(
             SimulationPhase.PROJECTING,
             0,
@@ -423,108 +788,46 @@ class DebrisTrajectoryCalculator:
             "Projecting trajectory into KML coordinates…",
             force=True,
         )
-        for index, row in enumerate(df.iloc[1:].itertuples(index=False), start=1):
-            if index % CANCELLATION_CHECK_INTERVAL == 0:
-                _raise_if_cancelled(cancellation_check)
-                reporter.report(
-                    SimulationPhase.PROJECTING,
-                    index,
-                    projection_total,
-                    "Projecting trajectory into KML coordinates…",
-                )
+        _raise_if_cancelled(cancellation_check)
 
-            x = float(row.x)
-            y = float(row.y)
-            z = float(row.z)
-            east = x * math.sin(self.az_rad) + y * math.sin(self.az_rad + math.pi/2.0)
-            north = x * math.cos(self.az_rad) + y * math.cos(self.az_rad + math.pi/2.0)
+        along = trajectory.x[1:]
+        cross = trajectory.y[1:]
+        #add terrain elevation back in for google earth
+        alt_real = trajectory.z[1:] + self.terrain_m
+        airborne = trajectory.phase[1:] == TrajectoryPhase.AIR
 
-            lat, lon = local_frame.to_wgs84(
-                EnuCoordinate(east_m=east, north_m=north, up_m=0.0)
+        outline_along = outline_cross = np.empty(0)
+        if not airborne.all():
+            outline_along, outline_cross = self._teardrop_outline(
+                summary["air_dist_xy_m"], summary["total_dist_xy_m"]
             )
-            
-            #add terrain elevation back in for google earth
-            alt_real = z + self.terrain_m
 
-            if row.phase == "air":
-                coords_air.append((lon, lat, alt_real))
-            else:
-                coords_ground.append((lon, lat, alt_real))
-
-        teardrop_points = []
-        if coords_ground:
-            n_points = 120  # increase resolution for smoother curve
-            teardrop_outer = []
-            teardrop_inner = []
-
-            d_imp = summary['air_dist_xy_m']
-            L = summary['total_dist_xy_m']
-            if L <= 0: L = 1.0
-
-            half_width_max = 0.06 * L  # Max width is 0.12 * L, so half-width is 0.06 * L
-
-            for i in range(n_points + 1):
-                if i % 16 == 0:
-                    _raise_if_cancelled(cancellation_check)
-                frac = i / n_points
-                current_dist = frac * L
-                    
-                # Width calculation
-                if current_dist < d_imp:
-                        # Elliptical nose from start to impact
-                    if d_imp > 1e-6:
-                        ratio = (current_dist - d_imp) / d_imp
-                            # ratio goes from -1 (at start) to 0 (at impact)
-                            # 1 - ratio^2 goes from 0 to 1
-                        width = half_width_max * math.sqrt(max(0.0, 1.0 - ratio*ratio))
-                    else:
-                        width = 0.0
-                else:
-                        # Elliptical tail from impact to end (rounded tip)
-                    tail_len = L - d_imp
-                    if tail_len > 1e-6:
-                        ratio = (current_dist - d_imp) / tail_len
-                            # ratio goes from 0 (at impact) to 1 (at end)
-                        width = half_width_max * math.sqrt(max(0.0, 1.0 - ratio*ratio))
-                    else:
-                            # If no ground slide, width remains max at the very end
-                        width = half_width_max
-
-                # Coordinate transformation
-                # x_local is along track (current_dist)
-                # y_local is cross track (width)
-                    
-                # Transform for +width (Outer/Right)
-                x_local = current_dist
-                y_local = width
-                    
-                east_outer = x_local * math.sin(self.az_rad) + y_local * math.cos(self.az_rad)
-                north_outer = x_local * math.cos(self.az_rad) - y_local * math.sin(self.az_rad)
-                    
-                # Transform for -width (Inner/Left)
-                y_local_inner = -width
-                east_inner = x_local * math.sin(self.az_rad) + y_local_inner * math.cos(self.az_rad)
-                north_inner = x_local * math.cos(self.az_rad) - y_local_inner * math.sin(self.az_rad)
-
-                lat_outer, lon_outer = local_frame.to_wgs84(
-                    EnuCoordinate(
-                        east_m=east_outer,
-                        north_m=north_outer,
-                        up_m=0.0,
-                    )
-                )
-                lat_inner, lon_inner = local_frame.to_wgs84(
-                    EnuCoordinate(
-                        east_m=east_inner,
-                        north_m=north_inner,
-                        up_m=0.0,
-                    )
-                )
-
-                teardrop_outer.append((lon_outer, lat_outer, self.terrain_m))
-                teardrop_inner.insert(0, (lon_inner, lat_inner, self.terrain_m))
+        # Track axes (along, cross) -> (east, north) for the heading az_rad,
+        # applied to the trajectory and the debris zone in one projection.
+        rotation = np.array([
+            [math.sin(self.az_rad), math.cos(self.az_rad)],
+            [math.cos(self.az_rad), -math.sin(self.az_rad)],
+        ])
+        east, north = rotation @ np.vstack((
+            np.concatenate((along, outline_along)),
+            np.concatenate((cross, outline_cross)),
+        ))
+        latitudes, longitudes = local_frame.to_wgs84_array(east, north)
+        _raise_if_cancelled(cancellation_check)
 
-            teardrop_points = teardrop_outer + teardrop_inner
+        row_count = along.size
+        track = np.column_stack((
+            longitudes[:row_count], latitudes[:row_count], alt_real
+        ))
+        coords_air = [(self.final_lon, self.final_lat, self.altitude_m)]
+        coords_air.extend(map(tuple, track[airborne].tolist()))
+        coords_ground = list(map(tuple, track[~airborne].tolist()))
+        teardrop_points = [
+            (lon, lat, self.terrain_m)
+            for lon, lat in zip(
+                longitudes[row_count:].tolist(), latitudes[row_count:].tolist()
+            )
+        ]
 
         styles = [
             KmlStyle(
@@ -597,6 +900,34 @@ class DebrisTrajectoryCalculator:
         anchor = self._first_plotted_coordinate(document)
         return summary, document, anchor
 
+    @staticmethod
+    def _teardrop_outline(d_imp, L, n_points=120):
+        """Return the closed debris-zone ring as along/cross-track arrays."""
+        if L <= 0: L = 1.0
+        half_width_max = 0.06 * L  # Max width is 0.12 * L, so half-width is 0.06 * L
+
+        current_dist = np.arange(n_points + 1) / n_points * L
+        # Elliptical nose from start to impact
+        if d_imp > 1e-6:
+            ratio = (current_dist - d_imp) / d_imp
+            nose = half_width_max * np.sqrt(np.maximum(0.0, 1.0 - ratio*ratio))
+        else:
+            nose = np.zeros_like(current_dist)
+        # Elliptical tail from impact to end (rounded tip)
+        tail_len = L - d_imp
+        if tail_len > 1e-6:
+            ratio = (current_dist - d_imp) / tail_len
+            tail = half_width_max * np.sqrt(np.maximum(0.0, 1.0 - ratio*ratio))
+        else:
+            # If no ground slide, width remains max at the very end
+            tail = np.full_like(current_dist, half_width_max)
+        width = np.where(current_dist < d_imp, nose, tail)
+
+        # Outer (+width) edge forwards, then the inner (-width) edge back.
+        along = np.concatenate((current_dist, current_dist[::-1]))
+        cross = np.concatenate((width, -width[::-1]))
+        return along, cross
+
     @staticmethod
     def _first_plotted_coordinate(document):
         for placemark in document.placemarks:
@@ -687,14 +1018,10 @@ class DebrisTrajectoryCalculator:
         return summary
 
 
-def run_debris_simulation_request(
+def _calculator_from_request(
     request: DebrisSimulationRequest,
-    *,
-    progress_callback: Callable[[SimulationProgress], None] | None = None,
-    cancellation_check: Callable[[], bool] | None = None,
-) -> DebrisSimulationResult:
-    """Run one immutable request through the compatibility calculator."""
-    simulation = DebrisTrajectoryCalculator(
+) -> DebrisTrajectoryCalculator:
+    return DebrisTrajectoryCalculator(
         mass_kg=request.mass_kg,
         area_m2=request.area_m2,
         Cd=request.Cd,
@@ -710,7 +1037,18 @@ def run_debris_simulation_request(
         input_coords=request.input_coords,
         input_bearing=request.input_bearing,
         output_file=request.output_file,
+        integrator=request.integrator,
     )
+
+
+def run_debris_simulation_request(
+    request: DebrisSimulationRequest,
+    *,
+    progress_callback: Callable[[SimulationProgress], None] | None = None,
+    cancellation_check: Callable[[], bool] | None = None,
+) -> DebrisSimulationResult:
+    """Run one immutable request through the compatibility calculator."""
+    simulation = _calculator_from_request(request)
     summary, document, anchor = simulation.prepare_debris_trajectory(
         progress_callback=progress_callback,
         cancellation_check=cancellation_check,
@@ -0,0 +1,236 @@
+"""Memoized content fingerprints for source files.
+
+Stale-scene checks, committed preview offsets and the parsed-track cache all
+need to know whether a file's contents changed. Hashing a large flight log
+on every check stalls the GUI, so digests are memoized by the file's stat
+identity and recomputed only when the device, inode, size, modification or
+change time differs. Hashing can also be started on a background thread
+when a file is first selected, so a later check only waits for the rest.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import os
+import threading
+
+
+FINGERPRINT_DIGEST = "sha256"
+FINGERPRINT_CACHE_SIZE = 1024
+FINGERPRINT_WORKERS = 2
+_READ_CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class FileFingerprint:
+    """The size, modification time and content digest of one file."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+@dataclass(frozen=True, slots=True)
+class FileFingerprintCacheInfo:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, int, int, int, int]:
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
+
+def _hash_file(path: str, stop: threading.Event | None = None) -> str:
+    digest = hashlib.new(FINGERPRINT_DIGEST)
+    buffer = bytearray(_READ_CHUNK_BYTES)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as handle:
+        while count := handle.readinto(buffer):
+            if stop is not None and stop.is_set():
+                raise CancelledError()
+            digest.update(view[:count])
+    return digest.hexdigest()
+
+
+class FileFingerprintService:
+    """Memoize file digests by stat identity, hashing each version once.
+
+    Concurrent requests for the same file version share one hashing pass,
+    whether it started in the foreground or on the background pool.
+    """
+
+    def __init__(
+        self,
+        max_size: int = FINGERPRINT_CACHE_SIZE,
+        max_workers: int = FINGERPRINT_WORKERS,
+    ) -> None:
+        self._entries: OrderedDict[tuple[int, ...], FileFingerprint] = OrderedDict()
+        self._pending: dict[tuple[int, ...], Future[FileFingerprint]] = {}
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._stop = threading.Event()
+        self._hits = 0
+        self._misses = 0
+
+    def fingerprint(self, path: str | os.PathLike[str]) -> FileFingerprint:
+        """Return the current fingerprint; raises :class:`OSError` if unreadable."""
+        return self._fingerprint(os.fspath(path), background=False).result()
+
+    def fingerprint_async(
+        self, path: str | os.PathLike[str]
+    ) -> Future[FileFingerprint]:
+        """Start hashing on the background pool unless the digest is known."""
+        source = os.fspath(path)
+        try:
+            return self._fingerprint(source, background=True)
+        except OSError as error:
+            future: Future[FileFingerprint] = Future()
+            future.set_exception(error)
+            return future
+
+    def _fingerprint(self, source: str, *, background: bool) -> Future[FileFingerprint]:
+        stat = os.stat(source)
+        key = _stat_key(stat)
+        with self._lock:
+            fingerprint = self._entries.get(key)
+            if fingerprint is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                future: Future[FileFingerprint] = Future()
+                future.set_result(fingerprint)
+                return future
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+            self._misses += 1
+            future = Future()
+            self._pending[key] = future
+            if background:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="file-fingerprint",
+                    )
+                task = self._executor.submit(
+                    self._compute, source, stat, key, future, self._stop
+                )
+                task.add_done_callback(
+                    lambda task: task.cancelled() and self._abandon(key, future)
+                )
+        if not background:
+            self._compute(source, stat, key, future)
+        return future
+
+    def _compute(
+        self,
+        source: str,
+        stat: os.stat_result,
+        key: tuple[int, ...],
+        future: Future[FileFingerprint],
+        stop: threading.Event | None = None,
+    ) -> None:
+        try:
+            fingerprint = FileFingerprint(
+                stat.st_size, stat.st_mtime_ns, _hash_file(source, stop)
+            )
+            # A file rewritten while it was read may not match its stat, so
+            # only a stable version is remembered.
+            stable = _stat_key(os.stat(source)) == key
+        except Exception as error:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(error)
+            return
+        with self._lock:
+            self._pending.pop(key, None)
+            if stable:
+                self._entries[key] = fingerprint
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+        future.set_result(fingerprint)
+
+    def _abandon(self, key: tuple[int, ...], future: Future[FileFingerprint]) -> None:
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        future.set_exception(CancelledError())
+
+    def shutdown(self, *, cancel_futures: bool = True) -> None:
+        """Stop the background pool without waiting for it.
+
+        With ``cancel_futures``, queued hashes are cancelled and running ones
+        stop at their next chunk; their futures raise
+        :class:`~concurrent.futures.CancelledError`. A later prefetch starts
+        a new pool.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            stop = self._stop
+            self._stop = threading.Event()
+        if executor is None:
+            return
+        if cancel_futures:
+            stop.set()
+        executor.shutdown(wait=False, cancel_futures=cancel_futures)
+
+    def info(self) -> FileFingerprintCacheInfo:
+        with self._lock:
+            return FileFingerprintCacheInfo(
+                self._hits,
+                self._misses,
+                len(self._entries),
+                self._max_size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_FILE_FINGERPRINTS = FileFingerprintService()
+
+
+def file_fingerprint(path: str | os.PathLike[str]) -> FileFingerprint:
+    """Return the shared, memoized fingerprint of a file."""
+    return _FILE_FINGERPRINTS.fingerprint(path)
+
+
+def prefetch_file_fingerprints(paths) -> None:
+    """Hash files on the background pool so later checks find them memoized."""
+    for path in paths:
+        _FILE_FINGERPRINTS.fingerprint_async(path)
+
+
+def shutdown_file_fingerprints() -> None:
+    """Cancel background hashing, such as when the application closes."""
+    _FILE_FINGERPRINTS.shutdown(cancel_futures=True)
+
+
+def file_fingerprint_cache_info() -> FileFingerprintCacheInfo:
+    return _FILE_FINGERPRINTS.info()
+
+
+def clear_file_fingerprint_cache() -> None:
+    _FILE_FINGERPRINTS.clear()
+
+
+__all__ = [
+    "FileFingerprint",
+    "FileFingerprintCacheInfo",
+    "FileFingerprintService",
+    "clear_file_fingerprint_cache",
+    "file_fingerprint",
+    "file_fingerprint_cache_info",
+    "prefetch_file_fingerprints",
+    "shutdown_file_fingerprints",
+]
@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 import math
+import threading
 
+import numpy as np
 from pyproj import Geod, Transformer
 from pyproj.enums import TransformDirection
 from pyproj.exceptions import GeodError, ProjError
 
 
 _WGS84_GEOD = Geod(ellps="WGS84")
+_WGS84_A = 6_378_137.0
+_WGS84_F = 1.0 / 298.257223563
+_WGS84_B = _WGS84_A * (1.0 - _WGS84_F)
+_WGS84_E2 = _WGS84_F * (2.0 - _WGS84_F)
+_WGS84_EP2 = _WGS84_E2 / (1.0 - _WGS84_E2)
 _NEUTRAL_ELLIPSOIDAL_HEIGHT_M = 0.0
 
+ENU_FRAME_CACHE_SIZE = 64
+ENU_FRAME_ORIGIN_DECIMALS = 9
+FAST_ENU_BOWRING_ITERATIONS = 1
+FAST_ENU_MAX_ERROR_M = 1e-6
+
 
 def _finite(value: object, label: str) -> float:
     try:
@@ -39,6 +52,45 @@ def _normalized_longitude(longitude: float) -> float:
     return (longitude + 180.0) % 360.0 - 180.0
 
 
+def _float_arrays(*values: object, label: str) -> tuple[np.ndarray, ...]:
+    try:
+        arrays = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in values)
+        )
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"{label} must be equal-length arrays of numbers.") from error
+    if arrays[0].ndim != 1:
+        raise ValueError(f"{label} must be one-dimensional arrays.")
+    return tuple(arrays)
+
+
+def _first_invalid(invalid: np.ndarray, check, *arrays: np.ndarray) -> None:
+    """Re-run the scalar check on the first flagged point to report it."""
+    if not invalid.any():
+        return
+    index = int(np.argmax(invalid))
+    try:
+        check(*(array[index] for array in arrays))
+    except ValueError as error:
+        raise ValueError(f"Point {index}: {error}") from None
+    raise ValueError(f"Point {index} is invalid.")
+
+
+def _coordinate_arrays(
+    latitudes: object,
+    longitudes: object,
+) -> tuple[np.ndarray, np.ndarray]:
+    latitude, longitude = _float_arrays(
+        latitudes,
+        longitudes,
+        label="Latitudes and longitudes",
+    )
+    with np.errstate(invalid="ignore"):
+        invalid = ~(np.abs(latitude) <= 90.0) | ~(np.abs(longitude) <= 180.0)
+    _first_invalid(invalid, _coordinate, latitude, longitude)
+    return latitude, longitude
+
+
 def inverse_distance_bearing(
     start_latitude: float,
     start_longitude: float,
@@ -69,6 +121,44 @@ def inverse_distance_bearing(
     return distance, initial_bearing % 360.0
 
 
+def inverse_distance_bearing_array(
+    start_latitudes: object,
+    start_longitudes: object,
+    end_latitudes: object,
+    end_longitudes: object,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array form of :func:`inverse_distance_bearing`; scalars broadcast."""
+    start_latitude, start_longitude, end_latitude, end_longitude = _float_arrays(
+        start_latitudes,
+        start_longitudes,
+        end_latitudes,
+        end_longitudes,
+        label="Geodesic endpoints",
+    )
+    _coordinate_arrays(start_latitude, start_longitude)
+    _coordinate_arrays(end_latitude, end_longitude)
+    try:
+        initial_bearing, _, distance = _WGS84_GEOD.inv(
+            start_longitude,
+            start_latitude,
+            end_longitude,
+            end_latitude,
+        )
+    except GeodError as error:
+        raise ValueError("WGS84 inverse transformation failed.") from error
+    initial_bearing = np.asarray(initial_bearing, dtype=np.float64)
+    distance = np.asarray(distance, dtype=np.float64)
+    if not (np.isfinite(initial_bearing).all() and np.isfinite(distance).all()):
+        raise ValueError("WGS84 inverse transformation returned a non-finite result.")
+    coincident = (distance == 0.0) | (
+        (start_latitude == end_latitude) & (start_longitude == end_longitude)
+    )
+    return (
+        np.where(coincident, 0.0, distance),
+        np.where(coincident, 0.0, initial_bearing % 360.0),
+    )
+
+
 def destination_point(
     latitude: float,
     longitude: float,
@@ -93,6 +183,47 @@ def destination_point(
     return final_latitude, _normalized_longitude(final_longitude)
 
 
+def destination_point_array(
+    latitudes: object,
+    longitudes: object,
+    distances_m: object,
+    true_bearings_deg: object,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array form of :func:`destination_point`; scalars broadcast."""
+    latitude, longitude, distance, bearing = _float_arrays(
+        latitudes,
+        longitudes,
+        distances_m,
+        true_bearings_deg,
+        label="Geodesic inputs",
+    )
+    latitude, longitude = _coordinate_arrays(latitude, longitude)
+    _first_invalid(
+        ~np.isfinite(distance),
+        lambda value: _finite(value, "Distance"),
+        distance,
+    )
+    _first_invalid(
+        ~np.isfinite(bearing),
+        lambda value: _finite(value, "True bearing"),
+        bearing,
+    )
+    try:
+        final_longitude, final_latitude, _ = _WGS84_GEOD.fwd(
+            longitude,
+            latitude,
+            bearing,
+            distance,
+        )
+    except GeodError as error:
+        raise ValueError("WGS84 direct transformation failed.") from error
+    final_latitude = np.asarray(final_latitude, dtype=np.float64)
+    final_longitude = np.asarray(final_longitude, dtype=np.float64)
+    if not (np.isfinite(final_latitude).all() and np.isfinite(final_longitude).all()):
+        raise ValueError("WGS84 direct transformation returned a non-finite result.")
+    return final_latitude, _normalized_longitude(final_longitude)
+
+
 @dataclass(frozen=True, slots=True)
 class EnuCoordinate:
     """A position in a local east, north, up frame, expressed in metres."""
@@ -107,6 +238,46 @@ class EnuCoordinate:
         object.__setattr__(self, "up_m", _finite(self.up_m, "ENU up"))
 
 
+@dataclass(frozen=True, slots=True, eq=False)
+class EnuBlock:
+    """Many local ENU positions held as equal-length, read-only float64 arrays."""
+
+    east_m: np.ndarray = field(repr=False)
+    north_m: np.ndarray = field(repr=False)
+    up_m: np.ndarray = field(repr=False)
+
+    def __post_init__(self) -> None:
+        east, north, up = (
+            np.array(values, dtype=np.float64)
+            for values in _float_arrays(
+                self.east_m,
+                self.north_m,
+                self.up_m,
+                label="ENU positions",
+            )
+        )
+        _first_invalid(
+            ~(np.isfinite(east) & np.isfinite(north) & np.isfinite(up)),
+            EnuCoordinate,
+            east,
+            north,
+            up,
+        )
+        for name, values in (("east_m", east), ("north_m", north), ("up_m", up)):
+            values.flags.writeable = False
+            object.__setattr__(self, name, values)
+
+    def __len__(self) -> int:
+        return self.east_m.size
+
+    def __getitem__(self, index: int) -> EnuCoordinate:
+        return EnuCoordinate(
+            float(self.east_m[index]),
+            float(self.north_m[index]),
+            float(self.up_m[index]),
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class LocalEnuFrame:
     """A WGS84 topocentric frame anchored at a geodetic coordinate.
@@ -151,6 +322,20 @@ class LocalEnuFrame:
             raise ValueError("WGS84 to ENU transformation failed.") from error
         return EnuCoordinate(east, north, up)
 
+    def to_enu_array(self, latitudes: object, longitudes: object) -> EnuBlock:
+        """Convert WGS84 latitude/longitude arrays to this frame in one call."""
+        latitude, longitude = _coordinate_arrays(latitudes, longitudes)
+        try:
+            east, north, up = self._transformer.transform(
+                longitude,
+                latitude,
+                np.full_like(latitude, _NEUTRAL_ELLIPSOIDAL_HEIGHT_M),
+                errcheck=True,
+            )
+        except ProjError as error:
+            raise ValueError("WGS84 to ENU transformation failed.") from error
+        return EnuBlock(east, north, up)
+
     def to_wgs84(self, position: EnuCoordinate) -> tuple[float, float]:
         """Convert an ENU position back to WGS84 latitude/longitude."""
         try:
@@ -168,6 +353,335 @@ class LocalEnuFrame:
         latitude, longitude = _coordinate(latitude, _normalized_longitude(longitude))
         return latitude, longitude
 
+    def to_wgs84_array(
+        self,
+        east_m: object,
+        north_m: object,
+        up_m: object = 0.0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Convert ENU arrays back to WGS84 latitude/longitude arrays in one call."""
+        east, north, up = _float_arrays(east_m, north_m, up_m, label="ENU positions")
+        _first_invalid(
+            ~(np.isfinite(east) & np.isfinite(north) & np.isfinite(up)),
+            EnuCoordinate,
+            east,
+            north,
+            up,
+        )
+        try:
+            longitude, latitude, height = self._transformer.transform(
+                east,
+                north,
+                up,
+                direction=TransformDirection.INVERSE,
+                errcheck=True,
+            )
+        except ProjError as error:
+            raise ValueError("ENU to WGS84 transformation failed.") from error
+        latitude = np.asarray(latitude, dtype=np.float64)
+        longitude = np.asarray(longitude, dtype=np.float64)
+        if not (
+            np.isfinite(latitude).all()
+            and np.isfinite(longitude).all()
+            and np.isfinite(height).all()
+        ):
+            raise ValueError("ENU to WGS84 transformation returned a non-finite result.")
+        if np.any(np.abs(latitude) > 90.0):
+            raise ValueError("Latitude must be between -90 and 90 degrees.")
+        return latitude, _normalized_longitude(longitude)
+
+
+def _geodetic_to_ecef(
+    latitude_rad: np.ndarray,
+    longitude_rad: np.ndarray,
+    height_m: np.ndarray | float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    sin_latitude = np.sin(latitude_rad)
+    cos_latitude = np.cos(latitude_rad)
+    normal = _WGS84_A / np.sqrt(1.0 - _WGS84_E2 * sin_latitude * sin_latitude)
+    horizontal = (normal + height_m) * cos_latitude
+    return (
+        horizontal * np.cos(longitude_rad),
+        horizontal * np.sin(longitude_rad),
+        (normal * (1.0 - _WGS84_E2) + height_m) * sin_latitude,
+    )
+
+
+def _ecef_to_geodetic(
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Bowring's method with a fixed number of reduced-latitude refinements.
+
+    The reduced latitude is carried as a scaled (cos, sin) pair, so each
+    refinement costs one ``hypot`` rather than a round of trigonometry.
+    """
+    p = np.hypot(x, y)
+    cos_term = p * _WGS84_B
+    sin_term = z * _WGS84_A
+    for _ in range(FAST_ENU_BOWRING_ITERATIONS):
+        scale = np.hypot(cos_term, sin_term)
+        cos_reduced = cos_term / scale
+        sin_reduced = sin_term / scale
+        numerator = z + _WGS84_EP2 * _WGS84_B * sin_reduced**3
+        denominator = p - _WGS84_E2 * _WGS84_A * cos_reduced**3
+        cos_term = denominator
+        sin_term = (1.0 - _WGS84_F) * numerator
+    return np.arctan2(numerator, denominator), np.arctan2(y, x)
+
+
+@dataclass(frozen=True, slots=True)
+class FastLocalEnuFrame:
+    """A pure NumPy stand-in for :class:`LocalEnuFrame` used by live previews.
+
+    The topocentric rotation is precomputed once and the inverse uses
+    Bowring's closed form, so no PROJ call is made per update. Over 0-100 km
+    offsets positions agree with :class:`LocalEnuFrame` to within
+    ``FAST_ENU_MAX_ERROR_M``; exports must still use the exact frame.
+    """
+
+    latitude: float
+    longitude: float
+    _origin: np.ndarray = field(init=False, repr=False, compare=False)
+    _rotation: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        latitude, longitude = _coordinate(self.latitude, self.longitude)
+        phi = math.radians(latitude)
+        lam = math.radians(longitude)
+        sin_phi, cos_phi = math.sin(phi), math.cos(phi)
+        sin_lam, cos_lam = math.sin(lam), math.cos(lam)
+        # Rows are the east, north and up unit vectors in ECEF.
+        rotation = np.array(
+            (
+                (-sin_lam, cos_lam, 0.0),
+                (-sin_phi * cos_lam, -sin_phi * sin_lam, cos_phi),
+                (cos_phi * cos_lam, cos_phi * sin_lam, sin_phi),
+            )
+        )
+        origin = np.array(
+            _geodetic_to_ecef(phi, lam, _NEUTRAL_ELLIPSOIDAL_HEIGHT_M),
+            dtype=np.float64,
+        )
+        rotation.flags.writeable = False
+        origin.flags.writeable = False
+        object.__setattr__(self, "latitude", latitude)
+        object.__setattr__(self, "longitude", longitude)
+        object.__setattr__(self, "_origin", origin)
+        object.__setattr__(self, "_rotation", rotation)
+
+    def to_enu_array(self, latitudes: object, longitudes: object) -> EnuBlock:
+        """Approximate :meth:`LocalEnuFrame.to_enu_array` with NumPy only."""
+        latitude, longitude = _coordinate_arrays(latitudes, longitudes)
+        x, y, z = _geodetic_to_ecef(
+            np.radians(latitude),
+            np.radians(longitude),
+            _NEUTRAL_ELLIPSOIDAL_HEIGHT_M,
+        )
+        east, north, up = self._rotation @ np.vstack(
+            (x - self._origin[0], y - self._origin[1], z - self._origin[2])
+        )
+        return EnuBlock(east, north, up)
+
+    def to_wgs84_array(
+        self,
+        east_m: object,
+        north_m: object,
+        up_m: object = 0.0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Approximate :meth:`LocalEnuFrame.to_wgs84_array` with NumPy only."""
+        east, north, up = _float_arrays(east_m, north_m, up_m, label="ENU positions")
+        _first_invalid(
+            ~(np.isfinite(east) & np.isfinite(north) & np.isfinite(up)),
+            EnuCoordinate,
+            east,
+            north,
+            up,
+        )
+        x, y, z = self._rotation.T @ np.vstack((east, north, up))
+        latitude, longitude = _ecef_to_geodetic(
+            x + self._origin[0],
+            y + self._origin[1],
+            z + self._origin[2],
+        )
+        latitude = np.degrees(latitude)
+        if np.any(np.abs(latitude) > 90.0):
+            raise ValueError("Latitude must be between -90 and 90 degrees.")
+        return latitude, _normalized_longitude(np.degrees(longitude))
+
+
+@dataclass(frozen=True, slots=True)
+class EnuFrameCacheInfo:
+    """Counters for the shared cache of frames and fused transpositions."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class _TransformCache:
+    """A bounded least-recently-used map of quantized keys to built transforms."""
+
+    def __init__(self, max_size: int) -> None:
+        self._entries: OrderedDict[tuple[float, ...], object] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple[float, ...], build):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+        # PROJ initialisation is the slow part, so it runs outside the lock.
+        # Two threads missing on one key both build it; the first stored wins.
+        entry = build()
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def info(self) -> EnuFrameCacheInfo:
+        with self._lock:
+            return EnuFrameCacheInfo(
+                self._hits,
+                self._misses,
+                len(self._entries),
+                self._max_size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_ENU_FRAME_CACHE = _TransformCache(ENU_FRAME_CACHE_SIZE)
+
+
+def _quantized_origin(latitude: float, longitude: float) -> tuple[float, float]:
+    return (
+        round(latitude, ENU_FRAME_ORIGIN_DECIMALS) + 0.0,
+        round(longitude, ENU_FRAME_ORIGIN_DECIMALS) + 0.0,
+    )
+
+
+def cached_local_enu_frame(latitude: float, longitude: float) -> LocalEnuFrame:
+    """Return a shared frame for an origin, building it on first use.
+
+    Origins are rounded to ``ENU_FRAME_ORIGIN_DECIMALS`` degrees (about
+    0.1 mm) and the frame is anchored at the rounded origin, so a lookup
+    never depends on which caller populated the cache first.
+    """
+    origin = _quantized_origin(*_coordinate(latitude, longitude))
+    return _ENU_FRAME_CACHE.get(origin, lambda: LocalEnuFrame(*origin))
+
+
+def enu_frame_cache_info() -> EnuFrameCacheInfo:
+    """Return hit/miss counters and occupancy of the shared frame cache."""
+    return _ENU_FRAME_CACHE.info()
+
+
+def clear_enu_frame_cache() -> None:
+    """Drop every cached frame and transposition and reset the counters."""
+    _ENU_FRAME_CACHE.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class EnuTransposition:
+    """One PROJ pipeline carrying WGS84 points from a source to a target ENU frame.
+
+    The pipeline chains geocentric conversion, the source topocentric frame,
+    an affine heading rotation, then the inverse target topocentric frame and
+    geocentric conversion, so a whole coordinate array moves in one call.
+    """
+
+    source_origin: tuple[float, float]
+    target_origin: tuple[float, float]
+    heading_delta_deg: float
+    _transformer: Transformer = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        source = _coordinate(*self.source_origin)
+        target = _coordinate(*self.target_origin)
+        heading_delta = _finite(self.heading_delta_deg, "Heading delta")
+        radians = math.radians(heading_delta)
+        cosine = math.cos(radians)
+        sine = math.sin(radians)
+        height = f"+h_0={_NEUTRAL_ELLIPSOIDAL_HEIGHT_M:.1f}"
+        pipeline = (
+            "+proj=pipeline "
+            "+step +proj=cart +ellps=WGS84 "
+            "+step +proj=topocentric +ellps=WGS84 "
+            f"+lat_0={source[0]:.17g} +lon_0={source[1]:.17g} {height} "
+            "+step +proj=affine "
+            f"+s11={cosine:.17g} +s12={sine:.17g} "
+            f"+s21={-sine:.17g} +s22={cosine:.17g} "
+            "+step +inv +proj=topocentric +ellps=WGS84 "
+            f"+lat_0={target[0]:.17g} +lon_0={target[1]:.17g} {height} "
+            "+step +inv +proj=cart +ellps=WGS84"
+        )
+        try:
+            transformer = Transformer.from_pipeline(pipeline)
+        except ProjError as error:
+            raise ValueError("WGS84 ENU transposition construction failed.") from error
+        object.__setattr__(self, "source_origin", source)
+        object.__setattr__(self, "target_origin", target)
+        object.__setattr__(self, "heading_delta_deg", heading_delta)
+        object.__setattr__(self, "_transformer", transformer)
+
+    def transform_array(
+        self,
+        latitudes: object,
+        longitudes: object,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Transpose WGS84 latitude/longitude arrays in one PROJ call."""
+        latitude, longitude = _coordinate_arrays(latitudes, longitudes)
+        try:
+            final_longitude, final_latitude, height = self._transformer.transform(
+                longitude,
+                latitude,
+                np.full_like(latitude, _NEUTRAL_ELLIPSOIDAL_HEIGHT_M),
+                errcheck=True,
+            )
+        except ProjError as error:
+            raise ValueError("WGS84 ENU transposition failed.") from error
+        final_latitude = np.asarray(final_latitude, dtype=np.float64)
+        final_longitude = np.asarray(final_longitude, dtype=np.float64)
+        if not (
+            np.isfinite(final_latitude).all()
+            and np.isfinite(final_longitude).all()
+            and np.isfinite(height).all()
+        ):
+            raise ValueError("WGS84 ENU transposition returned a non-finite result.")
+        if np.any(np.abs(final_latitude) > 90.0):
+            raise ValueError("Latitude must be between -90 and 90 degrees.")
+        return final_latitude, _normalized_longitude(final_longitude)
+
+
+def cached_enu_transposition(
+    source_origin: tuple[float, float],
+    target_origin: tuple[float, float],
+    heading_delta_deg: float,
+) -> EnuTransposition:
+    """Return a shared fused transposition, keyed like :func:`cached_local_enu_frame`."""
+    source = _quantized_origin(*_coordinate(*source_origin))
+    target = _quantized_origin(*_coordinate(*target_origin))
+    heading_delta = _finite(heading_delta_deg, "Heading delta") + 0.0
+    return _ENU_FRAME_CACHE.get(
+        (*source, *target, heading_delta),
+        lambda: EnuTransposition(source, target, heading_delta),
+    )
+
 
 def transpose_wgs84_enu_points(
     points: Iterable[tuple[float, float, float]],
@@ -176,38 +690,63 @@ def transpose_wgs84_enu_points(
     heading_delta_deg: float,
 ) -> tuple[tuple[float, float, float], ...]:
     """Move and rotate WGS84 points between two local runway ENU frames."""
-    source_frame = LocalEnuFrame(*source_origin)
-    target_frame = LocalEnuFrame(*target_origin)
-    heading_delta = math.radians(_finite(heading_delta_deg, "Heading delta"))
-    cosine = math.cos(heading_delta)
-    sine = math.sin(heading_delta)
-
-    transformed: list[tuple[float, float, float]] = []
-    for latitude, longitude, altitude in points:
-        preserved_altitude = _finite(altitude, "Route altitude")
-        source_position = source_frame.to_enu(latitude, longitude)
-        rotated_position = EnuCoordinate(
-            east_m=(
-                source_position.east_m * cosine
-                + source_position.north_m * sine
-            ),
-            north_m=(
-                -source_position.east_m * sine
-                + source_position.north_m * cosine
-            ),
-            up_m=source_position.up_m,
-        )
-        final_latitude, final_longitude = target_frame.to_wgs84(rotated_position)
-        transformed.append(
-            (final_latitude, final_longitude, preserved_altitude)
-        )
-    return tuple(transformed)
+    transposition = cached_enu_transposition(
+        source_origin,
+        target_origin,
+        heading_delta_deg,
+    )
 
+    rows = points if isinstance(points, (list, tuple)) else list(points)
+    if not len(rows):
+        return ()
+    try:
+        table = np.array(rows, dtype=np.float64)
+    except (TypeError, ValueError):
+        table = None
+    if table is not None and table.shape == (len(rows), 3):
+        latitudes, longitudes, altitudes = table.T
+    else:
+        # Ragged or non-numeric input: take the slow path for its exact message.
+        rows = [tuple(point) for point in rows]
+        if any(len(row) != 3 for row in rows):
+            raise ValueError(
+                "Route points must be latitude, longitude, altitude triples."
+            )
+        latitudes, longitudes, altitudes = _float_arrays(
+            *zip(*rows),
+            label="Route points",
+        )
+    _first_invalid(
+        ~np.isfinite(altitudes),
+        lambda value: _finite(value, "Route altitude"),
+        altitudes,
+    )
+    final_latitudes, final_longitudes = transposition.transform_array(
+        latitudes,
+        longitudes,
+    )
+    return tuple(
+        zip(final_latitudes.tolist(), final_longitudes.tolist(), altitudes.tolist())
+    )
 
 __all__ = [
+    "ENU_FRAME_CACHE_SIZE",
+    "ENU_FRAME_ORIGIN_DECIMALS",
+    "EnuBlock",
     "EnuCoordinate",
+    "EnuFrameCacheInfo",
+    "EnuTransposition",
+    "FAST_ENU_BOWRING_ITERATIONS",
+    "FAST_ENU_MAX_ERROR_M",
+    "FastLocalEnuFrame",
     "LocalEnuFrame",
+    "cached_enu_transposition",
+    "cached_local_enu_frame",
+    "clear_enu_frame_cache",
+    "enu_frame_cache_info",
     "destination_point",
+    "destination_point_array",
     "inverse_distance_bearing",
+    "inverse_distance_bearing_array",
     "transpose_wgs84_enu_points",
 ]
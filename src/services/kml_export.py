@@ -6,16 +6,19 @@ import math
 import os
 import re
 import tempfile
-import xml.etree.ElementTree as ET
+import threading
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Iterator
 
 
 KML_NAMESPACE = "http://www.opengis.net/kml/2.2"
 _STYLE_ID_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_.-]*\Z")
 _COLOUR_RE = re.compile(r"[0-9a-fA-F]{8}\Z")
 _ALTITUDE_MODES = frozenset({"absolute", "relativeToGround", "clampToGround"})
+KML_WRITE_CHUNK_SIZE = 64 * 1024
+_COORDINATES_PER_FRAGMENT = 1024
 
 
 @dataclass(frozen=True, slots=True)
@@ -24,6 +27,12 @@ class KmlCoordinate:
     latitude: float
     altitude_m: float
 
+    def __reduce__(self):
+        # Prepared traces cross process boundaries with hundreds of thousands
+        # of coordinates; constructor arguments pickle several times faster
+        # than the generic slots state.
+        return (KmlCoordinate, (self.longitude, self.latitude, self.altitude_m))
+
 
 @dataclass(frozen=True, slots=True)
 class KmlStyle:
@@ -66,15 +75,46 @@ class KmlPlacemark:
     description: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class KmlDocument:
     name: str | None
     styles: tuple[KmlStyle, ...]
     placemarks: tuple[KmlPlacemark, ...]
 
 
-def _qualified(name: str) -> str:
-    return f"{{{KML_NAMESPACE}}}{name}"
+class _DocumentIdentityMemo:
+    """Map live :class:`KmlDocument` objects, by identity, to a derived value.
+
+    Documents are immutable, so anything derived from one object stays valid
+    for that object's lifetime. Hashing a document would walk every
+    coordinate, so entries are keyed by ``id`` and guarded by a weak
+    reference that also evicts the entry once the document is collected.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref, object]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, document: KmlDocument, default=None):
+        entry = self._entries.get(id(document))
+        if entry is None or entry[0]() is not document:
+            return default
+        return entry[1]
+
+    def store(self, document: KmlDocument, value) -> None:
+        key = id(document)
+
+        def evict(reference, key=key):
+            with self._lock:
+                current = self._entries.get(key)
+                if current is not None and current[0] is reference:
+                    del self._entries[key]
+
+        with self._lock:
+            self._entries[key] = (weakref.ref(document, evict), value)
+
+
+_VALIDATED_DOCUMENTS = _DocumentIdentityMemo()
 
 
 def _validate_xml_text(value: str, field_name: str) -> None:
@@ -123,15 +163,17 @@ def _format_number(value: float, places: int) -> str:
 
 
 def _coordinate_text(coordinates: Iterable[KmlCoordinate]) -> str:
+    # Only validated documents are formatted, so the coordinates are known
+    # to be finite and in range here.
     return "\n".join(
         ",".join(
             (
-                _format_number(longitude, 7),
-                _format_number(latitude, 7),
-                _format_number(altitude, 3),
+                _format_number(float(coordinate.longitude), 7),
+                _format_number(float(coordinate.latitude), 7),
+                _format_number(float(coordinate.altitude_m), 3),
             )
         )
-        for longitude, latitude, altitude in map(_validated_coordinate, coordinates)
+        for coordinate in coordinates
     )
 
 
@@ -142,30 +184,35 @@ def _validate_altitude_mode(altitude_mode: str, *, extrude: bool) -> None:
         raise ValueError("A clampToGround line cannot be extended to the ground.")
 
 
-def _validated_line(line: KmlLineString) -> tuple[KmlCoordinate, ...]:
+def _validated_line(
+    line: KmlLineString, *, check_coordinates: bool = True
+) -> tuple[KmlCoordinate, ...]:
     _validate_altitude_mode(line.altitude_mode, extrude=line.extrude_to_ground)
     if len(line.coordinates) < 2:
         raise ValueError("A KML LineString requires at least two coordinates.")
-    for coordinate in line.coordinates:
-        _validated_coordinate(coordinate)
+    if check_coordinates:
+        for coordinate in line.coordinates:
+            _validated_coordinate(coordinate)
     return line.coordinates
 
 
-def _validated_ring(polygon: KmlPolygon) -> tuple[KmlCoordinate, ...]:
+def _validated_ring(
+    polygon: KmlPolygon, *, check_coordinates: bool = True
+) -> tuple[KmlCoordinate, ...]:
     _validate_altitude_mode(polygon.altitude_mode, extrude=False)
     points = polygon.outer_ring
     if len(points) < 3:
         raise ValueError("A KML LinearRing requires at least three vertices.")
-    for coordinate in points:
-        _validated_coordinate(coordinate)
-    if points[0] != points[-1]:
-        points = (*points, points[0])
+    if check_coordinates:
+        for coordinate in points:
+            _validated_coordinate(coordinate)
+    points = _closed_ring(points)
     if len(points) < 4:
         raise ValueError("A KML LinearRing requires at least four coordinates including closure.")
     return points
 
 
-def _validate_document(document: KmlDocument) -> set[str]:
+def _validate_document(document: KmlDocument, *, check_coordinates: bool = True) -> set[str]:
     if document.name is not None:
         _validate_xml_text(document.name, "document name")
     style_ids: set[str] = set()
@@ -181,68 +228,138 @@ def _validate_document(document: KmlDocument) -> set[str]:
         if not placemark.style_url.startswith("#") or placemark.style_url[1:] not in style_ids:
             raise ValueError(f'Placemark "{placemark.name}" references an unknown KML style.')
         if isinstance(placemark.geometry, KmlLineString):
-            _validated_line(placemark.geometry)
+            _validated_line(placemark.geometry, check_coordinates=check_coordinates)
         elif isinstance(placemark.geometry, KmlPolygon):
-            _validated_ring(placemark.geometry)
+            _validated_ring(placemark.geometry, check_coordinates=check_coordinates)
         else:
             raise TypeError("Unsupported KML geometry.")
     return style_ids
 
 
-def _append_style(parent: ET.Element, style: KmlStyle) -> None:
-    element = ET.SubElement(parent, _qualified("Style"), {"id": style.style_id})
-    line_style = ET.SubElement(element, _qualified("LineStyle"))
-    ET.SubElement(line_style, _qualified("color")).text = style.line_colour.lower()
-    ET.SubElement(line_style, _qualified("width")).text = _format_number(float(style.line_width), 3).rstrip("0").rstrip(".")
+def validate_kml_document(document: KmlDocument) -> KmlDocument:
+    """Check ``document`` against the exporter's rules, once per object.
+
+    The document is returned unchanged. A document object that has already
+    passed is not walked again, so the preview and export paths can share a
+    single check of the same canonical document.
+    """
+    if not isinstance(document, KmlDocument):
+        raise TypeError("document must be a KmlDocument.")
+    if _VALIDATED_DOCUMENTS.get(document) is None:
+        _validate_document(document)
+        _VALIDATED_DOCUMENTS.store(document, True)
+    return document
+
+
+def _accept_checked_coordinates(document: KmlDocument) -> KmlDocument:
+    """Validate a document whose coordinates the caller has already checked."""
+    if _VALIDATED_DOCUMENTS.get(document) is None:
+        _validate_document(document, check_coordinates=False)
+        _VALIDATED_DOCUMENTS.store(document, True)
+    return document
+
+
+def _escape_text(value: str) -> str:
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _text_element(tag: str, value: str) -> str:
+    return f"<{tag}>{_escape_text(value)}</{tag}>"
+
+
+def _style_text(style: KmlStyle) -> str:
+    width = _format_number(float(style.line_width), 3).rstrip("0").rstrip(".")
+    parts = [
+        f'<Style id="{_escape_text(style.style_id)}"><LineStyle>',
+        _text_element("color", style.line_colour.lower()),
+        _text_element("width", width),
+        "</LineStyle>",
+    ]
     if style.poly_colour is not None:
-        poly_style = ET.SubElement(element, _qualified("PolyStyle"))
-        ET.SubElement(poly_style, _qualified("color")).text = style.poly_colour.lower()
+        parts.append(f"<PolyStyle>{_text_element('color', style.poly_colour.lower())}</PolyStyle>")
+    parts.append("</Style>")
+    return "".join(parts)
+
 
+def _closed_ring(points: tuple[KmlCoordinate, ...]) -> tuple[KmlCoordinate, ...]:
+    return points if points[0] == points[-1] else (*points, points[0])
 
-def _append_geometry(parent: ET.Element, geometry: KmlGeometry) -> None:
+
+def _coordinate_fragments(coordinates: tuple[KmlCoordinate, ...]) -> Iterator[tuple[str, int]]:
+    for start in range(0, len(coordinates), _COORDINATES_PER_FRAGMENT):
+        batch = coordinates[start : start + _COORDINATES_PER_FRAGMENT]
+        text = _coordinate_text(batch)
+        yield (f"\n{text}" if start else text), len(batch)
+
+
+def _geometry_fragments(geometry: KmlGeometry) -> Iterator[tuple[str, int]]:
     if isinstance(geometry, KmlLineString):
-        line = ET.SubElement(parent, _qualified("LineString"))
+        header = ["<LineString>"]
         if geometry.extrude_to_ground:
-            ET.SubElement(line, _qualified("extrude")).text = "1"
-        ET.SubElement(line, _qualified("tessellate")).text = "1" if geometry.tessellate else "0"
-        ET.SubElement(line, _qualified("altitudeMode")).text = geometry.altitude_mode
-        ET.SubElement(line, _qualified("coordinates")).text = _coordinate_text(_validated_line(geometry))
+            header.append("<extrude>1</extrude>")
+        header.append(f"<tessellate>{'1' if geometry.tessellate else '0'}</tessellate>")
+        header.append(_text_element("altitudeMode", geometry.altitude_mode))
+        header.append("<coordinates>")
+        yield "".join(header), 0
+        yield from _coordinate_fragments(geometry.coordinates)
+        yield "</coordinates></LineString>", 0
         return
 
-    polygon = ET.SubElement(parent, _qualified("Polygon"))
-    ET.SubElement(polygon, _qualified("altitudeMode")).text = geometry.altitude_mode
-    outer_boundary = ET.SubElement(polygon, _qualified("outerBoundaryIs"))
-    ring = ET.SubElement(outer_boundary, _qualified("LinearRing"))
-    ET.SubElement(ring, _qualified("coordinates")).text = _coordinate_text(_validated_ring(geometry))
+    yield (
+        f"<Polygon>{_text_element('altitudeMode', geometry.altitude_mode)}"
+        "<outerBoundaryIs><LinearRing><coordinates>"
+    ), 0
+    yield from _coordinate_fragments(_closed_ring(geometry.outer_ring))
+    yield "</coordinates></LinearRing></outerBoundaryIs></Polygon>", 0
 
 
-def render_kml(document: KmlDocument) -> str:
-    """Render a validated KML 2.2 document without writing it to disk."""
-    _validate_document(document)
-    ET.register_namespace("", KML_NAMESPACE)
-    root = ET.Element(_qualified("kml"))
-    document_element = ET.SubElement(root, _qualified("Document"))
+def _document_fragments(document: KmlDocument) -> Iterator[tuple[str, int]]:
+    """Yield ``(text, coordinate count)`` pieces of an already validated document.
+
+    The markup matches what :mod:`xml.etree.ElementTree` serialises for the
+    same tree with ``short_empty_elements=False``, so files written in chunks
+    are byte-for-byte identical to earlier whole-string renders.
+    """
+    yield f"<?xml version='1.0' encoding='utf-8'?>\n<kml xmlns=\"{KML_NAMESPACE}\"><Document>", 0
     if document.name is not None:
-        ET.SubElement(document_element, _qualified("name")).text = document.name
+        yield _text_element("name", document.name), 0
     for style in document.styles:
-        _append_style(document_element, style)
+        yield _style_text(style), 0
     for placemark in document.placemarks:
-        placemark_element = ET.SubElement(document_element, _qualified("Placemark"))
-        ET.SubElement(placemark_element, _qualified("name")).text = placemark.name
+        header = ["<Placemark>", _text_element("name", placemark.name)]
         if placemark.description is not None:
-            ET.SubElement(placemark_element, _qualified("description")).text = placemark.description
-        ET.SubElement(placemark_element, _qualified("styleUrl")).text = placemark.style_url
-        _append_geometry(placemark_element, placemark.geometry)
-    return ET.tostring(root, encoding="unicode", xml_declaration=True, short_empty_elements=False) + "\n"
+            header.append(_text_element("description", placemark.description))
+        header.append(_text_element("styleUrl", placemark.style_url))
+        yield "".join(header), 0
+        yield from _geometry_fragments(placemark.geometry)
+        yield "</Placemark>", 0
+    yield "</Document></kml>\n", 0
+
+
+def _document_chunks(
+    document: KmlDocument, chunk_size: int = KML_WRITE_CHUNK_SIZE
+) -> Iterator[tuple[str, int]]:
+    """Group document fragments into chunks of at least ``chunk_size`` characters."""
+    pending: list[str] = []
+    pending_size = 0
+    pending_coordinates = 0
+    for text, coordinate_count in _document_fragments(document):
+        pending.append(text)
+        pending_size += len(text)
+        pending_coordinates += coordinate_count
+        if pending_size >= chunk_size:
+            yield "".join(pending), pending_coordinates
+            pending.clear()
+            pending_size = 0
+            pending_coordinates = 0
+    if pending:
+        yield "".join(pending), pending_coordinates
 
 
-def _exported_coordinates(document: KmlDocument) -> Iterable[KmlCoordinate]:
-    for placemark in document.placemarks:
-        geometry = placemark.geometry
-        if isinstance(geometry, KmlLineString):
-            yield from geometry.coordinates
-        else:
-            yield from _validated_ring(geometry)
+def render_kml(document: KmlDocument) -> str:
+    """Render a validated KML 2.2 document without writing it to disk."""
+    validate_kml_document(document)
+    return "".join(text for text, _ in _document_fragments(document))
 
 
 def _raise_if_cancelled(cancellation_check: Callable[[], bool] | None) -> None:
@@ -257,18 +374,20 @@ def export_kml(
     overwrite: bool,
     cancellation_check: Callable[[], bool] | None = None,
     coordinate_callback: Callable[[], None] | None = None,
+    bytes_callback: Callable[[int], None] | None = None,
 ) -> None:
     """Atomically publish a rendered KML file in its destination directory.
 
-    ``overwrite=False`` creates the destination atomically and raises
-    :class:`FileExistsError` if another writer has already claimed it.
+    The document is validated up front and then streamed into a staging file
+    in :data:`KML_WRITE_CHUNK_SIZE` chunks, so memory stays flat however many
+    coordinates it holds. ``coordinate_callback`` fires once per coordinate
+    and ``bytes_callback`` with the running byte total, both after the chunk
+    carrying them has been written. ``overwrite=False`` creates the
+    destination atomically and raises :class:`FileExistsError` if another
+    writer has already claimed it.
     """
-    rendered = render_kml(document)
+    validate_kml_document(document)
     _raise_if_cancelled(cancellation_check)
-    for _ in _exported_coordinates(document):
-        if coordinate_callback is not None:
-            coordinate_callback()
-        _raise_if_cancelled(cancellation_check)
 
     destination = Path(file_path)
     descriptor, temporary_name = tempfile.mkstemp(
@@ -278,8 +397,16 @@ def export_kml(
     )
     temporary_path = Path(temporary_name)
     try:
-        with os.fdopen(descriptor, "w", encoding="utf-8", newline="\n") as output:
-            output.write(rendered)
+        with os.fdopen(descriptor, "wb") as output:
+            written = 0
+            for text, coordinate_count in _document_chunks(document):
+                written += output.write(text.encode("utf-8"))
+                if coordinate_callback is not None:
+                    for _ in range(coordinate_count):
+                        coordinate_callback()
+                if bytes_callback is not None:
+                    bytes_callback(written)
+                _raise_if_cancelled(cancellation_check)
             output.flush()
             os.fsync(output.fileno())
         _raise_if_cancelled(cancellation_check)
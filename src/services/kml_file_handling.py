@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import chain
 import math
+import operator
 import os
 import re
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 import xml.etree.ElementTree as ET
 
+import numpy as np
+
 
 KML_NAMESPACE = "http://www.opengis.net/kml/2.2"
 GX_NAMESPACE = "http://www.google.com/kml/ext/2.2"
 _COLOUR_RE = re.compile(r"[0-9a-fA-F]{8}\Z")
+_UTC_OFFSET_RE = re.compile(r"(?:Z|([+-])(\d{2}):?(\d{2}))\Z")
 
 
 class KmlParseError(ValueError):
@@ -42,29 +48,262 @@ class KmlPoint:
     timestamp: str | None = None
 
 
+def _timestamp_array(texts: Sequence[str | None]) -> np.ndarray:
+    """Convert KML ``when`` texts to UTC ``datetime64[us]``; unreadable values are NaT."""
+    if all(text is not None and text.endswith("Z") and "T" in text for text in texts):
+        try:
+            return np.array([text[:-1] for text in texts], dtype="datetime64[us]")
+        except ValueError:
+            pass
+    offsets = np.zeros(len(texts), dtype="timedelta64[m]")
+    local: list[str] = []
+    for index, text in enumerate(texts):
+        if text is None:
+            local.append("NaT")
+            continue
+        match = _UTC_OFFSET_RE.search(text) if "T" in text else None
+        if match is None:
+            local.append(text)
+            continue
+        local.append(text[: match.start()])
+        if match.group(1):
+            minutes = int(match.group(2)) * 60 + int(match.group(3))
+            offsets[index] = -minutes if match.group(1) == "+" else minutes
+    try:
+        values = np.array(local, dtype="datetime64[us]")
+    except ValueError:
+        values = np.empty(len(local), dtype="datetime64[us]")
+        for index, text in enumerate(local):
+            try:
+                values[index] = np.datetime64(text, "us")
+            except ValueError:
+                values[index] = np.datetime64("NaT")
+    return values + offsets
+
+
+class KmlTrackPoints(Sequence[KmlPoint]):
+    """Columnar track coordinates with a lazy :class:`KmlPoint` sequence view.
+
+    Columns are read-only float64 arrays. Missing altitudes are NaN in
+    ``altitudes`` and ``False`` in ``altitude_present``. ``timestamps`` is a
+    UTC ``datetime64[us]`` array, or ``None`` when the track has no times;
+    the original ``when`` text is kept for :attr:`KmlPoint.timestamp`.
+    """
+
+    __slots__ = (
+        "latitudes",
+        "longitudes",
+        "altitudes",
+        "altitude_present",
+        "timestamps",
+        "_timestamp_texts",
+    )
+
+    def __init__(
+        self,
+        latitudes: object,
+        longitudes: object,
+        altitudes: object,
+        altitude_present: object,
+        timestamp_texts: Sequence[str | None] | None = None,
+    ) -> None:
+        columns = [
+            np.array(latitudes, dtype=np.float64),
+            np.array(longitudes, dtype=np.float64),
+            np.array(altitudes, dtype=np.float64),
+            np.array(altitude_present, dtype=bool),
+        ]
+        count = columns[0].shape
+        if len(count) != 1 or any(column.shape != count for column in columns):
+            raise ValueError("Track columns must be equal-length one-dimensional arrays.")
+        if timestamp_texts is not None:
+            timestamp_texts = tuple(timestamp_texts)
+            if len(timestamp_texts) != count[0]:
+                raise ValueError("Track timestamps must match the coordinate count.")
+            if all(text is None for text in timestamp_texts):
+                timestamp_texts = None
+        columns[2][~columns[3]] = np.nan
+        timestamps = (
+            _timestamp_array(timestamp_texts) if timestamp_texts is not None else None
+        )
+        for column in (*columns, timestamps):
+            if column is not None:
+                column.flags.writeable = False
+        (
+            self.latitudes,
+            self.longitudes,
+            self.altitudes,
+            self.altitude_present,
+        ) = columns
+        self.timestamps = timestamps
+        self._timestamp_texts = timestamp_texts
+
+    @classmethod
+    def from_points(cls, points: Sequence[KmlPoint]) -> KmlTrackPoints:
+        """Build columns from a sequence of :class:`KmlPoint` values."""
+        if isinstance(points, KmlTrackPoints):
+            return points
+        points = tuple(points)
+        timestamps = [point.timestamp for point in points]
+        return cls(
+            [point.latitude for point in points],
+            [point.longitude for point in points],
+            [
+                point.altitude_m if point.altitude_m is not None else math.nan
+                for point in points
+            ],
+            [point.altitude_m is not None for point in points],
+            timestamps,
+        )
+
+    @property
+    def timestamp_texts(self) -> tuple[str | None, ...] | None:
+        """The original ``when`` text of each point, or ``None``."""
+        return self._timestamp_texts
+
+    def __len__(self) -> int:
+        return self.latitudes.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[position] for position in range(*index.indices(len(self))))
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("track point index out of range")
+        return KmlPoint(
+            latitude=float(self.latitudes[index]),
+            longitude=float(self.longitudes[index]),
+            altitude_m=(
+                float(self.altitudes[index]) if self.altitude_present[index] else None
+            ),
+            timestamp=(
+                self._timestamp_texts[index]
+                if self._timestamp_texts is not None
+                else None
+            ),
+        )
+
+    def __iter__(self) -> Iterator[KmlPoint]:
+        texts = self._timestamp_texts or (None,) * len(self)
+        for latitude, longitude, altitude, present, timestamp in zip(
+            self.latitudes.tolist(),
+            self.longitudes.tolist(),
+            self.altitudes.tolist(),
+            self.altitude_present.tolist(),
+            texts,
+        ):
+            yield KmlPoint(latitude, longitude, altitude if present else None, timestamp)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (KmlTrackPoints, tuple, list)):
+            return NotImplemented
+        return len(self) == len(other) and tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"KmlTrackPoints({len(self)} points)"
+
+
 @dataclass(frozen=True, slots=True)
 class KmlTrack:
-    """The single flight-path geometry selected from a KML document."""
+    """The single flight-path geometry selected from a KML document.
 
-    points: tuple[KmlPoint, ...]
+    ``points`` accepts any sequence of :class:`KmlPoint` and is stored as
+    :class:`KmlTrackPoints`, so the coordinate columns are always available.
+    """
+
+    points: KmlTrackPoints
     geometry_kind: Literal["line_string", "gx_track"]
     placemark_name: str | None
     altitude_mode: str = "clampToGround"
     source_line_colour: str | None = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "points", KmlTrackPoints.from_points(self.points))
+
+    @property
+    def latitudes(self) -> np.ndarray:
+        return self.points.latitudes
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        return self.points.longitudes
+
+    @property
+    def altitudes(self) -> np.ndarray:
+        return self.points.altitudes
+
+    @property
+    def altitude_present(self) -> np.ndarray:
+        return self.points.altitude_present
+
+    @property
+    def timestamps(self) -> np.ndarray | None:
+        return self.points.timestamps
+
+
+@dataclass(slots=True)
+class _PlacemarkRecord:
+    """The parts of a Placemark kept after its subtree has been released."""
+
+    name: str | None = None
+    name_seen: bool = False
+    inline_styles: list[ET.Element] = field(default_factory=list)
+    style_urls: list[str | None] = field(default_factory=list)
+    geometries: list[_GeometryRecord] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _GeometryRecord:
+    """A LineString or gx:Track reduced to the text of the children it needs.
+
+    Texts are grouped by :func:`_geometry_child_key`, in document order.
+    """
+
+    geometry_kind: Literal["line_string", "gx_track"]
+    children: dict[str, list[str | None]] = field(default_factory=dict)
+
 
 @dataclass(frozen=True, slots=True)
 class _TrackCandidate:
-    element: ET.Element
-    placemark: ET.Element
+    geometry: _GeometryRecord
+    placemark: _PlacemarkRecord
     geometry_kind: Literal["line_string", "gx_track"]
     placemark_name: str | None
 
+    def child_texts(self, key: str) -> list[str | None]:
+        return self.geometry.children.get(key, [])
+
 
 def _qualified(namespace: str, local_name: str) -> str:
     return f"{{{namespace}}}{local_name}" if namespace else local_name
 
 
+_WHEN_KEY = "when"
+_ALTITUDE_MODE_KEY = "altitudeMode"
+
+
+def _geometry_child_keys(namespace: str) -> dict[str, str]:
+    """Map the direct-child tags read from a geometry onto grouping keys.
+
+    Tags that are read together (``when`` with or without the KML namespace,
+    and both altitude-mode spellings) share one key so their document order
+    survives grouping.
+    """
+    return {
+        _qualified(namespace, "coordinates"): _qualified(namespace, "coordinates"),
+        _qualified(GX_NAMESPACE, "coord"): _qualified(GX_NAMESPACE, "coord"),
+        _qualified(KML_NAMESPACE, "when"): _WHEN_KEY,
+        "when": _WHEN_KEY,
+        _qualified(namespace, "altitudeMode"): _ALTITUDE_MODE_KEY,
+        _qualified(GX_NAMESPACE, "altitudeMode"): _ALTITUDE_MODE_KEY,
+    }
+
+
 def _split_tag(tag: str) -> tuple[str, str]:
     if tag.startswith("{"):
         namespace, local_name = tag[1:].split("}", 1)
@@ -72,15 +311,6 @@ def _split_tag(tag: str) -> tuple[str, str]:
     return "", tag
 
 
-def _placemark_name(placemark: ET.Element, namespace: str) -> str | None:
-    name_tag = _qualified(namespace, "name")
-    for child in placemark:
-        if child.tag == name_tag and child.text:
-            name = child.text.strip()
-            return name or None
-    return None
-
-
 def _direct_children(element: ET.Element, tag: str) -> list[ET.Element]:
     return [child for child in element if child.tag == tag]
 
@@ -117,27 +347,8 @@ def _style_line_colour(
     return True, colour.lower()
 
 
-def _style_selectors_by_id(
-    root: ET.Element,
-    namespace: str,
-) -> dict[str, ET.Element | None]:
-    selector_tags = {
-        _qualified(namespace, "Style"),
-        _qualified(namespace, "StyleMap"),
-    }
-    selectors: dict[str, ET.Element | None] = {}
-    for element in root.iter():
-        if element.tag not in selector_tags:
-            continue
-        style_id = element.get("id")
-        if not style_id:
-            continue
-        selectors[style_id] = element if style_id not in selectors else None
-    return selectors
-
-
-def _local_style_id(style_url: ET.Element | None) -> str | None:
-    value = (style_url.text or "").strip() if style_url is not None else ""
+def _local_style_id(style_url: str | None) -> str | None:
+    value = (style_url or "").strip()
     if not value.startswith("#") or len(value) == 1 or "#" in value[1:]:
         return None
     return value[1:]
@@ -176,7 +387,7 @@ def _resolve_style_selector_colour(
     style_urls = _direct_children(pair, _qualified(namespace, "styleUrl"))
     if len(style_urls) != 1:
         return None
-    style_id = _local_style_id(style_urls[0])
+    style_id = _local_style_id(style_urls[0].text)
     if style_id is None or style_id in visited:
         return None
     referenced = selectors.get(style_id)
@@ -191,25 +402,22 @@ def _resolve_style_selector_colour(
 
 
 def _placemark_line_colour(
-    root: ET.Element,
-    placemark: ET.Element,
+    placemark: _PlacemarkRecord,
     namespace: str,
+    selectors: dict[str, ET.Element | None],
 ) -> str | None:
-    inline_styles = _direct_children(placemark, _qualified(namespace, "Style"))
-    if len(inline_styles) > 1:
+    if len(placemark.inline_styles) > 1:
         return None
-    if inline_styles:
-        declared, colour = _style_line_colour(inline_styles[0], namespace)
+    if placemark.inline_styles:
+        declared, colour = _style_line_colour(placemark.inline_styles[0], namespace)
         if declared:
             return colour
 
-    style_urls = _direct_children(placemark, _qualified(namespace, "styleUrl"))
-    if len(style_urls) != 1:
+    if len(placemark.style_urls) != 1:
         return None
-    style_id = _local_style_id(style_urls[0])
+    style_id = _local_style_id(placemark.style_urls[0])
     if style_id is None:
         return None
-    selectors = _style_selectors_by_id(root, namespace)
     selector = selectors.get(style_id)
     if selector is None:
         return None
@@ -280,23 +488,53 @@ def _make_point(
     return KmlPoint(latitude=latitude, longitude=longitude, altitude_m=altitude)
 
 
-def _parse_line_string(
-    path: Path,
-    candidate: _TrackCandidate,
-    namespace: str,
-) -> tuple[KmlPoint, ...]:
-    coordinates_tag = _qualified(namespace, "coordinates")
-    containers = [child for child in candidate.element if child.tag == coordinates_tag]
-    if len(containers) != 1:
-        raise KmlStructureError(
-            f"{_context(path, candidate)}: expected exactly one coordinates element, found {len(containers)}."
+def _columns_are_valid(
+    longitudes: np.ndarray,
+    latitudes: np.ndarray,
+    altitudes: np.ndarray,
+    altitude_present: np.ndarray,
+) -> bool:
+    return bool(
+        np.isfinite(longitudes).all()
+        and np.isfinite(latitudes).all()
+        and np.isfinite(altitudes[altitude_present]).all()
+        and (np.abs(longitudes) <= 180.0).all()
+        and (np.abs(latitudes) <= 90.0).all()
+    )
+
+
+def _line_string_columns(
+    tokens: list[str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """Bulk-convert LineString tokens, or return ``None`` if any token is bad."""
+    widths = np.fromiter(
+        (token.count(",") + 1 for token in tokens),
+        dtype=np.intp,
+        count=len(tokens),
+    )
+    if not ((widths == 2) | (widths == 3)).all():
+        return None
+    try:
+        # float("") raises, so empty components fall back to the checked path.
+        numbers = np.fromiter(
+            map(float, chain.from_iterable(token.split(",") for token in tokens)),
+            dtype=np.float64,
+            count=int(widths.sum()),
         )
+    except ValueError:
+        return None
+    starts = np.cumsum(widths) - widths
+    altitude_present = widths == 3
+    altitudes = np.full(len(tokens), math.nan)
+    altitudes[altitude_present] = numbers[starts[altitude_present] + 2]
+    return numbers[starts], numbers[starts + 1], altitudes, altitude_present
 
-    text = containers[0].text
-    tokens = text.split() if text else []
-    if not tokens:
-        raise KmlCoordinateError(f"{_context(path, candidate)}: coordinates element is empty.")
 
+def _checked_line_string(
+    path: Path,
+    candidate: _TrackCandidate,
+    tokens: list[str],
+) -> tuple[KmlPoint, ...]:
     points: list[KmlPoint] = []
     for index, token in enumerate(tokens, start=1):
         values = token.split(",")
@@ -309,6 +547,30 @@ def _parse_line_string(
     return tuple(points)
 
 
+def _parse_line_string(
+    path: Path,
+    candidate: _TrackCandidate,
+    namespace: str,
+) -> KmlTrackPoints:
+    containers = candidate.child_texts(_qualified(namespace, "coordinates"))
+    if len(containers) != 1:
+        raise KmlStructureError(
+            f"{_context(path, candidate)}: expected exactly one coordinates element, found {len(containers)}."
+        )
+
+    text = containers[0]
+    tokens = text.split() if text else []
+    if not tokens:
+        raise KmlCoordinateError(f"{_context(path, candidate)}: coordinates element is empty.")
+
+    columns = _line_string_columns(tokens)
+    if columns is None or not _columns_are_valid(*columns):
+        # Walk the tokens one at a time to report the first bad coordinate.
+        return KmlTrackPoints.from_points(_checked_line_string(path, candidate, tokens))
+    longitudes, latitudes, altitudes, altitude_present = columns
+    return KmlTrackPoints(latitudes, longitudes, altitudes, altitude_present)
+
+
 def _altitude_mode(
     path: Path,
     candidate: _TrackCandidate,
@@ -321,13 +583,9 @@ def _altitude_mode(
         "relativeToSeaFloor",
         "clampToSeaFloor",
     }
-    tags = {
-        _qualified(namespace, "altitudeMode"),
-        _qualified(GX_NAMESPACE, "altitudeMode"),
-    }
-    for child in candidate.element:
-        if child.tag in tags and child.text:
-            value = child.text.strip()
+    for text in candidate.child_texts(_ALTITUDE_MODE_KEY):
+        if text:
+            value = text.strip()
             if value in supported:
                 return value
             raise KmlStructureError(
@@ -336,24 +594,29 @@ def _altitude_mode(
     return "clampToGround"
 
 
-def _parse_gx_track(path: Path, candidate: _TrackCandidate) -> tuple[KmlPoint, ...]:
-    coord_tag = _qualified(GX_NAMESPACE, "coord")
-    elements = [child for child in candidate.element if child.tag == coord_tag]
-    if not elements:
-        raise KmlCoordinateError(f"{_context(path, candidate)}: gx:Track contains no gx:coord elements.")
+def _gx_track_columns(coords: list[str | None]) -> np.ndarray | None:
+    """Bulk-convert gx:coord texts to an (n, 3) array, or ``None`` if any is bad."""
+    if not all(coords) or any(len(coord.split()) != 3 for coord in coords):
+        return None
+    try:
+        numbers = np.fromiter(
+            map(float, chain.from_iterable(map(str.split, coords))),
+            dtype=np.float64,
+            count=3 * len(coords),
+        )
+    except ValueError:
+        return None
+    return numbers.reshape(len(coords), 3)
 
-    when_tags = {_qualified(KML_NAMESPACE, "when"), "when"}
-    timestamps = [
-        child.text.strip() if child.text and child.text.strip() else None
-        for child in candidate.element
-        if child.tag in when_tags
-    ]
-    if len(timestamps) != len(elements):
-        timestamps = [None] * len(elements)
 
+def _checked_gx_track(
+    path: Path,
+    candidate: _TrackCandidate,
+    coords: list[str | None],
+) -> tuple[KmlPoint, ...]:
     points: list[KmlPoint] = []
-    for index, element in enumerate(elements, start=1):
-        text = element.text.strip() if element.text else ""
+    for index, coord in enumerate(coords, start=1):
+        text = coord.strip() if coord else ""
         if not text:
             raise KmlCoordinateError(
                 f"{_context(path, candidate, index)}: empty gx:coord values require "
@@ -364,18 +627,126 @@ def _parse_gx_track(path: Path, candidate: _TrackCandidate) -> tuple[KmlPoint, .
             raise KmlCoordinateError(
                 f'{_context(path, candidate, index)}: "{text}" must contain longitude latitude altitude.'
             )
-        point = _make_point(values, path, candidate, index)
-        points.append(
-            KmlPoint(
-                latitude=point.latitude,
-                longitude=point.longitude,
-                altitude_m=point.altitude_m,
-                timestamp=timestamps[index - 1],
-            )
-        )
+        points.append(_make_point(values, path, candidate, index))
     return tuple(points)
 
 
+def _parse_gx_track(path: Path, candidate: _TrackCandidate) -> KmlTrackPoints:
+    coords = candidate.child_texts(_qualified(GX_NAMESPACE, "coord"))
+    if not coords:
+        raise KmlCoordinateError(f"{_context(path, candidate)}: gx:Track contains no gx:coord elements.")
+
+    timestamps = [
+        text.strip() if text and text.strip() else None
+        for text in candidate.child_texts(_WHEN_KEY)
+    ]
+    if len(timestamps) != len(coords):
+        timestamps = [None] * len(coords)
+
+    table = _gx_track_columns(coords)
+    present = np.ones(len(coords), dtype=bool)
+    if table is None or not _columns_are_valid(table[:, 0], table[:, 1], table[:, 2], present):
+        # Walk the coordinates one at a time to report the first bad one.
+        points = _checked_gx_track(path, candidate, coords)
+        table = np.array(
+            [(point.longitude, point.latitude, point.altitude_m) for point in points],
+            dtype=np.float64,
+        )
+    return KmlTrackPoints(table[:, 1], table[:, 0], table[:, 2], present, timestamps)
+
+
+def _stream_kml(
+    path: Path,
+) -> tuple[ET.Element, list[_PlacemarkRecord], dict[str, ET.Element | None]]:
+    """Read a KML file in one streaming pass, releasing elements once consumed.
+
+    Only the root, Style/StyleMap subtrees and the direct-child text of
+    LineString and gx:Track elements outlive their end tag, so memory tracks
+    the coordinate text rather than the whole element tree. Placemarks are
+    returned in document order, and a geometry inside nested Placemarks is
+    listed under each of them, matching ``Element.iter`` traversal.
+    """
+    root: ET.Element | None = None
+    namespace = ""
+    placemark_tag = line_string_tag = name_tag = style_tag = style_url_tag = ""
+    selector_tags: set[str] = set()
+    child_keys: dict[str, str] = {}
+    gx_track_tag = _qualified(GX_NAMESPACE, "Track")
+
+    stack: list[ET.Element] = []
+    open_placemarks: list[tuple[ET.Element, _PlacemarkRecord]] = []
+    open_geometries: list[tuple[ET.Element, _GeometryRecord]] = []
+    placemarks: list[_PlacemarkRecord] = []
+    selectors: dict[str, ET.Element | None] = {}
+    selector_depth = 0
+
+    try:
+        for event, element in ET.iterparse(path, events=("start", "end")):
+            tag = element.tag
+            if event == "start":
+                if root is None:
+                    root = element
+                    namespace, _ = _split_tag(tag)
+                    placemark_tag = _qualified(namespace, "Placemark")
+                    line_string_tag = _qualified(namespace, "LineString")
+                    name_tag = _qualified(namespace, "name")
+                    style_tag = _qualified(namespace, "Style")
+                    style_url_tag = _qualified(namespace, "styleUrl")
+                    selector_tags = {style_tag, _qualified(namespace, "StyleMap")}
+                    child_keys = _geometry_child_keys(namespace)
+                stack.append(element)
+                if tag in selector_tags:
+                    selector_depth += 1
+                elif tag == placemark_tag:
+                    record = _PlacemarkRecord()
+                    placemarks.append(record)
+                    open_placemarks.append((element, record))
+                elif tag == line_string_tag or tag == gx_track_tag:
+                    geometry = _GeometryRecord(
+                        "line_string" if tag == line_string_tag else "gx_track"
+                    )
+                    for _, record in open_placemarks:
+                        record.geometries.append(geometry)
+                    open_geometries.append((element, geometry))
+                continue
+
+            stack.pop()
+            parent = stack[-1] if stack else None
+            if open_geometries and open_geometries[-1][0] is element:
+                open_geometries.pop()
+            if open_placemarks and open_placemarks[-1][0] is element:
+                open_placemarks.pop()
+            if open_geometries and open_geometries[-1][0] is parent:
+                key = child_keys.get(tag)
+                if key is not None:
+                    open_geometries[-1][1].children.setdefault(key, []).append(
+                        element.text
+                    )
+            if open_placemarks and open_placemarks[-1][0] is parent:
+                record = open_placemarks[-1][1]
+                if tag == name_tag and element.text and not record.name_seen:
+                    record.name = element.text.strip() or None
+                    record.name_seen = True
+                elif tag == style_tag:
+                    record.inline_styles.append(element)
+                elif tag == style_url_tag:
+                    record.style_urls.append(element.text)
+
+            if tag in selector_tags:
+                selector_depth -= 1
+                style_id = element.get("id")
+                if style_id:
+                    selectors[style_id] = element if style_id not in selectors else None
+                continue
+            if parent is not None and selector_depth == 0:
+                parent.remove(element)
+    except ET.ParseError as exc:
+        line, column = getattr(exc, "position", (None, None))
+        location = f" at line {line}, column {column}" if line is not None else ""
+        raise KmlXmlError(f"{path.name}: invalid XML{location}: {exc}.") from exc
+    return root, placemarks, selectors
+
+
 def parse_kml_track(file_path: str | os.PathLike[str]) -> KmlTrack:
     """Parse exactly one KML LineString or gx:Track into a shared track model.
 
@@ -387,12 +758,7 @@ def parse_kml_track(file_path: str | os.PathLike[str]) -> KmlTrack:
     if path.suffix.lower() == ".kmz":
         raise KmlStructureError(f"{path.name}: KMZ archives are not supported; select a KML file.")
 
-    try:
-        root = ET.parse(path).getroot()
-    except ET.ParseError as exc:
-        line, column = getattr(exc, "position", (None, None))
-        location = f" at line {line}, column {column}" if line is not None else ""
-        raise KmlXmlError(f"{path.name}: invalid XML{location}: {exc}.") from exc
+    root, placemarks, selectors = _stream_kml(path)
 
     namespace, local_name = _split_tag(root.tag)
     if local_name != "kml":
@@ -400,18 +766,11 @@ def parse_kml_track(file_path: str | os.PathLike[str]) -> KmlTrack:
     if namespace not in ("", KML_NAMESPACE):
         raise KmlStructureError(f'{path.name}: unsupported KML namespace "{namespace}".')
 
-    placemark_tag = _qualified(namespace, "Placemark")
-    line_string_tag = _qualified(namespace, "LineString")
-    gx_track_tag = _qualified(GX_NAMESPACE, "Track")
-    candidates: list[_TrackCandidate] = []
-
-    for placemark in root.iter(placemark_tag):
-        name = _placemark_name(placemark, namespace)
-        for element in placemark.iter():
-            if element.tag == line_string_tag:
-                candidates.append(_TrackCandidate(element, placemark, "line_string", name))
-            elif element.tag == gx_track_tag:
-                candidates.append(_TrackCandidate(element, placemark, "gx_track", name))
+    candidates = [
+        _TrackCandidate(geometry, placemark, geometry.geometry_kind, placemark.name)
+        for placemark in placemarks
+        for geometry in placemark.geometries
+    ]
 
     if not candidates:
         raise KmlStructureError(
@@ -444,7 +803,7 @@ def parse_kml_track(file_path: str | os.PathLike[str]) -> KmlTrack:
         geometry_kind=candidate.geometry_kind,
         placemark_name=candidate.placemark_name,
         altitude_mode=_altitude_mode(path, candidate, namespace),
-        source_line_colour=_placemark_line_colour(root, candidate.placemark, namespace),
+        source_line_colour=_placemark_line_colour(candidate.placemark, namespace, selectors),
     )
 
 
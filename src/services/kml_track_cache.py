@@ -0,0 +1,375 @@
+"""Process-wide, content-addressed cache of parsed KML tracks.
+
+Transposition review, batch preparation and the debris page all parse the
+same files. Entries are keyed by the resolved path, size, modification time
+and content digest of the source, so an edited or replaced file is always
+parsed again, while an unchanged one is parsed once per process. Parsed
+tracks are immutable, so a cached track is shared rather than copied.
+
+An optional sidecar directory keeps each parsed track as an ``.npz`` file
+named by its content digest, so reopening a session does not re-parse large
+tracks either.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+
+import numpy as np
+
+from .file_fingerprints import file_fingerprint
+from .kml_file_handling import KmlTrack, KmlTrackPoints, parse_kml_track
+
+
+LOGGER = logging.getLogger(__name__)
+
+PARSED_TRACK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+PARSED_TRACK_SIDECAR_MAX_BYTES = 1024 * 1024 * 1024
+_SIDECAR_FORMAT_VERSION = 1
+_SIDECAR_SUFFIX = ".npz"
+_SIDECAR_TEMP_SUFFIX = ".tmp"
+# A temporary sidecar this old was left by a writer that crashed before
+# publishing it; younger ones may still be being written by another process.
+_STALE_SIDECAR_TEMP_NS = 10 * 60 * 1_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedTrackKey:
+    """The identity of one source file's contents at one path."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedTrackCacheInfo:
+    hits: int
+    misses: int
+    sidecar_hits: int
+    size: int
+    current_bytes: int
+    max_bytes: int
+    sidecar_dir: Path | None = None
+
+
+def parsed_track_key(file_path: str | os.PathLike[str]) -> ParsedTrackKey:
+    """Stat and hash a source file; raises :class:`OSError` if it is unreadable."""
+    path = Path(file_path).resolve(strict=False)
+    fingerprint = file_fingerprint(path)
+    return ParsedTrackKey(
+        str(path), fingerprint.size, fingerprint.mtime_ns, fingerprint.digest
+    )
+
+
+def _unchanged_since(key: ParsedTrackKey) -> bool:
+    try:
+        stat = os.stat(key.path)
+    except OSError:
+        return False
+    return (stat.st_size, stat.st_mtime_ns) == (key.size, key.mtime_ns)
+
+
+def _track_nbytes(track: KmlTrack) -> int:
+    points = track.points
+    total = sum(
+        column.nbytes
+        for column in (
+            points.latitudes,
+            points.longitudes,
+            points.altitudes,
+            points.altitude_present,
+            points.timestamps,
+        )
+        if column is not None
+    )
+    texts = points.timestamp_texts
+    if texts is not None:
+        total += sys.getsizeof(texts) + sum(map(sys.getsizeof, texts))
+    return total
+
+
+class ParsedTrackCache:
+    """A least-recently-used map of source identities to parsed tracks.
+
+    The memory budget counts the coordinate, mask and timestamp storage of
+    each track. A track larger than the whole budget is returned but not
+    kept. Parse errors are never cached.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = PARSED_TRACK_CACHE_MAX_BYTES,
+        sidecar_dir: str | os.PathLike[str] | None = None,
+    ) -> None:
+        self._entries: OrderedDict[ParsedTrackKey, tuple[KmlTrack, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._sidecar_hits = 0
+        self.configure(max_bytes=max_bytes, sidecar_dir=sidecar_dir)
+
+    def configure(
+        self,
+        *,
+        max_bytes: int = PARSED_TRACK_CACHE_MAX_BYTES,
+        sidecar_dir: str | os.PathLike[str] | None = None,
+    ) -> None:
+        max_bytes = int(max_bytes)
+        if max_bytes < 0:
+            raise ValueError("The parsed-track cache budget cannot be negative.")
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._sidecar_dir = Path(sidecar_dir) if sidecar_dir is not None else None
+            self._evict()
+
+    def get(self, file_path: str | os.PathLike[str]) -> KmlTrack:
+        """Return the parsed track for a file, parsing it only when needed."""
+        source = Path(file_path)
+        if source.suffix.lower() == ".kmz":
+            return parse_kml_track(source)
+        try:
+            key = parsed_track_key(source)
+        except OSError:
+            # Let the parser report the missing or unreadable file.
+            return parse_kml_track(source)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+            sidecar_dir = self._sidecar_dir
+
+        track = _read_sidecar(sidecar_dir, key) if sidecar_dir is not None else None
+        if track is not None:
+            with self._lock:
+                self._sidecar_hits += 1
+        else:
+            track = parse_kml_track(source)
+            if not _unchanged_since(key):
+                # The file changed while it was read, so the key may not
+                # describe the parsed bytes. Return the result uncached.
+                return track
+            if sidecar_dir is not None:
+                _write_sidecar(sidecar_dir, key, track)
+        self._store(key, track)
+        return track
+
+    def _store(self, key: ParsedTrackKey, track: KmlTrack) -> None:
+        nbytes = _track_nbytes(track)
+        with self._lock:
+            if nbytes > self._max_bytes or key in self._entries:
+                return
+            self._entries[key] = (track, nbytes)
+            self._bytes += nbytes
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._bytes > self._max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+
+    def info(self) -> ParsedTrackCacheInfo:
+        with self._lock:
+            return ParsedTrackCacheInfo(
+                self._hits,
+                self._misses,
+                self._sidecar_hits,
+                len(self._entries),
+                self._bytes,
+                self._max_bytes,
+                self._sidecar_dir,
+            )
+
+    def clear(self) -> None:
+        """Drop in-memory entries and counters; sidecar files are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._sidecar_hits = 0
+
+
+def _sidecar_path(sidecar_dir: Path, key: ParsedTrackKey) -> Path:
+    return sidecar_dir / f"{key.digest}{_SIDECAR_SUFFIX}"
+
+
+def _read_sidecar(sidecar_dir: Path, key: ParsedTrackKey) -> KmlTrack | None:
+    path = _sidecar_path(sidecar_dir, key)
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            metadata = json.loads(str(data["metadata"]))
+            if (
+                metadata.get("version") != _SIDECAR_FORMAT_VERSION
+                or metadata.get("digest") != key.digest
+            ):
+                return None
+            timestamp_texts = None
+            if "timestamp_texts" in data.files:
+                present = data["timestamp_present"].tolist()
+                timestamp_texts = [
+                    text.decode("utf-8") if has_text else None
+                    for text, has_text in zip(data["timestamp_texts"].tolist(), present)
+                ]
+            points = KmlTrackPoints(
+                data["latitudes"],
+                data["longitudes"],
+                data["altitudes"],
+                data["altitude_present"],
+                timestamp_texts,
+            )
+        track = KmlTrack(
+            points=points,
+            geometry_kind=metadata["geometry_kind"],
+            placemark_name=metadata["placemark_name"],
+            altitude_mode=metadata["altitude_mode"],
+            source_line_colour=metadata["source_line_colour"],
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as error:
+        LOGGER.warning("Ignoring unreadable parsed-track sidecar %s: %s", path, error)
+        return None
+    try:
+        # Reads refresh the modification time so pruning drops the least
+        # recently used sidecars first.
+        os.utime(path)
+    except OSError:
+        pass
+    return track
+
+
+def _write_sidecar(sidecar_dir: Path, key: ParsedTrackKey, track: KmlTrack) -> None:
+    points = track.points
+    arrays = {
+        "latitudes": points.latitudes,
+        "longitudes": points.longitudes,
+        "altitudes": points.altitudes,
+        "altitude_present": points.altitude_present,
+        "metadata": np.array(
+            json.dumps(
+                {
+                    "version": _SIDECAR_FORMAT_VERSION,
+                    "digest": key.digest,
+                    "geometry_kind": track.geometry_kind,
+                    "placemark_name": track.placemark_name,
+                    "altitude_mode": track.altitude_mode,
+                    "source_line_colour": track.source_line_colour,
+                }
+            )
+        ),
+    }
+    texts = points.timestamp_texts
+    if texts is not None:
+        arrays["timestamp_texts"] = np.array(
+            [(text or "").encode("utf-8") for text in texts], dtype=np.bytes_
+        )
+        arrays["timestamp_present"] = np.array(
+            [text is not None for text in texts], dtype=bool
+        )
+
+    temp_path: str | None = None
+    try:
+        sidecar_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=sidecar_dir, suffix=_SIDECAR_TEMP_SUFFIX, delete=False
+        ) as handle:
+            temp_path = handle.name
+            np.savez(handle, **arrays)
+        os.replace(temp_path, _sidecar_path(sidecar_dir, key))
+        temp_path = None
+        _prune_sidecars(sidecar_dir)
+    except OSError as error:
+        LOGGER.warning("Could not write parsed-track sidecar for %s: %s", key.path, error)
+    finally:
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+def _prune_sidecars(
+    sidecar_dir: Path, max_bytes: int = PARSED_TRACK_SIDECAR_MAX_BYTES
+) -> None:
+    entries = []
+    pending_bytes = 0
+    stale_before_ns = time.time_ns() - _STALE_SIDECAR_TEMP_NS
+    for path in sidecar_dir.glob(f"*{_SIDECAR_TEMP_SUFFIX}"):
+        try:
+            stat = path.stat()
+            if stat.st_mtime_ns < stale_before_ns:
+                path.unlink()
+                continue
+        except OSError:
+            continue
+        pending_bytes += stat.st_size
+    for path in sidecar_dir.glob(f"*{_SIDECAR_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+    total = pending_bytes + sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+
+
+_PARSED_TRACK_CACHE = ParsedTrackCache()
+
+
+def cached_parse_kml_track(file_path: str | os.PathLike[str]) -> KmlTrack:
+    """Return :func:`parse_kml_track` for a file through the shared cache."""
+    return _PARSED_TRACK_CACHE.get(file_path)
+
+
+def configure_parsed_track_cache(
+    *,
+    max_bytes: int = PARSED_TRACK_CACHE_MAX_BYTES,
+    sidecar_dir: str | os.PathLike[str] | None = None,
+) -> None:
+    """Set the shared cache's memory budget and optional sidecar directory."""
+    _PARSED_TRACK_CACHE.configure(max_bytes=max_bytes, sidecar_dir=sidecar_dir)
+
+
+def parsed_track_cache_info() -> ParsedTrackCacheInfo:
+    return _PARSED_TRACK_CACHE.info()
+
+
+def clear_parsed_track_cache() -> None:
+    _PARSED_TRACK_CACHE.clear()
+
+
+__all__ = [
+    "PARSED_TRACK_CACHE_MAX_BYTES",
+    "ParsedTrackCache",
+    "ParsedTrackCacheInfo",
+    "ParsedTrackKey",
+    "cached_parse_kml_track",
+    "clear_parsed_track_cache",
+    "configure_parsed_track_cache",
+    "parsed_track_cache_info",
+    "parsed_track_key",
+]
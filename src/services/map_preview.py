@@ -8,12 +8,17 @@ rendering coordinates rather than reproducing application geometry logic.
 
 from __future__ import annotations
 
+import base64
+import copy
 from dataclasses import dataclass, field, replace
+from itertools import compress
 import math
 import re
 from typing import Any
 
-from .geodesy import EnuCoordinate, LocalEnuFrame
+import numpy as np
+
+from .geodesy import FastLocalEnuFrame, LocalEnuFrame, cached_local_enu_frame
 from .kml_export import (
     KmlCoordinate,
     KmlDocument,
@@ -21,13 +26,22 @@ from .kml_export import (
     KmlPlacemark,
     KmlPolygon,
     KmlStyle,
-    render_kml,
+    _accept_checked_coordinates,
+    _DocumentIdentityMemo,
 )
 
 
 MAX_HORIZONTAL_OFFSET_M = 100_000.0
 MAX_VERTICAL_OFFSET_M = 20_000.0
 MAX_ABSOLUTE_YAW_DEG = 180.0
+# Version 1 writes each vertex as a {"lat", "lng", "altitude"} object.
+# Version 2 packs each geometry's vertices into base64 little-endian float64
+# (lat, lng, altitude) triples.
+PREVIEW_PAYLOAD_VERSIONS = (1, 2)
+# Vertices sent to the Maps preview per scene before LOD simplification.
+PREVIEW_VERTEX_BUDGET = 20_000
+# Finer than the 1e-7 degree (about 1 cm) quantization of exported positions.
+_LOD_RESOLUTION_M = 0.005
 
 _KML_COLOUR_RE = re.compile(r"[0-9a-fA-F]{8}\Z")
 _MAPS_ALTITUDE_MODES = {
@@ -127,44 +141,188 @@ def _maps_altitude_mode(altitude_mode: str) -> str:
         raise ValueError(f'Unsupported KML altitude mode "{altitude_mode}".') from error
 
 
-def _transform_coordinate(
-    coordinate: KmlCoordinate,
-    frame: LocalEnuFrame,
+def _geometry_points(geometry: KmlLineString | KmlPolygon) -> tuple[KmlCoordinate, ...]:
+    if isinstance(geometry, KmlLineString):
+        return geometry.coordinates
+    if isinstance(geometry, KmlPolygon):
+        return geometry.outer_ring
+    # Defensive in case KmlGeometry is extended without this service.
+    raise TypeError("Unsupported KML geometry in preview document.")
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _EnuBase:
+    """Every vertex of one document in one anchor frame, held as flat columns.
+
+    ``bounds`` holds the start offset of each geometry followed by the total
+    vertex count, so geometry ``i`` owns ``bounds[i]:bounds[i + 1]``.
+    """
+
+    frame: LocalEnuFrame | FastLocalEnuFrame
+    east_m: np.ndarray = field(repr=False)
+    north_m: np.ndarray = field(repr=False)
+    up_m: np.ndarray = field(repr=False)
+    altitude_m: np.ndarray = field(repr=False)
+    bounds: tuple[int, ...]
+
+
+# Per base document: {(anchor latitude, anchor longitude, fast): _EnuBase}.
+_ENU_BASES = _DocumentIdentityMemo()
+
+
+def _build_enu_base(
+    document: KmlDocument,
+    frame: LocalEnuFrame | FastLocalEnuFrame,
+) -> _EnuBase:
+    coordinates: list[KmlCoordinate] = []
+    bounds = [0]
+    for placemark in document.placemarks:
+        coordinates.extend(_geometry_points(placemark.geometry))
+        bounds.append(len(coordinates))
+    try:
+        longitudes, latitudes, altitudes = np.array(
+            [
+                (coordinate.longitude, coordinate.latitude, coordinate.altitude_m)
+                for coordinate in coordinates
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3).T
+    except (TypeError, ValueError):
+        longitudes = latitudes = altitudes = None
+    if longitudes is None or not (
+        np.isfinite(altitudes).all()
+        and (np.abs(longitudes) <= 180.0).all()
+        and (np.abs(latitudes) <= 90.0).all()
+    ):
+        # Report the first bad coordinate exactly as the scalar check does.
+        for coordinate in coordinates:
+            _validated_coordinate(coordinate, "Trace coordinate")
+
+    source = frame.to_enu_array(latitudes, longitudes)
+    altitudes.flags.writeable = False
+    return _EnuBase(
+        frame,
+        source.east_m,
+        source.north_m,
+        source.up_m,
+        altitudes,
+        tuple(bounds),
+    )
+
+
+def _enu_base(
+    document: KmlDocument,
+    anchor: KmlCoordinate,
+    *,
+    fast: bool,
+) -> _EnuBase:
+    """Return ``document`` projected once into the frame about ``anchor``.
+
+    Later adjustments of the same base reuse these columns, so a slider move
+    only rotates, translates and inverse-projects them.
+    """
+
+    bases = _ENU_BASES.get(document)
+    if bases is None:
+        bases = {}
+        _ENU_BASES.store(document, bases)
+    key = (anchor.latitude, anchor.longitude, fast)
+    base = bases.get(key)
+    if base is None:
+        frame = (
+            FastLocalEnuFrame(anchor.latitude, anchor.longitude)
+            if fast
+            else cached_local_enu_frame(anchor.latitude, anchor.longitude)
+        )
+        base = bases.setdefault(key, _build_enu_base(document, frame))
+    return base
+
+
+def _adjusted_placemarks(
+    document: KmlDocument,
+    base: _EnuBase,
     adjustment: TraceAdjustment,
     *,
-    cosine: float,
-    sine: float,
-    altitude_mode: str,
-) -> KmlCoordinate:
-    coordinate = _validated_coordinate(coordinate, "Trace coordinate")
-    source = frame.to_enu(coordinate.latitude, coordinate.longitude)
-    adjusted = EnuCoordinate(
-        east_m=(source.east_m * cosine + source.north_m * sine) + adjustment.east_m,
-        north_m=(-source.east_m * sine + source.north_m * cosine)
-        + adjustment.north_m,
+    quantize: bool,
+) -> tuple[KmlPlacemark, ...]:
+    yaw = math.radians(adjustment.yaw_deg)
+    cosine = math.cos(yaw)
+    sine = math.sin(yaw)
+    latitudes, longitudes = base.frame.to_wgs84_array(
+        (base.east_m * cosine + base.north_m * sine) + adjustment.east_m,
+        (-base.east_m * sine + base.north_m * cosine) + adjustment.north_m,
         # KML altitude is independent of the neutral ellipsoidal height used
         # by LocalEnuFrame.  Preserve the point's curvature term here.
-        up_m=source.up_m,
+        base.up_m,
     )
-    latitude, longitude = frame.to_wgs84(adjusted)
-    altitude = (
-        adjustment.up_m
-        if altitude_mode == "clampToGround" and adjustment.up_m != 0.0
-        else coordinate.altitude_m + adjustment.up_m
-    )
-    return KmlCoordinate(longitude, latitude, altitude)
+    altitudes = base.altitude_m + adjustment.up_m
+    lift_clamped = adjustment.up_m != 0.0
+    if lift_clamped:
+        for placemark, start, stop in zip(
+            document.placemarks, base.bounds, base.bounds[1:]
+        ):
+            if placemark.geometry.altitude_mode == "clampToGround":
+                altitudes[start:stop] = adjustment.up_m
+
+    columns = (longitudes, latitudes, altitudes)
+    if quantize and isinstance(base.frame, FastLocalEnuFrame):
+        # Live previews are already approximate and never exported, so
+        # NumPy's rounding, which can differ from round() in the last ulp,
+        # is good enough here.  Adding zero drops negative zero.
+        columns = tuple(
+            (np.round(column, places) + 0.0).tolist()
+            for column, places in zip(columns, (7, 7, 3))
+        )
+    elif quantize:
+        # Match _quantized_value exactly: round like Python, drop negative zero.
+        columns = tuple(
+            [round(value, places) + 0.0 for value in column.tolist()]
+            for column, places in zip(columns, (7, 7, 3))
+        )
+    else:
+        columns = tuple(column.tolist() for column in columns)
+    points = tuple(map(KmlCoordinate, *columns))
+
+    placemarks: list[KmlPlacemark] = []
+    for placemark, start, stop in zip(document.placemarks, base.bounds, base.bounds[1:]):
+        geometry = placemark.geometry
+        altitude_mode = geometry.altitude_mode
+        if lift_clamped and altitude_mode == "clampToGround":
+            altitude_mode = "relativeToGround"
+        if isinstance(geometry, KmlLineString):
+            transformed_geometry = replace(
+                geometry,
+                coordinates=points[start:stop],
+                altitude_mode=altitude_mode,
+            )
+        else:
+            outer_ring = points[start:stop]
+            if quantize and outer_ring and outer_ring[0] != outer_ring[-1]:
+                outer_ring = (*outer_ring, outer_ring[0])
+            transformed_geometry = replace(
+                geometry,
+                outer_ring=outer_ring,
+                altitude_mode=altitude_mode,
+            )
+        placemarks.append(replace(placemark, geometry=transformed_geometry))
+    return tuple(placemarks)
 
 
 def apply_enu_adjustment(
     document: KmlDocument,
     anchor: KmlCoordinate,
     adjustment: TraceAdjustment,
+    *,
+    fast: bool = False,
 ) -> KmlDocument:
     """Apply one non-cumulative ENU adjustment to every geometry in a document.
 
     A zero adjustment intentionally returns ``document`` itself.  This keeps
     the established zero-offset export path byte-for-byte compatible until the
     explicit preview quantization step is requested.
+
+    ``fast`` swaps the PROJ frame for :class:`FastLocalEnuFrame`.  It is meant
+    for live slider updates only; anything exported must use the exact frame.
     """
 
     if not isinstance(document, KmlDocument):
@@ -175,63 +333,40 @@ def apply_enu_adjustment(
     if adjustment.is_zero:
         return document
 
-    frame = LocalEnuFrame(validated_anchor.latitude, validated_anchor.longitude)
-    yaw = math.radians(adjustment.yaw_deg)
-    cosine = math.cos(yaw)
-    sine = math.sin(yaw)
-    placemarks: list[KmlPlacemark] = []
+    base = _enu_base(document, validated_anchor, fast=fast)
+    return replace(
+        document,
+        placemarks=_adjusted_placemarks(document, base, adjustment, quantize=False),
+    )
 
-    for placemark in document.placemarks:
-        geometry = placemark.geometry
-        if isinstance(geometry, KmlLineString):
-            altitude_mode = geometry.altitude_mode
-            coordinates = tuple(
-                _transform_coordinate(
-                    coordinate,
-                    frame,
-                    adjustment,
-                    cosine=cosine,
-                    sine=sine,
-                    altitude_mode=altitude_mode,
-                )
-                for coordinate in geometry.coordinates
-            )
-            transformed_geometry = replace(
-                geometry,
-                coordinates=coordinates,
-                altitude_mode=(
-                    "relativeToGround"
-                    if altitude_mode == "clampToGround" and adjustment.up_m != 0.0
-                    else altitude_mode
-                ),
-            )
-        elif isinstance(geometry, KmlPolygon):
-            altitude_mode = geometry.altitude_mode
-            outer_ring = tuple(
-                _transform_coordinate(
-                    coordinate,
-                    frame,
-                    adjustment,
-                    cosine=cosine,
-                    sine=sine,
-                    altitude_mode=altitude_mode,
-                )
-                for coordinate in geometry.outer_ring
-            )
-            transformed_geometry = replace(
-                geometry,
-                outer_ring=outer_ring,
-                altitude_mode=(
-                    "relativeToGround"
-                    if altitude_mode == "clampToGround" and adjustment.up_m != 0.0
-                    else altitude_mode
-                ),
-            )
-        else:  # Defensive in case KmlGeometry is extended without this service.
-            raise TypeError("Unsupported KML geometry in preview document.")
-        placemarks.append(replace(placemark, geometry=transformed_geometry))
 
-    return replace(document, placemarks=tuple(placemarks))
+def _adjusted_canonical_document(
+    document: KmlDocument,
+    anchor: KmlCoordinate,
+    adjustment: TraceAdjustment,
+    *,
+    fast: bool,
+) -> KmlDocument:
+    """Equivalent to quantizing :func:`apply_enu_adjustment`, in one pass.
+
+    The adjusted vertices are rounded as they are built, so no intermediate
+    full-precision document is created and checked again.
+    """
+
+    if not isinstance(document, KmlDocument):
+        raise TypeError("document must be a KmlDocument.")
+    if adjustment.is_zero:
+        return quantize_kml_document(document)
+    base = _enu_base(document, anchor, fast=fast)
+    canonical = replace(
+        document,
+        placemarks=_adjusted_placemarks(document, base, adjustment, quantize=True),
+    )
+    # The base columns were range-checked and the inverse projection checks
+    # its own output, so only the document structure is left to validate.
+    _accept_checked_coordinates(canonical)
+    _QUANTIZED_DOCUMENTS.store(canonical, _CANONICAL)
+    return canonical
 
 
 def _quantized_value(value: object, places: int, label: str) -> float:
@@ -248,16 +383,30 @@ def _quantized_coordinate(coordinate: KmlCoordinate) -> KmlCoordinate:
     )
 
 
+_QUANTIZED_DOCUMENTS = _DocumentIdentityMemo()
+# Marks documents that are themselves canonical; storing the document as its
+# own value would keep it alive through the memo.
+_CANONICAL = object()
+
+
 def quantize_kml_document(document: KmlDocument) -> KmlDocument:
     """Return the exact coordinate document shared by preview and KML output.
 
     Polygon rings are explicitly closed here because the KML renderer closes
     them during serialization.  Making that closure part of the canonical
     document ensures the Maps payload has the same topology.
+
+    Each document object is quantized and validated once: asking again for
+    the same object, or for a canonical result, returns the cached result.
     """
 
     if not isinstance(document, KmlDocument):
         raise TypeError("document must be a KmlDocument.")
+    cached = _QUANTIZED_DOCUMENTS.get(document)
+    if cached is _CANONICAL:
+        return document
+    if cached is not None:
+        return cached
     placemarks: list[KmlPlacemark] = []
     for placemark in document.placemarks:
         geometry = placemark.geometry
@@ -282,15 +431,29 @@ def quantize_kml_document(document: KmlDocument) -> KmlDocument:
         placemarks.append(replace(placemark, geometry=transformed_geometry))
 
     canonical = replace(document, placemarks=tuple(placemarks))
-    # Reuse the exporter's public validation so payload creation cannot accept
-    # a scene that the corresponding KML export would reject.
-    render_kml(canonical)
+    # Reuse the exporter's validation so payload creation cannot accept a
+    # scene that the corresponding KML export would reject.  Every coordinate
+    # was range-checked before rounding, which keeps it in range, so only the
+    # document structure is left to check; the exporter then trusts the
+    # canonical object instead of validating it again.
+    _accept_checked_coordinates(canonical)
+    _QUANTIZED_DOCUMENTS.store(document, canonical)
+    _QUANTIZED_DOCUMENTS.store(canonical, _CANONICAL)
     return canonical
 
 
 @dataclass(frozen=True, slots=True)
 class PreparedTrace:
-    """One base document and its current canonical adjusted representation."""
+    """One base document and its current canonical adjusted representation.
+
+    A ``live_preview`` trace was adjusted with the fast tangent-plane frame
+    while a slider was moving.  Call :meth:`exact` before handing it to
+    anything that exports.
+
+    The base document is projected into the anchor's ENU frame once per
+    frame kind; each adjustment then only rotates, translates and
+    inverse-projects those columns.
+    """
 
     trace_id: str
     label: str
@@ -298,6 +461,7 @@ class PreparedTrace:
     base_document: KmlDocument
     adjustment: TraceAdjustment = field(default_factory=TraceAdjustment)
     anchor_altitude_mode: str = "clampToGround"
+    live_preview: bool = False
     adjusted_document: KmlDocument = field(init=False)
 
     def __post_init__(self) -> None:
@@ -313,19 +477,44 @@ class PreparedTrace:
         object.__setattr__(
             self,
             "adjusted_document",
-            quantize_kml_document(
-                apply_enu_adjustment(
-                    self.base_document,
-                    validated_anchor,
-                    self.adjustment,
-                )
+            _adjusted_canonical_document(
+                self.base_document,
+                validated_anchor,
+                self.adjustment,
+                fast=self.live_preview,
             ),
         )
 
-    def with_adjustment(self, adjustment: TraceAdjustment) -> PreparedTrace:
+    def with_adjustment(
+        self,
+        adjustment: TraceAdjustment,
+        *,
+        live_preview: bool = False,
+    ) -> PreparedTrace:
         """Create a fresh trace from the original base, never the prior output."""
 
-        return replace(self, adjustment=adjustment)
+        return replace(self, adjustment=adjustment, live_preview=live_preview)
+
+    def exact(self) -> PreparedTrace:
+        """Return this trace with its adjustment recomputed on the exact frame."""
+
+        return replace(self, live_preview=False) if self.live_preview else self
+
+    def with_identity(self, trace_id: str, label: str) -> PreparedTrace:
+        """Return this trace under another ID and label without re-rendering it."""
+
+        if (trace_id, label) == (self.trace_id, self.label):
+            return self
+        if not isinstance(trace_id, str) or not trace_id.strip():
+            raise ValueError("Trace ID must not be empty.")
+        if not isinstance(label, str) or not label.strip():
+            raise ValueError("Trace label must not be empty.")
+        # The documents do not depend on the identity, so share them rather
+        # than re-running the adjustment and quantization in __post_init__.
+        trace = copy.copy(self)
+        object.__setattr__(trace, "trace_id", trace_id)
+        object.__setattr__(trace, "label", label)
+        return trace
 
 
 @dataclass(frozen=True, slots=True)
@@ -345,6 +534,190 @@ class PreviewScene:
             raise ValueError("Preview trace IDs must be unique.")
         object.__setattr__(self, "traces", traces)
 
+    def exact(self) -> PreviewScene:
+        """Return the scene with every live-preview trace made exact."""
+
+        if not any(trace.live_preview for trace in self.traces):
+            return self
+        return PreviewScene(tuple(trace.exact() for trace in self.traces))
+
+
+def _vertex_ranks(points: np.ndarray) -> np.ndarray:
+    """Rank vertices by the Douglas-Peucker tolerance at which each is kept.
+
+    ``points`` is an ``(n, 3)`` array in metres.  Every level of the
+    recursion is evaluated for all open segments at once.  A vertex's rank
+    never exceeds the rank of the vertex that split its segment, so keeping
+    every vertex ranked above a tolerance always gives a Douglas-Peucker
+    simplification whose deviation is at most the largest dropped rank.
+    """
+
+    count = len(points)
+    ranks = np.zeros(count, dtype=np.float64)
+    if count == 0:
+        return ranks
+    ranks[[0, -1]] = np.inf
+    firsts = np.array([0])
+    lasts = np.array([count - 1])
+    ceilings = np.array([np.inf])
+    while True:
+        open_segments = lasts - firsts >= 2
+        firsts = firsts[open_segments]
+        lasts = lasts[open_segments]
+        ceilings = ceilings[open_segments]
+        if not firsts.size:
+            return ranks
+        lengths = lasts - firsts - 1
+        starts = np.cumsum(lengths) - lengths
+        owners = np.repeat(np.arange(firsts.size), lengths)
+        interior = np.arange(lengths.sum()) - starts[owners] + firsts[owners] + 1
+        segments = (points[lasts] - points[firsts])[owners]
+        offsets = points[interior] - points[firsts][owners]
+        squared_lengths = np.einsum("ij,ij->i", segments, segments)
+        along = np.clip(
+            np.einsum("ij,ij->i", offsets, segments)
+            / np.where(squared_lengths > 0.0, squared_lengths, 1.0),
+            0.0,
+            1.0,
+        )
+        distances = np.linalg.norm(offsets - along[:, None] * segments, axis=1)
+        maxima = np.maximum.reduceat(distances, starts)
+        first_maximum = np.minimum.reduceat(
+            np.where(distances == maxima[owners], np.arange(distances.size), distances.size),
+            starts,
+        )
+        splits = interior[first_maximum]
+        errors = np.minimum(maxima, ceilings)
+        # Below the export's coordinate resolution the order no longer
+        # matters; rank the whole segment at its bound and stop splitting it.
+        settled = errors <= _LOD_RESOLUTION_M
+        ranks[interior[settled[owners]]] = errors[owners][settled[owners]]
+        splits, errors = splits[~settled], errors[~settled]
+        ranks[splits] = errors
+        firsts, lasts = (
+            np.concatenate((firsts[~settled], splits)),
+            np.concatenate((splits, lasts[~settled])),
+        )
+        ceilings = np.concatenate((errors, errors))
+
+
+# Per base document: {(anchor latitude, anchor longitude): per-geometry ranks}.
+_VERTEX_RANKS = _DocumentIdentityMemo()
+
+
+def _trace_vertex_ranks(trace: PreparedTrace) -> tuple[np.ndarray, ...]:
+    """Return the cached preview LOD ranking of each geometry in ``trace``.
+
+    Ranks come from the base document in the anchor frame.  An adjustment is
+    a rotation and translation of that frame, so it leaves them unchanged.
+    """
+
+    document = trace.base_document
+    by_anchor = _VERTEX_RANKS.get(document)
+    if by_anchor is None:
+        by_anchor = {}
+        _VERTEX_RANKS.store(document, by_anchor)
+    key = (trace.anchor.latitude, trace.anchor.longitude)
+    ranks = by_anchor.get(key)
+    if ranks is None:
+        base = _enu_base(document, trace.anchor, fast=True)
+        geometry_ranks: list[np.ndarray] = []
+        for placemark, start, stop in zip(document.placemarks, base.bounds, base.bounds[1:]):
+            geometry = placemark.geometry
+            altitudes = (
+                np.zeros(stop - start)
+                if geometry.altitude_mode == "clampToGround"
+                else base.altitude_m[start:stop]
+            )
+            geometry_rank = _vertex_ranks(
+                np.column_stack(
+                    (base.east_m[start:stop], base.north_m[start:stop], altitudes)
+                )
+            )
+            if isinstance(geometry, KmlPolygon) and geometry_rank.size > 2:
+                # A ring must keep at least one vertex off its closing edge.
+                geometry_rank[1 + int(np.argmax(geometry_rank[1:-1]))] = np.inf
+            geometry_rank.flags.writeable = False
+            geometry_ranks.append(geometry_rank)
+        ranks = by_anchor.setdefault(key, tuple(geometry_ranks))
+    return ranks
+
+
+def preview_tolerance(
+    scene: PreviewScene,
+    vertex_budget: int = PREVIEW_VERTEX_BUDGET,
+) -> float:
+    """Return the smallest LOD tolerance, in metres, that fits ``vertex_budget``.
+
+    ``0.0`` means the whole scene fits and nothing is simplified; an
+    over-budget scene always gets a positive tolerance.  The same
+    tolerance applies to every trace, so the scene's error budget is spent
+    where the geometry is most detailed.  Ends and polygon extremes are
+    never dropped, even if they alone exceed the budget.
+    """
+
+    if not isinstance(scene, PreviewScene):
+        raise TypeError("scene must be a PreviewScene.")
+    if isinstance(vertex_budget, bool) or not isinstance(vertex_budget, int) or vertex_budget < 1:
+        raise ValueError("Preview vertex budget must be a positive integer.")
+    vertex_count = sum(
+        len(_geometry_points(placemark.geometry))
+        for trace in scene.traces
+        for placemark in trace.base_document.placemarks
+    )
+    if vertex_count <= vertex_budget:
+        # Most scenes fit, and they never pay for the ranking.
+        return 0.0
+    ranks = np.concatenate(
+        [rank for trace in scene.traces for rank in _trace_vertex_ranks(trace)]
+    )
+    tolerance = float(np.partition(ranks, ranks.size - vertex_budget - 1)[ranks.size - vertex_budget - 1])
+    if math.isinf(tolerance):
+        finite = ranks[np.isfinite(ranks)]
+        tolerance = float(finite.max()) if finite.size else 0.0
+    # Collinear and stationary vertices rank exactly 0.0, and an over-budget
+    # scene must still drop them.
+    return max(tolerance, float(np.nextafter(0.0, 1.0)))
+
+
+def _simplified_document(
+    trace: PreparedTrace,
+    tolerance_m: float,
+) -> tuple[KmlDocument, dict[str, object] | None]:
+    """Drop adjusted vertices ranked at or below ``tolerance_m`` for preview."""
+
+    document = trace.adjusted_document
+    if tolerance_m <= 0.0:
+        return document, None
+    source_count = kept_count = 0
+    max_deviation = 0.0
+    placemarks: list[KmlPlacemark] = []
+    for placemark, rank in zip(document.placemarks, _trace_vertex_ranks(trace)):
+        geometry = placemark.geometry
+        points = _geometry_points(geometry)
+        keep = rank > tolerance_m
+        if len(points) > rank.size:
+            # quantize_kml_document appended the closing vertex of this ring.
+            keep = np.append(keep, True)
+        dropped = rank[~keep[: rank.size]]
+        if dropped.size:
+            max_deviation = max(max_deviation, float(dropped.max()))
+        kept = tuple(compress(points, keep.tolist()))
+        source_count += len(points)
+        kept_count += len(kept)
+        if isinstance(geometry, KmlLineString):
+            geometry = replace(geometry, coordinates=kept)
+        else:
+            geometry = replace(geometry, outer_ring=kept)
+        placemarks.append(replace(placemark, geometry=geometry))
+    if kept_count == source_count:
+        return document, None
+    return replace(document, placemarks=tuple(placemarks)), {
+        "maxDeviationM": math.ceil(max_deviation * 1000.0) / 1000.0,
+        "vertexCount": kept_count,
+        "sourceVertexCount": source_count,
+    }
+
 
 def kml_colour_to_css(colour: str) -> str:
     """Convert an eight-digit KML ``aabbggrr`` colour to CSS ``#rrggbbaa``."""
@@ -368,6 +741,36 @@ def _coordinate_payload(coordinate: KmlCoordinate) -> dict[str, float]:
     }
 
 
+def _packed_path(coordinates: tuple[KmlCoordinate, ...]) -> str:
+    values = np.array(
+        [
+            (coordinate.latitude, coordinate.longitude, coordinate.altitude_m)
+            for coordinate in coordinates
+        ],
+        dtype="<f8",
+    )
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _path_payload(
+    coordinates: tuple[KmlCoordinate, ...],
+    version: int,
+) -> dict[str, object]:
+    if version == 1:
+        return {
+            "coordinates": [
+                _coordinate_payload(coordinate) for coordinate in coordinates
+            ]
+        }
+    return {"path": _packed_path(coordinates)}
+
+
+def _payload_version(version: object) -> int:
+    if version not in PREVIEW_PAYLOAD_VERSIONS or isinstance(version, bool):
+        raise ValueError(f"Unsupported preview payload version {version!r}.")
+    return int(version)
+
+
 def _style_payload(style: KmlStyle) -> dict[str, object]:
     return {
         "strokeColor": kml_colour_to_css(style.line_colour),
@@ -389,6 +792,7 @@ def _style_payload(style: KmlStyle) -> dict[str, object]:
 def _geometry_payload(
     placemark: KmlPlacemark,
     style: KmlStyle,
+    version: int,
 ) -> dict[str, object]:
     geometry = placemark.geometry
     common: dict[str, object] = {
@@ -403,84 +807,119 @@ def _geometry_payload(
             "type": "polyline",
             "extrude": geometry.extrude_to_ground,
             "tessellate": geometry.tessellate,
-            "coordinates": [
-                _coordinate_payload(coordinate)
-                for coordinate in geometry.coordinates
-            ],
+            **_path_payload(geometry.coordinates, version),
         }
     if isinstance(geometry, KmlPolygon):
         return {
             **common,
             "type": "polygon",
-            "coordinates": [
-                _coordinate_payload(coordinate)
-                for coordinate in geometry.outer_ring
-            ],
+            **_path_payload(geometry.outer_ring, version),
         }
     raise TypeError("Unsupported KML geometry in preview document.")
 
 
-def preview_payload(scene: PreviewScene) -> dict[str, Any]:
-    """Build a JSON-serializable Maps payload from canonical trace documents."""
+def trace_payload(
+    trace: PreparedTrace,
+    *,
+    version: int = 1,
+    tolerance_m: float = 0.0,
+) -> dict[str, Any]:
+    """Build the JSON-serializable Maps entry for one canonical trace.
+
+    ``version`` selects the geometry path encoding from
+    :data:`PREVIEW_PAYLOAD_VERSIONS`; the rest of the entry is the same.
+    A positive ``tolerance_m`` from :func:`preview_tolerance` thins the
+    preview geometry only; ``simplification`` then reports the vertex counts
+    and the largest deviation in metres.  ``adjusted_document`` and KML
+    export always keep every vertex.
+    """
+
+    if not isinstance(trace, PreparedTrace):
+        raise TypeError("trace must be a PreparedTrace.")
+    version = _payload_version(version)
+    tolerance_m = _finite_float(tolerance_m, "Preview tolerance")
+    document, simplification = _simplified_document(trace, tolerance_m)
+    styles: dict[str, KmlStyle] = {}
+    for style in document.styles:
+        if style.style_id in styles:
+            raise ValueError(f'Duplicate KML style ID "{style.style_id}".')
+        styles[style.style_id] = style
+    geometries: list[dict[str, object]] = []
+    for placemark in document.placemarks:
+        if not placemark.style_url.startswith("#"):
+            raise ValueError(
+                f'Placemark "{placemark.name}" has an invalid style URL.'
+            )
+        try:
+            style = styles[placemark.style_url[1:]]
+        except KeyError as error:
+            raise ValueError(
+                f'Placemark "{placemark.name}" references an unknown KML style.'
+            ) from error
+        geometries.append(_geometry_payload(placemark, style, version))
+
+    anchor = _quantized_coordinate(trace.anchor)
+    return {
+        "id": trace.trace_id,
+        "label": trace.label,
+        "adjustment": {
+            "eastM": trace.adjustment.east_m,
+            "northM": trace.adjustment.north_m,
+            "upM": trace.adjustment.up_m,
+            "yawDeg": trace.adjustment.yaw_deg,
+        },
+        "anchor": {
+            **_coordinate_payload(anchor),
+            "altitudeMode": _maps_altitude_mode(
+                trace.anchor_altitude_mode
+            ),
+            "label": "Fixed anchor",
+            "color": "#ff00ffff",
+        },
+        "geometries": geometries,
+        "simplification": simplification,
+    }
+
+
+def preview_payload(
+    scene: PreviewScene,
+    *,
+    version: int = 1,
+    vertex_budget: int | None = None,
+) -> dict[str, Any]:
+    """Build a JSON-serializable Maps payload from canonical trace documents.
+
+    With a ``vertex_budget`` the traces are simplified together to fit it.
+    """
 
     if not isinstance(scene, PreviewScene):
         raise TypeError("scene must be a PreviewScene.")
-    traces: list[dict[str, object]] = []
-    for trace in scene.traces:
-        document = trace.adjusted_document
-        styles: dict[str, KmlStyle] = {}
-        for style in document.styles:
-            if style.style_id in styles:
-                raise ValueError(f'Duplicate KML style ID "{style.style_id}".')
-            styles[style.style_id] = style
-        geometries: list[dict[str, object]] = []
-        for placemark in document.placemarks:
-            if not placemark.style_url.startswith("#"):
-                raise ValueError(
-                    f'Placemark "{placemark.name}" has an invalid style URL.'
-                )
-            try:
-                style = styles[placemark.style_url[1:]]
-            except KeyError as error:
-                raise ValueError(
-                    f'Placemark "{placemark.name}" references an unknown KML style.'
-                ) from error
-            geometries.append(_geometry_payload(placemark, style))
-
-        anchor = _quantized_coordinate(trace.anchor)
-        traces.append(
-            {
-                "id": trace.trace_id,
-                "label": trace.label,
-                "adjustment": {
-                    "eastM": trace.adjustment.east_m,
-                    "northM": trace.adjustment.north_m,
-                    "upM": trace.adjustment.up_m,
-                    "yawDeg": trace.adjustment.yaw_deg,
-                },
-                "anchor": {
-                    **_coordinate_payload(anchor),
-                    "altitudeMode": _maps_altitude_mode(
-                        trace.anchor_altitude_mode
-                    ),
-                    "label": "Fixed anchor",
-                    "color": "#ff00ffff",
-                },
-                "geometries": geometries,
-            }
-        )
-    return {"version": 1, "traces": traces}
+    version = _payload_version(version)
+    tolerance_m = (
+        0.0 if vertex_budget is None else preview_tolerance(scene, vertex_budget)
+    )
+    return {
+        "version": version,
+        "traces": [
+            trace_payload(trace, version=version, tolerance_m=tolerance_m)
+            for trace in scene.traces
+        ],
+    }
 
 
 __all__ = [
     "MAX_ABSOLUTE_YAW_DEG",
     "MAX_HORIZONTAL_OFFSET_M",
     "MAX_VERTICAL_OFFSET_M",
+    "PREVIEW_PAYLOAD_VERSIONS",
+    "PREVIEW_VERTEX_BUDGET",
     "PreparedTrace",
     "PreviewScene",
     "TraceAdjustment",
     "apply_enu_adjustment",
     "kml_colour_to_css",
     "preview_payload",
+    "preview_tolerance",
     "quantize_kml_document",
+    "trace_payload",
 ]
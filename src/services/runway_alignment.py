@@ -193,17 +193,18 @@ def _percentile(values: Sequence[float], fraction: float) -> float:
 
 
 def _local_samples(track: KmlTrack) -> tuple[list[_Sample], int]:
-    origin = track.points[0]
-    frame = LocalEnuFrame(origin.latitude, origin.longitude)
+    frame = LocalEnuFrame(float(track.latitudes[0]), float(track.longitudes[0]))
+    positions = frame.to_enu_array(track.latitudes, track.longitudes)
     samples: list[_Sample] = []
     discarded = 0
-    for index, point in enumerate(track.points):
-        position = frame.to_enu(point.latitude, point.longitude)
+    for index, (point, east, north) in enumerate(
+        zip(track.points, positions.east_m.tolist(), positions.north_m.tolist())
+    ):
         sample = _Sample(
             original_index=index,
             point=point,
-            east_m=position.east_m,
-            north_m=position.north_m,
+            east_m=east,
+            north_m=north,
         )
         if samples and _sample_distance(samples[-1], sample) < JITTER_DISTANCE_M:
             discarded += 1
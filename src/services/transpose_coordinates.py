@@ -4,15 +4,29 @@ import os
 import re
 import sys
 import unicodedata
-from collections import Counter
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, replace
 from enum import Enum
 import logging
+import math
+import multiprocessing
 from pathlib import Path
+import threading
 from typing import Sequence
 import warnings
 
+import numpy as np
+
 from .geodesy import (
+    EnuBlock,
+    cached_local_enu_frame,
     inverse_distance_bearing,
     transpose_wgs84_enu_points,
 )
@@ -24,7 +38,13 @@ from .kml_export import (
     KmlStyle,
     export_kml,
 )
-from .kml_file_handling import KmlTrack, parse_kml_track
+from .file_fingerprints import FileFingerprint, file_fingerprint
+from .kml_file_handling import KmlTrack
+from .kml_track_cache import (
+    cached_parse_kml_track,
+    configure_parsed_track_cache,
+    parsed_track_cache_info,
+)
 from .map_preview import PreparedTrace
 from .runway_alignment import RunwayReference
 
@@ -32,6 +52,12 @@ from .runway_alignment import RunwayReference
 MAX_OUTPUT_COMPONENT_LENGTH = 96
 MAX_OUTPUT_STEM_LENGTH = 200
 TRANSPOSITION_FALLBACK_LINE_COLOUR = "aa00ffff"
+# Worker processes start with a fresh interpreter, so batches smaller than
+# this many input bytes are prepared in-process.
+PARALLEL_PREPARATION_MIN_BYTES = 8 * 1024 * 1024
+TRANSPOSITION_WRITE_WORKERS = 4
+PREPARATION_CACHE_SIZE = 32
+_CANCELLATION_POLL_S = 0.05
 LOGGER = logging.getLogger(__name__)
 
 
@@ -155,6 +181,38 @@ class TranspositionBatchResult:
         return self.total_count > 0 and self.success_count == 0
 
 
+class TranspositionPhase(str, Enum):
+    PREPARING = "preparing"
+    WRITING = "writing"
+
+
+@dataclass(frozen=True, slots=True)
+class TranspositionProgress:
+    """Per-file progress; files may complete out of input order."""
+
+    phase: TranspositionPhase
+    completed: int
+    total: int
+    input_path: Path | None
+    message: str
+
+
+class TranspositionCancelled(Exception):
+    """Raised cooperatively when a batch is cancelled between files.
+
+    An export cancelled part-way has already published some outputs;
+    ``result`` then holds their outcomes in input order.
+    """
+
+    def __init__(
+        self,
+        message: str = "Transposition cancelled.",
+        result: TranspositionBatchResult | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.result = result
+
+
 @dataclass(frozen=True, slots=True)
 class PreparedTranspositionFile:
     """One successfully prepared input, ready for preview or later export."""
@@ -219,6 +277,88 @@ class PreparedTranspositionBatch:
         return len(self.failed_items)
 
 
+@dataclass(frozen=True, slots=True)
+class PreparationKey:
+    """Everything a prepared file depends on apart from its trace identity."""
+
+    input_path: str
+    fingerprint: FileFingerprint
+    aircraft_name: str
+    source_runway: RunwayReference
+    target_runway: RunwayReference
+
+
+class PreparationCache:
+    """A least-recently-used map of preparation keys to prepared files.
+
+    Passing one cache to successive :func:`prepare_transposition` calls
+    re-prepares only the inputs whose contents, reviewed source runway or
+    target runway changed. Each call resizes the cache to hold its whole
+    batch, but never below ``max_entries``. Failures are never cached.
+    """
+
+    def __init__(self, max_entries: int = PREPARATION_CACHE_SIZE) -> None:
+        if max_entries < 0:
+            raise ValueError("The preparation cache size cannot be negative.")
+        self._min_entries = max_entries
+        self._max_entries = max_entries
+        self._entries: OrderedDict[PreparationKey, PreparedTranspositionFile] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: PreparationKey) -> PreparedTranspositionFile | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                self._entries.move_to_end(key)
+            return item
+
+    def fit_batch(self, count: int) -> None:
+        """Retain ``count`` entries, or the constructed size if larger.
+
+        Shrinking after a large batch drops the least recently used entries.
+        """
+        with self._lock:
+            self._max_entries = max(self._min_entries, count)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def store(self, key: PreparationKey, item: PreparedTranspositionFile) -> None:
+        with self._lock:
+            self._entries[key] = item
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _preparation_key(
+    input_path: Path,
+    aircraft_name: str,
+    reviewed_source: RunwayReference | None,
+    target_runway: RunwayReference,
+) -> PreparationKey | None:
+    if reviewed_source is None:
+        return None
+    try:
+        fingerprint = file_fingerprint(input_path)
+    except OSError:
+        return None
+    return PreparationKey(
+        str(input_path.resolve(strict=False)),
+        fingerprint,
+        aircraft_name,
+        reviewed_source,
+        target_runway,
+    )
+
+
 def _slug_component(value: str, fallback: str) -> str:
     ascii_value = unicodedata.normalize("NFKD", value).encode(
         "ascii", "ignore"
@@ -264,14 +404,41 @@ def create_transposition_plan(
     target_airfield: str,
 ) -> TranspositionPlan:
     """Plan one collision-free output per KML input without writing files."""
+    return create_transposition_plans(input_files, output_directory, (target_airfield,))[0]
+
+
+def create_transposition_plans(
+    input_files: Sequence[str | os.PathLike[str]],
+    output_directory: str | os.PathLike[str],
+    target_airfields: Sequence[str],
+) -> tuple[TranspositionPlan, ...]:
+    """Plan one output set per target airfield in a shared output directory.
+
+    Names are reserved across every plan, so two airfields with the same
+    slug still receive distinct files.
+    """
     if not input_files:
         raise ValueError("At least one input KML file is required.")
+    if not target_airfields:
+        raise ValueError("At least one target airfield is required.")
 
     output_dir = Path(output_directory)
     if not output_dir.is_dir():
         raise ValueError(f'Output directory does not exist: "{output_dir}".')
 
     occupied_names = {entry.name.casefold() for entry in output_dir.iterdir()}
+    return tuple(
+        _plan_for_airfield(input_files, output_dir, target_airfield, occupied_names)
+        for target_airfield in target_airfields
+    )
+
+
+def _plan_for_airfield(
+    input_files: Sequence[str | os.PathLike[str]],
+    output_dir: Path,
+    target_airfield: str,
+    occupied_names: set[str],
+) -> TranspositionPlan:
     target_slug = _slug_component(target_airfield, "airfield")
     jobs: list[TranspositionJob] = []
 
@@ -511,24 +678,31 @@ def _waypoints_for_transposition(
         raise ValueError(
             "Source ground-reference elevation is required for a KML using absolute altitude."
         )
-    waypoints: list[tuple[float, float, float]] = []
+    present = track.altitude_present
     omitted_missing_altitudes = 0
-    for point in track.points:
-        if track.altitude_mode == "absolute":
-            if point.altitude_m is None:
-                omitted_missing_altitudes += 1
-                continue
-            altitude = point.altitude_m - source_runway.elevation_m
-        elif track.altitude_mode == "relativeToGround":
-            altitude = point.altitude_m if point.altitude_m is not None else 0.0
-        elif track.altitude_mode == "clampToGround":
-            altitude = 0.0
-        else:
-            raise ValueError(
-                f'KML altitude mode "{track.altitude_mode}" cannot be converted '
-                "safely to relative-to-ground output."
-            )
-        waypoints.append((point.latitude, point.longitude, altitude))
+    if track.altitude_mode == "absolute":
+        omitted_missing_altitudes = int(np.count_nonzero(~present))
+        latitudes = track.latitudes[present]
+        longitudes = track.longitudes[present]
+        altitudes = track.altitudes[present] - source_runway.elevation_m
+    elif track.altitude_mode in ("relativeToGround", "clampToGround"):
+        latitudes = track.latitudes
+        longitudes = track.longitudes
+        altitudes = (
+            np.where(present, track.altitudes, 0.0)
+            if track.altitude_mode == "relativeToGround"
+            else np.zeros(len(track.points))
+        )
+    elif len(track.points):
+        raise ValueError(
+            f'KML altitude mode "{track.altitude_mode}" cannot be converted '
+            "safely to relative-to-ground output."
+        )
+    else:
+        latitudes = longitudes = altitudes = np.empty(0)
+    waypoints = list(
+        zip(latitudes.tolist(), longitudes.tolist(), altitudes.tolist())
+    )
     if track.altitude_mode == "absolute" and len(waypoints) < 2:
         raise ValueError(
             f"Omitted {omitted_missing_altitudes} source coordinate(s) because "
@@ -599,17 +773,233 @@ def _preparation_failure(
     )
 
 
+def _raise_if_cancelled(cancellation_check) -> None:
+    if cancellation_check is not None and cancellation_check():
+        raise TranspositionCancelled()
+
+
+def _run_ordered(
+    calls: Sequence[tuple],
+    results: list,
+    *,
+    executor: Executor | None,
+    phase: TranspositionPhase,
+    input_paths: Sequence[Path],
+    on_error,
+    progress_callback=None,
+    cancellation_check=None,
+    finish_running_on_cancel: bool = False,
+) -> None:
+    """Fill ``results`` in call order, reporting each file as it finishes.
+
+    Each call is a ``(function, *args)`` tuple. Without an executor the calls
+    run in-process one after another. Cancellation is checked between files;
+    work already running in a pool is abandoned, not interrupted, unless
+    ``finish_running_on_cancel`` is set. Then queued calls are cancelled and
+    running ones finish, with their results filled in before raising.
+    """
+    total = len(calls)
+    verb = "Prepared" if phase is TranspositionPhase.PREPARING else "Wrote"
+
+    def report(completed: int, input_path: Path | None) -> None:
+        if progress_callback is None:
+            return
+        message = (
+            f"{verb} {input_path.name} ({completed} of {total})."
+            if input_path is not None
+            else f"{phase.value.capitalize()} {total} file(s)."
+        )
+        progress_callback(
+            TranspositionProgress(phase, completed, total, input_path, message)
+        )
+
+    report(0, None)
+    if executor is None:
+        for index, (function, *args) in enumerate(calls):
+            _raise_if_cancelled(cancellation_check)
+            results[index] = function(*args)
+            report(index + 1, input_paths[index])
+        return
+
+    completed = 0
+    futures = {}
+    try:
+        futures = {
+            executor.submit(function, *args): index
+            for index, (function, *args) in enumerate(calls)
+        }
+        pending = set(futures)
+        while pending:
+            _raise_if_cancelled(cancellation_check)
+            done, pending = wait(
+                pending,
+                timeout=_CANCELLATION_POLL_S,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in sorted(done, key=futures.__getitem__):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as error:
+                    # The call itself reports per-file errors; this only sees
+                    # pool failures such as a worker process dying.
+                    results[index] = on_error(index, error)
+                completed += 1
+                report(completed, input_paths[index])
+    except TranspositionCancelled:
+        if not finish_running_on_cancel:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True, cancel_futures=True)
+        for future, index in futures.items():
+            if results[index] is not None or future.cancelled():
+                continue
+            try:
+                results[index] = future.result()
+            except Exception as error:
+                results[index] = on_error(index, error)
+        raise
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+
+
+def _initialize_preparation_worker(
+    max_bytes: int, sidecar_dir: Path | None
+) -> None:
+    configure_parsed_track_cache(max_bytes=max_bytes, sidecar_dir=sidecar_dir)
+
+
+def _preparation_executor(
+    input_paths: Sequence[Path], max_workers: int | None
+) -> ProcessPoolExecutor | None:
+    workers = min(
+        len(input_paths),
+        max_workers if max_workers is not None else (os.cpu_count() or 1),
+    )
+    if workers < 2:
+        return None
+    if max_workers is None:
+        total_bytes = 0
+        for input_path in input_paths:
+            try:
+                total_bytes += input_path.stat().st_size
+            except OSError:
+                continue
+        if total_bytes < PARALLEL_PREPARATION_MIN_BYTES:
+            return None
+    cache = parsed_track_cache_info()
+    # Spawned workers never inherit the GUI's threads or Qt state.
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_preparation_worker,
+        initargs=(cache.max_bytes, cache.sidecar_dir),
+    )
+
+
+def _prepare_in_process(call: tuple, error: Exception) -> PreparedTranspositionItem:
+    function, input_path, *args = call
+    LOGGER.warning(
+        "Preparation worker failed for %s (%s); retrying in-process.",
+        input_path,
+        error.__class__.__name__,
+    )
+    return function(input_path, *args)
+
+
+def _prepare_source(
+    input_path: Path,
+    aircraft_name: str,
+    reviewed_source: RunwayReference | None,
+    target_runway: RunwayReference,
+    anchor: KmlCoordinate,
+    trace_id: str,
+    label: str,
+) -> PreparedTranspositionItem:
+    """Parse, convert and transpose one input.
+
+    Parallel batches run this in a worker process, so its arguments and
+    result must be picklable.
+    """
+    LOGGER.info("Preparing transposition for %s", input_path)
+    try:
+        track = cached_parse_kml_track(input_path)
+    except Exception as error:
+        return _preparation_failure(
+            input_path, TranspositionErrorCode.INPUT_KML, error
+        )
+
+    try:
+        if reviewed_source is None:
+            raise ValueError(
+                "Source runway alignment has not been reviewed for this input."
+            )
+        waypoints, processing_warnings = _waypoints_for_transposition(
+            track,
+            reviewed_source,
+        )
+        adjusted_waypoints = transpose_wgs84_enu_points(
+            waypoints,
+            (reviewed_source.latitude, reviewed_source.longitude),
+            (target_runway.latitude, target_runway.longitude),
+            target_runway.true_heading_deg
+            - reviewed_source.true_heading_deg,
+        )
+        document = _transposition_document(
+            adjusted_waypoints,
+            aircraft_name,
+            processing_warnings=processing_warnings,
+            line_colour=(
+                track.source_line_colour
+                or TRANSPOSITION_FALLBACK_LINE_COLOUR
+            ),
+        )
+        trace = PreparedTrace(
+            trace_id=trace_id,
+            label=label,
+            anchor=anchor,
+            base_document=document,
+        )
+    except Exception as error:
+        return _preparation_failure(
+            input_path,
+            TranspositionErrorCode.TRANSFORMATION,
+            error,
+        )
+
+    return PreparedTranspositionFile(
+        input_path=input_path,
+        aircraft_name=aircraft_name,
+        trace=trace,
+        warnings=processing_warnings,
+    )
+
+
 def prepare_transposition(
     plan: TranspositionPlan | None = None,
     target_runway: RunwayReference | None = None,
     *,
     input_files: Sequence[str | os.PathLike[str]] | None = None,
     source_runways: Sequence[RunwayReference | None] | None = None,
+    max_workers: int | None = None,
+    progress_callback=None,
+    cancellation_check=None,
+    cache: PreparationCache | None = None,
 ) -> PreparedTranspositionBatch:
     """Prepare transposed KML documents in memory without writing files.
 
     Existing callers can provide a reviewed plan. Preview-first callers can
     provide ordered inputs and source runways before selecting an output folder.
+
+    Batches of at least ``PARALLEL_PREPARATION_MIN_BYTES`` are prepared on a
+    process pool with one worker per core; an explicit ``max_workers`` above
+    one always uses the pool. Items keep input order whatever order the files
+    finish in. ``cancellation_check`` is polled between files and raises
+    :class:`TranspositionCancelled`. With a ``cache``, inputs prepared by an
+    earlier call for the same contents and runways are reused, and progress
+    covers only the files that still need preparing.
     """
     if target_runway is None:
         raise TypeError("target_runway is required.")
@@ -647,66 +1037,167 @@ def prepare_transposition(
         latitude=target_runway.latitude,
         altitude_m=0.0,
     )
-    items: list[PreparedTranspositionItem] = []
     label_counts = Counter(aircraft_name for _, aircraft_name, _ in sources)
-
-    for index, (input_path, aircraft_name, reviewed_source) in enumerate(sources):
-        LOGGER.info("Preparing transposition for %s", input_path)
-        try:
-            track = parse_kml_track(input_path)
-        except Exception as error:
-            items.append(
-                _preparation_failure(
-                    input_path, TranspositionErrorCode.INPUT_KML, error
+    input_paths = tuple(input_path for input_path, _, _ in sources)
+    calls = [
+        (
+            _prepare_source,
+            input_path,
+            aircraft_name,
+            reviewed_source,
+            target_runway,
+            anchor,
+            f"transposition-{index}",
+            (
+                aircraft_name
+                if label_counts[aircraft_name] == 1
+                else f"{aircraft_name} — {input_path.parent}"
+            ),
+        )
+        for index, (input_path, aircraft_name, reviewed_source) in enumerate(sources)
+    ]
+    items: list[PreparedTranspositionItem | None] = [None] * len(calls)
+    keys: list[PreparationKey | None] = [None] * len(calls)
+    if cache is not None:
+        for index, (_, input_path, aircraft_name, reviewed_source, *_rest) in enumerate(calls):
+            keys[index] = _preparation_key(
+                input_path, aircraft_name, reviewed_source, target_runway
+            )
+            cached = cache.get(keys[index]) if keys[index] is not None else None
+            if cached is not None:
+                trace = cached.trace.with_identity(*calls[index][-2:])
+                items[index] = (
+                    cached if trace is cached.trace else replace(cached, trace=trace)
                 )
+        # After the lookups, so this batch's hits are the most recent entries.
+        cache.fit_batch(len(calls))
+
+    missing = [index for index, item in enumerate(items) if item is None]
+    if missing:
+        pending_calls = [calls[index] for index in missing]
+        pending_paths = tuple(input_paths[index] for index in missing)
+        prepared: list[PreparedTranspositionItem | None] = [None] * len(missing)
+        _run_ordered(
+            pending_calls,
+            prepared,
+            executor=_preparation_executor(pending_paths, max_workers),
+            phase=TranspositionPhase.PREPARING,
+            input_paths=pending_paths,
+            on_error=lambda index, error: _prepare_in_process(
+                pending_calls[index], error
+            ),
+            progress_callback=progress_callback,
+            cancellation_check=cancellation_check,
+        )
+        for index, item in zip(missing, prepared, strict=True):
+            items[index] = item
+            if (
+                cache is not None
+                and keys[index] is not None
+                and isinstance(item, PreparedTranspositionFile)
+            ):
+                cache.store(keys[index], item)
+
+    return PreparedTranspositionBatch(
+        target_runway=target_runway,
+        items=tuple(items),
+    )
+
+
+def _transpose_from_source_enu(
+    source_enu: EnuBlock,
+    reviewed_source: RunwayReference,
+    target_runway: RunwayReference,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rotate source-frame ENU positions and project them from the target frame.
+
+    This is the same chain as the fused pipeline in
+    :func:`transpose_wgs84_enu_points`, split after the source frame so a
+    track converted once can be placed at several targets.
+    """
+    radians = math.radians(
+        target_runway.true_heading_deg - reviewed_source.true_heading_deg
+    )
+    cosine = math.cos(radians)
+    sine = math.sin(radians)
+    east = cosine * source_enu.east_m + sine * source_enu.north_m
+    north = -sine * source_enu.east_m + cosine * source_enu.north_m
+    return cached_local_enu_frame(
+        target_runway.latitude, target_runway.longitude
+    ).to_wgs84_array(east, north, source_enu.up_m)
+
+
+def _prepare_source_for_targets(
+    input_path: Path,
+    aircraft_name: str,
+    reviewed_source: RunwayReference | None,
+    target_runways: tuple[RunwayReference, ...],
+    trace_id: str,
+    label: str,
+) -> tuple[PreparedTranspositionItem, ...]:
+    """Parse and convert one input once, then place it at every target.
+
+    Returns one item per target in target order.
+    """
+    LOGGER.info(
+        "Preparing transposition for %s at %d targets", input_path, len(target_runways)
+    )
+    try:
+        track = cached_parse_kml_track(input_path)
+    except Exception as error:
+        failure = _preparation_failure(input_path, TranspositionErrorCode.INPUT_KML, error)
+        return (failure,) * len(target_runways)
+
+    try:
+        if reviewed_source is None:
+            raise ValueError(
+                "Source runway alignment has not been reviewed for this input."
             )
-            continue
+        waypoints, processing_warnings = _waypoints_for_transposition(
+            track,
+            reviewed_source,
+        )
+        table = np.array(waypoints, dtype=np.float64).reshape(-1, 3)
+        altitudes = table[:, 2].tolist()
+        source_enu = cached_local_enu_frame(
+            reviewed_source.latitude, reviewed_source.longitude
+        ).to_enu_array(table[:, 0], table[:, 1])
+    except Exception as error:
+        failure = _preparation_failure(
+            input_path, TranspositionErrorCode.TRANSFORMATION, error
+        )
+        return (failure,) * len(target_runways)
 
+    line_colour = track.source_line_colour or TRANSPOSITION_FALLBACK_LINE_COLOUR
+    items: list[PreparedTranspositionItem] = []
+    for target_runway in target_runways:
         try:
-            if reviewed_source is None:
-                raise ValueError(
-                    "Source runway alignment has not been reviewed for this input."
-                )
-            waypoints, processing_warnings = _waypoints_for_transposition(
-                track,
-                reviewed_source,
-            )
-            adjusted_waypoints = transpose_wgs84_enu_points(
-                waypoints,
-                (reviewed_source.latitude, reviewed_source.longitude),
-                (target_runway.latitude, target_runway.longitude),
-                target_runway.true_heading_deg
-                - reviewed_source.true_heading_deg,
+            latitudes, longitudes = _transpose_from_source_enu(
+                source_enu, reviewed_source, target_runway
             )
             document = _transposition_document(
-                adjusted_waypoints,
+                tuple(zip(latitudes.tolist(), longitudes.tolist(), altitudes)),
                 aircraft_name,
                 processing_warnings=processing_warnings,
-                line_colour=(
-                    track.source_line_colour
-                    or TRANSPOSITION_FALLBACK_LINE_COLOUR
-                ),
+                line_colour=line_colour,
             )
             trace = PreparedTrace(
-                trace_id=f"transposition-{index}",
-                label=(
-                    aircraft_name
-                    if label_counts[aircraft_name] == 1
-                    else f"{aircraft_name} — {input_path.parent}"
+                trace_id=trace_id,
+                label=label,
+                anchor=KmlCoordinate(
+                    longitude=target_runway.longitude,
+                    latitude=target_runway.latitude,
+                    altitude_m=0.0,
                 ),
-                anchor=anchor,
                 base_document=document,
             )
         except Exception as error:
             items.append(
                 _preparation_failure(
-                    input_path,
-                    TranspositionErrorCode.TRANSFORMATION,
-                    error,
+                    input_path, TranspositionErrorCode.TRANSFORMATION, error
                 )
             )
             continue
-
         items.append(
             PreparedTranspositionFile(
                 input_path=input_path,
@@ -715,10 +1206,73 @@ def prepare_transposition(
                 warnings=processing_warnings,
             )
         )
+    return tuple(items)
 
-    return PreparedTranspositionBatch(
-        target_runway=target_runway,
-        items=tuple(items),
+
+def prepare_transposition_targets(
+    target_runways: Sequence[RunwayReference],
+    *,
+    input_files: Sequence[str | os.PathLike[str]],
+    source_runways: Sequence[RunwayReference | None],
+    max_workers: int | None = None,
+    progress_callback=None,
+    cancellation_check=None,
+) -> tuple[PreparedTranspositionBatch, ...]:
+    """Prepare the same inputs for several target runways in one pass.
+
+    Each input is parsed and converted to its source runway frame once, on
+    the same worker pool :func:`prepare_transposition` would use; only the
+    heading rotation and target projection are repeated per target. Returns
+    one batch per target, in target order, each with items in input order.
+    Progress counts input files, not input-target pairs.
+    """
+    target_runways = tuple(target_runways)
+    if not target_runways:
+        raise ValueError("At least one target runway is required.")
+    if not input_files:
+        raise ValueError("At least one input KML file is required.")
+    if len(input_files) != len(source_runways):
+        raise ValueError(
+            "Provide exactly one source runway review for each input KML file."
+        )
+
+    input_paths = tuple(Path(input_path) for input_path in input_files)
+    label_counts = Counter(input_path.stem for input_path in input_paths)
+    calls = [
+        (
+            _prepare_source_for_targets,
+            input_path,
+            input_path.stem,
+            reviewed_source,
+            target_runways,
+            f"transposition-{index}",
+            (
+                input_path.stem
+                if label_counts[input_path.stem] == 1
+                else f"{input_path.stem} — {input_path.parent}"
+            ),
+        )
+        for index, (input_path, reviewed_source) in enumerate(
+            zip(input_paths, source_runways, strict=True)
+        )
+    ]
+    per_input: list[tuple[PreparedTranspositionItem, ...] | None] = [None] * len(calls)
+    _run_ordered(
+        calls,
+        per_input,
+        executor=_preparation_executor(input_paths, max_workers),
+        phase=TranspositionPhase.PREPARING,
+        input_paths=input_paths,
+        on_error=lambda index, error: _prepare_in_process(calls[index], error),
+        progress_callback=progress_callback,
+        cancellation_check=cancellation_check,
+    )
+    return tuple(
+        PreparedTranspositionBatch(
+            target_runway=target_runway,
+            items=tuple(items[target_index] for items in per_input),
+        )
+        for target_index, target_runway in enumerate(target_runways)
     )
 
 
@@ -762,68 +1316,146 @@ def _document_waypoints(
 def export_prepared_transposition(
     prepared_batch: PreparedTranspositionBatch,
     plan: TranspositionPlan,
+    *,
+    max_workers: int | None = None,
+    progress_callback=None,
+    cancellation_check=None,
 ) -> TranspositionBatchResult:
-    """Write prepared documents with the supplied output plan."""
-    _validate_transposition_plan(plan)
-    if len(prepared_batch.items) != len(plan.jobs):
-        raise ValueError(
-            "The prepared batch and output plan must contain the same inputs."
-        )
-    for item, job in zip(prepared_batch.items, plan.jobs, strict=True):
-        prepared_input = item.input_path.resolve(strict=False)
-        planned_input = job.input_path.resolve(strict=False)
-        if prepared_input != planned_input:
-            raise ValueError(
-                "Prepared inputs must match the output plan in the same order."
-            )
+    """Write prepared documents with the supplied output plan.
 
-    outcomes: list[TranspositionFileOutcome] = []
-    for item, job in zip(prepared_batch.items, plan.jobs, strict=True):
-        output_path = job.output_path
-        if isinstance(item, PreparedTranspositionFailure):
-            outcomes.append(_prepared_failure_outcome(job, item))
-            continue
+    Files are rendered and published on a thread pool of up to
+    ``TRANSPOSITION_WRITE_WORKERS`` threads and outcomes keep plan order.
+    A cancelled export waits for writes already under way and raises
+    :class:`TranspositionCancelled` carrying the outcomes of every file
+    written.
+    """
+    return export_prepared_transpositions(
+        ((prepared_batch, plan),),
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        cancellation_check=cancellation_check,
+    )[0]
 
-        LOGGER.info("Exporting prepared transposition for %s", job.input_path)
-        try:
-            write_kml(
-                output_path,
-                _document_waypoints(item.document),
-                job.aircraft_name,
-                overwrite=job.overwrite_existing,
-                processing_warnings=item.warnings,
-                _document=item.document,
+
+def export_prepared_transpositions(
+    batches: Sequence[tuple[PreparedTranspositionBatch, TranspositionPlan]],
+    *,
+    max_workers: int | None = None,
+    progress_callback=None,
+    cancellation_check=None,
+) -> tuple[TranspositionBatchResult, ...]:
+    """Write several prepared batches, such as one per target, on one pool.
+
+    Returns one result per ``(batch, plan)`` pair. Progress counts every
+    file across the pairs; a cancelled export carries the finished outcomes
+    of all pairs, in order, as one result.
+    """
+    if not batches:
+        raise ValueError("At least one prepared batch is required.")
+    calls = []
+    jobs: list[TranspositionJob] = []
+    for prepared_batch, plan in batches:
+        _validate_transposition_plan(plan)
+        if len(prepared_batch.items) != len(plan.jobs):
+            raise ValueError(
+                "The prepared batch and output plan must contain the same inputs."
             )
-        except FileExistsError as error:
-            outcomes.append(
-                _failure_outcome(
-                    job,
-                    output_path,
-                    TranspositionErrorCode.OUTPUT_COLLISION,
-                    error,
+        for item, job in zip(prepared_batch.items, plan.jobs, strict=True):
+            prepared_input = item.input_path.resolve(strict=False)
+            planned_input = job.input_path.resolve(strict=False)
+            if prepared_input != planned_input:
+                raise ValueError(
+                    "Prepared inputs must match the output plan in the same order."
                 )
-            )
-            continue
-        except Exception as error:
-            outcomes.append(
-                _failure_outcome(
-                    job, output_path, TranspositionErrorCode.FILESYSTEM_WRITE, error
+            calls.append((_export_prepared_item, item, job))
+            jobs.append(job)
+
+    outcomes: list[TranspositionFileOutcome | None] = [None] * len(calls)
+    workers = min(
+        len(calls),
+        max_workers if max_workers is not None else TRANSPOSITION_WRITE_WORKERS,
+    )
+    try:
+        _run_ordered(
+            calls,
+            outcomes,
+            executor=(
+                ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="transposition-write",
                 )
+                if workers > 1
+                else None
+            ),
+            phase=TranspositionPhase.WRITING,
+            input_paths=tuple(job.input_path for job in jobs),
+            on_error=lambda index, error: _failure_outcome(
+                jobs[index],
+                jobs[index].output_path,
+                TranspositionErrorCode.FILESYSTEM_WRITE,
+                error,
+            ),
+            progress_callback=progress_callback,
+            cancellation_check=cancellation_check,
+            # A write that has started publishes its file, so it must be
+            # waited for and reported rather than left running.
+            finish_running_on_cancel=True,
+        )
+    except TranspositionCancelled as cancelled:
+        cancelled.result = TranspositionBatchResult(
+            outcomes=tuple(outcome for outcome in outcomes if outcome is not None)
+        )
+        raise
+    results = []
+    offset = 0
+    for _, plan in batches:
+        results.append(
+            TranspositionBatchResult(
+                outcomes=tuple(outcomes[offset:offset + len(plan.jobs)])
             )
-            continue
+        )
+        offset += len(plan.jobs)
+    return tuple(results)
 
-        outcomes.append(
-            TranspositionFileOutcome(
-                input_path=job.input_path,
-                planned_output_path=job.output_path,
-                final_output_path=output_path,
-                status=TranspositionFileStatus.SUCCEEDED,
-                warnings=item.warnings,
-            )
+
+def _export_prepared_item(
+    item: PreparedTranspositionItem,
+    job: TranspositionJob,
+) -> TranspositionFileOutcome:
+    output_path = job.output_path
+    if isinstance(item, PreparedTranspositionFailure):
+        return _prepared_failure_outcome(job, item)
+
+    LOGGER.info("Exporting prepared transposition for %s", job.input_path)
+    try:
+        write_kml(
+            output_path,
+            _document_waypoints(item.document),
+            job.aircraft_name,
+            overwrite=job.overwrite_existing,
+            processing_warnings=item.warnings,
+            _document=item.document,
+        )
+    except FileExistsError as error:
+        return _failure_outcome(
+            job,
+            output_path,
+            TranspositionErrorCode.OUTPUT_COLLISION,
+            error,
+        )
+    except Exception as error:
+        return _failure_outcome(
+            job, output_path, TranspositionErrorCode.FILESYSTEM_WRITE, error
         )
-        LOGGER.info("Transposition saved to %s", output_path)
 
-    return TranspositionBatchResult(outcomes=tuple(outcomes))
+    LOGGER.info("Transposition saved to %s", output_path)
+    return TranspositionFileOutcome(
+        input_path=job.input_path,
+        planned_output_path=job.output_path,
+        final_output_path=output_path,
+        status=TranspositionFileStatus.SUCCEEDED,
+        warnings=item.warnings,
+    )
 
 
 def _validate_transposition_plan(plan: TranspositionPlan) -> None:
@@ -879,6 +1511,8 @@ def run_transposition(
     source_runway: RunwayReference | None = None,
     input_files: Sequence[str | os.PathLike[str]] | None = None,
     output_file: str | os.PathLike[str] | None = None,
+    progress_callback=None,
+    cancellation_check=None,
 ) -> TranspositionBatchResult:
     """Run reviewed runway-to-runway jobs and return one outcome per input.
 
@@ -986,8 +1620,15 @@ def run_transposition(
     prepared_batch = prepare_transposition(
         plan=active_plan,
         target_runway=resolved_target,
+        progress_callback=progress_callback,
+        cancellation_check=cancellation_check,
+    )
+    return export_prepared_transposition(
+        prepared_batch,
+        active_plan,
+        progress_callback=progress_callback,
+        cancellation_check=cancellation_check,
     )
-    return export_prepared_transposition(prepared_batch, active_plan)
 
 
 if __name__ == "__main__":
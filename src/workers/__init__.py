@@ -5,9 +5,19 @@ from .debris_simulation_worker import (
     DebrisSimulationWorker,
     SimulationFailure,
 )
+from .runway_inference_queue import (
+    RUNWAY_INFERENCE_WORKERS,
+    RunwayAnalysis,
+    RunwayInferenceQueue,
+)
+from .transposition_worker import TranspositionWorker
 
 __all__ = [
+    "RUNWAY_INFERENCE_WORKERS",
     "CancellationToken",
     "DebrisSimulationWorker",
+    "RunwayAnalysis",
+    "RunwayInferenceQueue",
     "SimulationFailure",
+    "TranspositionWorker",
 ]
@@ -0,0 +1,121 @@
+"""Background runway inference for newly added transposition inputs."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
+
+from services import RunwayInferenceResult
+
+
+RUNWAY_INFERENCE_WORKERS = 2
+
+
+@dataclass(frozen=True, slots=True)
+class RunwayAnalysis:
+    path: str
+    altitude_mode: str | None = None
+    inference: RunwayInferenceResult | None = None
+    error: str | None = None
+
+
+class RunwayInferenceQueue(QObject):
+    """Analyse source files on a small thread pool, most urgent first.
+
+    Paths wait in a queue owned by the GUI thread and are handed to the pool
+    only as a worker frees up, so :meth:`prioritise` can still move a waiting
+    file to the front. ``analyser`` runs on a pool thread and returns a
+    :class:`RunwayAnalysis`; exceptions it raises become the analysis error.
+    Results are delivered on the queue's thread through ``analysed``.
+    """
+
+    started = pyqtSignal(str)
+    analysed = pyqtSignal(object)
+    _completed = pyqtSignal(object)
+
+    def __init__(self, analyser, *, max_workers=RUNWAY_INFERENCE_WORKERS, parent=None):
+        super().__init__(parent)
+        if max_workers < 1:
+            raise ValueError("The runway inference queue needs at least one worker.")
+        self._analyser = analyser
+        self._max_workers = max_workers
+        self._executor = None
+        self._waiting: deque[str] = deque()
+        self._running: set[str] = set()
+        self._discarded: set[str] = set()
+        self._completed.connect(self._finish, Qt.ConnectionType.QueuedConnection)
+
+    def enqueue(self, paths) -> None:
+        for path in map(str, paths):
+            if path in self._running:
+                self._discarded.discard(path)
+            elif path not in self._waiting:
+                self._waiting.append(path)
+        self._dispatch()
+
+    def prioritise(self, path) -> None:
+        """Analyse ``path`` next, queueing it first if necessary."""
+        path = str(path)
+        if path in self._running:
+            self._discarded.discard(path)
+            return
+        if path in self._waiting:
+            self._waiting.remove(path)
+        self._waiting.appendleft(path)
+        self._dispatch()
+
+    def discard(self, path) -> None:
+        """Forget ``path``; a result already being computed is dropped."""
+        path = str(path)
+        if path in self._waiting:
+            self._waiting.remove(path)
+        if path in self._running:
+            self._discarded.add(path)
+
+    def is_running(self, path) -> bool:
+        path = str(path)
+        return path in self._running and path not in self._discarded
+
+    def is_pending(self, path) -> bool:
+        return str(path) in self._waiting or self.is_running(path)
+
+    def is_idle(self) -> bool:
+        return not self._waiting and not self._running
+
+    def shutdown(self) -> None:
+        self._waiting.clear()
+        self._discarded.update(self._running)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _dispatch(self) -> None:
+        while self._waiting and len(self._running) < self._max_workers:
+            path = self._waiting.popleft()
+            self._running.add(path)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="runway-inference",
+                )
+            self.started.emit(path)
+            self._executor.submit(self._analyse, path)
+
+    def _analyse(self, path: str) -> None:
+        try:
+            analysis = self._analyser(path)
+        except Exception as error:
+            analysis = RunwayAnalysis(path, error=str(error) or error.__class__.__name__)
+        self._completed.emit(analysis)
+
+    @pyqtSlot(object)
+    def _finish(self, analysis: RunwayAnalysis) -> None:
+        self._running.discard(analysis.path)
+        if analysis.path in self._discarded:
+            self._discarded.remove(analysis.path)
+        else:
+            self.analysed.emit(analysis)
+        self._dispatch()
@@ -0,0 +1,73 @@
+"""One-shot Qt worker for a transposition preparation or export batch."""
+
+from __future__ import annotations
+
+import traceback
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from services import TranspositionCancelled
+
+from .debris_simulation_worker import SimulationFailure
+
+
+class TranspositionWorker(QObject):
+    """Run one batch task away from the GUI thread.
+
+    ``task`` is called with ``progress_callback`` and ``cancellation_check``
+    keywords, matching :func:`services.prepare_transposition` and
+    :func:`services.export_prepared_transposition`. ``cancelled`` carries the
+    partial result attached to :class:`services.TranspositionCancelled`, or
+    ``None`` when nothing was completed.
+    """
+
+    progress = pyqtSignal(object)
+    succeeded = pyqtSignal(object)
+    cancelled = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    finished = pyqtSignal()
+
+    def __init__(self, task, cancellation_token):
+        super().__init__()
+        if not callable(task):
+            raise TypeError("task must be callable")
+        self._task = task
+        self._cancellation_token = cancellation_token
+        self._ran = False
+
+    @pyqtSlot()
+    def run(self):
+        if self._ran:
+            return
+        self._ran = True
+        terminal_emitted = False
+        try:
+            result = self._task(
+                progress_callback=self.progress.emit,
+                cancellation_check=self._cancellation_token.is_cancelled,
+            )
+        except TranspositionCancelled as error:
+            terminal_emitted = True
+            self.cancelled.emit(error.result)
+        except Exception as error:
+            terminal_emitted = True
+            self.failed.emit(
+                SimulationFailure(
+                    exception_type=error.__class__.__name__,
+                    message=str(error) or error.__class__.__name__,
+                    traceback=traceback.format_exc(),
+                )
+            )
+        else:
+            terminal_emitted = True
+            self.succeeded.emit(result)
+        finally:
+            if not terminal_emitted:
+                self.failed.emit(
+                    SimulationFailure(
+                        exception_type="WorkerTerminalError",
+                        message="The transposition worker exited without a terminal result.",
+                        traceback="",
+                    )
+                )
+            self.finished.emit()
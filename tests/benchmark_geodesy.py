@@ -0,0 +1,76 @@
+"""Throughput benchmarks for the array geodesy paths.
+
+Run directly: ``python tests/benchmark_geodesy.py``. Not collected by the
+test runners because timings depend on the host.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from services.geodesy import (
+    cached_enu_transposition,
+    cached_local_enu_frame,
+    transpose_wgs84_enu_points,
+)
+
+
+POINT_COUNT = 100_000
+REPEATS = 10
+SOURCE_ORIGIN = (51.0, -1.0)
+TARGET_ORIGIN = (-33.9, 151.2)
+HEADING_DELTA_DEG = 37.0
+
+
+def best_of(function, repeats=REPEATS):
+    function()
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def two_frame_transposition(latitudes, longitudes):
+    source = cached_local_enu_frame(*SOURCE_ORIGIN)
+    target = cached_local_enu_frame(*TARGET_ORIGIN)
+    heading = np.radians(HEADING_DELTA_DEG)
+    cosine, sine = np.cos(heading), np.sin(heading)
+    positions = source.to_enu_array(latitudes, longitudes)
+    return target.to_wgs84_array(
+        positions.east_m * cosine + positions.north_m * sine,
+        -positions.east_m * sine + positions.north_m * cosine,
+        positions.up_m,
+    )
+
+
+def main():
+    rng = np.random.default_rng(0)
+    latitudes = SOURCE_ORIGIN[0] + rng.uniform(-0.5, 0.5, POINT_COUNT)
+    longitudes = SOURCE_ORIGIN[1] + rng.uniform(-0.5, 0.5, POINT_COUNT)
+    altitudes = rng.uniform(0.0, 500.0, POINT_COUNT)
+    points = list(zip(latitudes.tolist(), longitudes.tolist(), altitudes.tolist()))
+    fused = cached_enu_transposition(SOURCE_ORIGIN, TARGET_ORIGIN, HEADING_DELTA_DEG)
+
+    cases = (
+        ("two frames + NumPy rotation", lambda: two_frame_transposition(latitudes, longitudes)),
+        ("fused PROJ pipeline", lambda: fused.transform_array(latitudes, longitudes)),
+        ("transpose_wgs84_enu_points", lambda: transpose_wgs84_enu_points(
+            points, SOURCE_ORIGIN, TARGET_ORIGIN, HEADING_DELTA_DEG
+        )),
+    )
+    print(f"{POINT_COUNT:,} points, best of {REPEATS}")
+    for label, function in cases:
+        elapsed = best_of(function)
+        print(f"  {label:<30} {elapsed * 1e3:8.1f} ms  {POINT_COUNT / elapsed / 1e6:6.2f} Mpt/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from services import (
+    DebrisEnsembleRequest,
+    DebrisSimulationRequest,
+    DebrisTrajectoryCalculator,
+    SimulationCancelled,
+    SimulationPhase,
+    UniformRange,
+    run_debris_ensemble_request,
+)
+
+
+def make_request(**overrides):
+    values = {
+        "mass_kg": 10.0,
+        "area_m2": 0.1,
+        "Cd": 0.5,
+        "rho": 1.225,
+        "g": 9.81,
+        "dt": 0.01,
+        "ktas": 50.0,
+        "surface": "concrete",
+        "slide_physics": 0.5,
+        "include_ground_drag": True,
+        "terrain_m": 5.0,
+        "altitude_m": 25.0,
+        "input_coords": None,
+        "input_bearing": (51.0, -1.0, 90.0),
+    }
+    values.update(overrides)
+    return DebrisSimulationRequest(**values)
+
+
+def serial_summary(request):
+    calculator = DebrisTrajectoryCalculator(
+        mass_kg=request.mass_kg,
+        area_m2=request.area_m2,
+        Cd=request.Cd,
+        rho=request.rho,
+        g=request.g,
+        dt=request.dt,
+        ktas=request.ktas,
+        surface=request.surface,
+        slide_physics=request.slide_physics,
+        include_ground_drag=request.include_ground_drag,
+        terrain_m=request.terrain_m,
+        altitude_m=request.altitude_m,
+        input_coords=request.input_coords,
+        input_bearing=request.input_bearing,
+    )
+    summary, _ = calculator.simulate_3d(
+        m=request.mass_kg, A=request.area_m2, Cd=request.Cd, rho=request.rho,
+        g=request.g, dt=request.dt, alt_m=calculator.alt_m_relative,
+        ktas=request.ktas, angle_deg=0.0, surface=request.surface,
+        include_ground_drag=request.include_ground_drag,
+        vz_bounce_min=request.slide_physics,
+    )
+    return summary
+
+
+class DebrisEnsembleTests(unittest.TestCase):
+    def test_members_without_spread_match_the_serial_simulation(self):
+        for surface in ("concrete", "asphalt", "grass"):
+            with self.subTest(surface=surface):
+                request = make_request(surface=surface)
+                expected = serial_summary(request)
+
+                result = run_debris_ensemble_request(
+                    DebrisEnsembleRequest(base=request, member_count=3)
+                )
+
+                statistics = result.statistics
+                for values, key in (
+                    (statistics.air_distance_m, "air_dist_xy_m"),
+                    (statistics.ground_distance_m, "ground_dist_xy_m"),
+                    (statistics.total_distance_m, "total_dist_xy_m"),
+                ):
+                    for value in values:
+                        self.assertAlmostEqual(value, expected[key], places=9)
+                self.assertTrue(np.all(result.impacts == expected["impacts"]))
+                self.assertEqual(result.heading, 90.0)
+
+    def test_sampled_members_match_serial_runs_with_the_same_inputs(self):
+        request = DebrisEnsembleRequest(
+            base=make_request(),
+            member_count=6,
+            seed=11,
+            mass_kg=UniformRange(2.0, 40.0),
+            Cd=UniformRange(0.3, 1.2),
+            ktas=UniformRange(40.0, 160.0),
+        )
+        result = run_debris_ensemble_request(request)
+
+        generator = np.random.default_rng(11)
+        masses = generator.uniform(2.0, 40.0, 6)
+        drag_coefficients = generator.uniform(0.3, 1.2, 6)
+        speeds = generator.uniform(40.0, 160.0, 6)
+        for index in range(6):
+            expected = serial_summary(
+                make_request(
+                    mass_kg=float(masses[index]),
+                    Cd=float(drag_coefficients[index]),
+                    ktas=float(speeds[index]),
+                )
+            )
+            self.assertAlmostEqual(
+                float(np.hypot(
+                    result.rest_along_track_m[index],
+                    result.rest_cross_track_m[index],
+                )),
+                expected["total_dist_xy_m"],
+                places=9,
+            )
+
+    def test_seeded_runs_are_reproducible_and_statistics_are_ordered(self):
+        request = DebrisEnsembleRequest(
+            base=make_request(),
+            member_count=200,
+            seed=7,
+            mass_kg=UniformRange(5.0, 20.0),
+            area_m2=UniformRange(0.05, 0.2),
+            ktas=UniformRange(30.0, 90.0),
+            surfaces=("concrete", "grass"),
+            footprint_cell_m=2.0,
+        )
+
+        first = run_debris_ensemble_request(request)
+        second = run_debris_ensemble_request(request)
+        different = run_debris_ensemble_request(
+            DebrisEnsembleRequest(
+                base=request.base,
+                member_count=200,
+                seed=8,
+                mass_kg=request.mass_kg,
+                area_m2=request.area_m2,
+                ktas=request.ktas,
+                surfaces=request.surfaces,
+            )
+        )
+
+        self.assertEqual(first.statistics, second.statistics)
+        np.testing.assert_array_equal(
+            first.rest_along_track_m,
+            second.rest_along_track_m,
+        )
+        self.assertNotEqual(first.statistics, different.statistics)
+        total = first.statistics.total_distance_m
+        self.assertEqual(list(total), sorted(total))
+        self.assertAlmostEqual(float(first.footprint.probabilities.sum()), 1.0)
+        self.assertEqual(
+            first.footprint.probabilities.shape,
+            (
+                first.footprint.along_track_edges_m.size - 1,
+                first.footprint.cross_track_edges_m.size - 1,
+            ),
+        )
+
+    def test_progress_is_reported_and_cancellation_is_cooperative(self):
+        progress = []
+        run_debris_ensemble_request(
+            DebrisEnsembleRequest(base=make_request(), member_count=10),
+            progress_callback=progress.append,
+        )
+        self.assertTrue(progress)
+        self.assertTrue(
+            all(item.phase is SimulationPhase.SIMULATING for item in progress)
+        )
+        self.assertEqual(progress[-1].completed, progress[-1].total)
+
+        with self.assertRaises(SimulationCancelled):
+            run_debris_ensemble_request(
+                DebrisEnsembleRequest(base=make_request(), member_count=10),
+                cancellation_check=lambda: True,
+            )
+
+    def test_invalid_ensembles_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "member count"):
+            DebrisEnsembleRequest(base=make_request(), member_count=0)
+        with self.assertRaisesRegex(ValueError, "Unknown debris surface"):
+            DebrisEnsembleRequest(base=make_request(), surfaces=("ice",))
+        with self.assertRaisesRegex(ValueError, "forward-Euler"):
+            DebrisEnsembleRequest(base=make_request(integrator="adaptive"))
+        with self.assertRaisesRegex(ValueError, "minimum"):
+            UniformRange(2.0, 1.0)
+        with self.assertRaisesRegex(ValueError, "mass must be positive"):
+            DebrisEnsembleRequest(base=make_request(), mass_kg=UniformRange(0.0, 5.0))
+        with self.assertRaisesRegex(ValueError, "mass must be positive"):
+            DebrisEnsembleRequest(base=make_request(mass_kg=0.0))
+        for field_name in ("area_m2", "Cd", "ktas"):
+            with self.subTest(field_name=field_name):
+                with self.assertRaisesRegex(ValueError, "must not be negative"):
+                    DebrisEnsembleRequest(
+                        base=make_request(), **{field_name: UniformRange(-0.1, 0.1)}
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from services import (
+    DebrisSimulationRequest,
+    DebrisTrajectoryCalculator,
+    TrajectoryIntegrator,
+    TrajectoryPhase,
+    run_debris_simulation_request,
+)
+from services.debris_trajectory_calculator import (
+    SLIDE_SAMPLE_SPACING_M,
+    closed_form_slide,
+)
+
+
+def simulate(integrator, dt, **overrides):
+    values = {
+        "mass_kg": 10.0,
+        "area_m2": 0.1,
+        "Cd": 0.5,
+        "ktas": 120.0,
+        "surface": "grass",
+        "altitude_m": 60.0,
+        "slide_physics": 0.5,
+    }
+    values.update(overrides)
+    calculator = DebrisTrajectoryCalculator(
+        mass_kg=values["mass_kg"], area_m2=values["area_m2"], Cd=values["Cd"],
+        rho=1.225, g=9.81, dt=dt, ktas=values["ktas"],
+        surface=values["surface"], slide_physics=values["slide_physics"],
+        include_ground_drag=True, terrain_m=0.0,
+        altitude_m=values["altitude_m"], input_coords=None,
+        input_bearing=(51.0, -1.0, 37.0),
+    )
+    return calculator.simulate_3d(
+        m=calculator.mass_kg, A=calculator.area_m2, Cd=calculator.Cd,
+        rho=1.225, g=9.81, dt=dt, alt_m=calculator.alt_m_relative,
+        ktas=calculator.ktas, angle_deg=0.0, surface=calculator.surface,
+        vz_bounce_min=calculator.vz_bounce_min, integrator=integrator,
+    )
+
+
+class AdaptiveIntegratorTests(unittest.TestCase):
+    def test_adaptive_run_matches_fine_euler_reference_with_far_fewer_steps(self):
+        cases = (
+            {},
+            {"surface": "asphalt", "ktas": 250.0, "altitude_m": 200.0, "mass_kg": 50.0, "Cd": 1.0},
+            {"surface": "concrete", "ktas": 60.0, "slide_physics": 0.1},
+        )
+        for overrides in cases:
+            with self.subTest(**overrides):
+                adaptive, _ = simulate(TrajectoryIntegrator.ADAPTIVE, 0.01, **overrides)
+                coarse, _ = simulate(TrajectoryIntegrator.EULER, 0.01, **overrides)
+                reference, _ = simulate(TrajectoryIntegrator.EULER, 0.001, **overrides)
+
+                self.assertEqual(adaptive["impacts"], reference["impacts"])
+                for key in ("air_dist_xy_m", "total_dist_xy_m"):
+                    # Documented tolerance: 0.1 % of a 1 ms Euler reference.
+                    self.assertAlmostEqual(
+                        adaptive[key],
+                        reference[key],
+                        delta=1e-3 * reference[key],
+                    )
+                self.assertLessEqual(adaptive["steps"] * 10, coarse["steps"])
+
+    def test_impacts_are_located_on_the_ground_and_output_is_sampled_every_dt(self):
+        summary, trajectory = simulate(TrajectoryIntegrator.ADAPTIVE, 0.02)
+
+        impact_rows = np.flatnonzero(trajectory.event)
+        self.assertEqual(impact_rows.size, summary["impacts"])
+        np.testing.assert_array_equal(trajectory.z[impact_rows], 0.0)
+        self.assertEqual(trajectory.event_label(impact_rows[0]), "impact#1")
+        self.assertTrue(np.all(np.diff(trajectory.t) > 0.0))
+        air = trajectory.phase == TrajectoryPhase.AIR
+        self.assertLessEqual(float(np.max(np.diff(trajectory.t[air]))), 0.02 + 1e-9)
+        slide = ~air
+        slide_steps = np.hypot(
+            np.diff(trajectory.x[slide]), np.diff(trajectory.y[slide])
+        )
+        self.assertLessEqual(float(np.max(slide_steps)), SLIDE_SAMPLE_SPACING_M + 1e-9)
+        self.assertTrue(np.all(trajectory.z >= 0.0))
+        self.assertEqual(trajectory.phase[-1], TrajectoryPhase.SLIDE)
+        self.assertEqual(trajectory.vx[-1], 0.0)
+        self.assertAlmostEqual(
+            float(np.hypot(trajectory.x[-1], trajectory.y[-1])),
+            summary["total_dist_xy_m"],
+        )
+
+    def test_request_selects_the_integrator(self):
+        values = {
+            "mass_kg": 10.0, "area_m2": 0.1, "Cd": 0.5, "rho": 1.225,
+            "g": 9.81, "dt": 0.01, "ktas": 50.0, "surface": "concrete",
+            "slide_physics": 0.5, "include_ground_drag": True,
+            "terrain_m": 5.0, "altitude_m": 25.0, "input_coords": None,
+            "input_bearing": (51.0, -1.0, 90.0),
+        }
+        request = DebrisSimulationRequest(**values, integrator="adaptive")
+        self.assertIs(request.integrator, TrajectoryIntegrator.ADAPTIVE)
+        self.assertIs(
+            DebrisSimulationRequest(**values).integrator,
+            TrajectoryIntegrator.EULER,
+        )
+
+        adaptive = run_debris_simulation_request(request)
+        euler = run_debris_simulation_request(DebrisSimulationRequest(**values))
+        self.assertAlmostEqual(
+            adaptive.total_distance_m,
+            euler.total_distance_m,
+            delta=0.01 * euler.total_distance_m,
+        )
+        self.assertEqual(adaptive.anchor, euler.anchor)
+
+        with self.assertRaises(ValueError):
+            DebrisSimulationRequest(**values, integrator="leapfrog")
+
+
+class ClosedFormSlideTests(unittest.TestCase):
+    @staticmethod
+    def stepped_slide(speed, friction, drag, dt=1e-5):
+        elapsed = distance = 0.0
+        while speed > 0.0:
+            next_speed = speed - (friction + drag * speed * speed) * dt
+            if next_speed <= 0.0:
+                fraction = speed / (speed - next_speed)
+                return elapsed + fraction * dt, distance + 0.5 * speed * fraction * dt
+            distance += 0.5 * (speed + next_speed) * dt
+            speed = next_speed
+            elapsed += dt
+        return elapsed, distance
+
+    def test_closed_form_slide_matches_a_fine_stepped_slide(self):
+        for friction, drag in ((4.9, 0.0), (4.9, 0.003), (3.9, 0.02)):
+            with self.subTest(friction=friction, drag=drag):
+                duration, distance = closed_form_slide(25.0, friction, drag)
+                expected_duration, expected_distance = self.stepped_slide(
+                    25.0, friction, drag
+                )
+                self.assertAlmostEqual(duration, expected_duration, delta=1e-4)
+                self.assertAlmostEqual(distance, expected_distance, delta=1e-3)
+
+    def test_slide_stops_at_the_time_limit(self):
+        full_duration, full_distance = closed_form_slide(25.0, 4.9, 0.003)
+        duration, distance = closed_form_slide(25.0, 4.9, 0.003, time_limit=1.0)
+        self.assertEqual(duration, 1.0)
+        self.assertLess(distance, full_distance)
+        self.assertGreater(distance, 25.0 - 0.5 * (4.9 + 0.003 * 625.0))
+        self.assertEqual(closed_form_slide(10.0, 0.0, 0.0, 2.0), (2.0, 20.0))
+
+    def test_long_slides_cost_one_step(self):
+        fast, trajectory = simulate(
+            TrajectoryIntegrator.EULER, 0.01,
+            surface="asphalt", ktas=300.0, altitude_m=5.0, slide_physics=5.0,
+        )
+        slide = trajectory.phase == TrajectoryPhase.SLIDE
+        self.assertGreater(fast["ground_dist_xy_m"], 100.0)
+        self.assertEqual(trajectory.vx[-1], 0.0)
+        self.assertLess(fast["steps"], 150)
+        self.assertEqual(
+            int(np.count_nonzero(slide)),
+            int(np.ceil(np.hypot(
+                trajectory.x[-1] - trajectory.x[~slide][-1],
+                trajectory.y[-1] - trajectory.y[~slide][-1],
+            ) / SLIDE_SAMPLE_SPACING_M)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,6 @@ from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import patch
 
-import pandas as pd
-
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
@@ -31,6 +29,8 @@ from services import (
     SimulationCancelled,
     SimulationPhase,
     SimulationProgress,
+    TrajectoryBuffer,
+    TrajectoryPhase,
     run_debris_simulation_request,
 )
 from workers import CancellationToken, DebrisSimulationWorker, SimulationFailure
@@ -107,13 +107,16 @@ class DebrisSimulationServiceTests(unittest.TestCase):
             "total_dist_xy_m": 30.0,
             "impacts": 1,
         }
-        frame_rows = pd.DataFrame(
-            [
-                {"x": 0.0, "y": 0.0, "z": 20.0, "phase": "air"},
-                {"x": 10.0, "y": 0.0, "z": 10.0, "phase": "air"},
-                {"x": 20.0, "y": 0.0, "z": 0.0, "phase": "slide"},
-                {"x": 30.0, "y": 0.0, "z": 0.0, "phase": "slide"},
-            ]
+        frame_rows = TrajectoryBuffer.from_columns(
+            x=[0.0, 10.0, 20.0, 30.0],
+            y=[0.0, 0.0, 0.0, 0.0],
+            z=[20.0, 10.0, 0.0, 0.0],
+            phase=[
+                TrajectoryPhase.AIR,
+                TrajectoryPhase.AIR,
+                TrajectoryPhase.SLIDE,
+                TrajectoryPhase.SLIDE,
+            ],
         )
         simulation = DebrisTrajectoryCalculator(
             mass_kg=10.0,
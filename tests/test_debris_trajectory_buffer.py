@@ -0,0 +1,65 @@
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from services import DebrisTrajectoryCalculator, TrajectoryBuffer, TrajectoryPhase
+
+
+class TrajectoryBufferTests(unittest.TestCase):
+    def test_rows_survive_growth_as_contiguous_read_only_columns(self):
+        buffer = TrajectoryBuffer(capacity=2)
+        for index in range(5):
+            buffer.append(
+                0.1 * index, index, -index, 10.0 - index, 1.0, 2.0, 3.0,
+                TrajectoryPhase.AIR if index < 3 else TrajectoryPhase.SLIDE,
+                2 if index == 3 else 0,
+            )
+
+        self.assertEqual(len(buffer), 5)
+        self.assertGreaterEqual(buffer.capacity, 5)
+        np.testing.assert_array_equal(buffer.x, [0.0, 1.0, 2.0, 3.0, 4.0])
+        np.testing.assert_array_equal(buffer.z, [10.0, 9.0, 8.0, 7.0, 6.0])
+        np.testing.assert_array_equal(buffer.phase, [0, 0, 0, 1, 1])
+        self.assertTrue(buffer.x.flags.c_contiguous)
+        self.assertEqual(buffer.event_label(3), "impact#2")
+        self.assertIsNone(buffer.event_label(4))
+        with self.assertRaises(ValueError):
+            buffer.x[0] = 1.0
+
+    def test_simulation_records_phase_and_impact_codes(self):
+        calculator = DebrisTrajectoryCalculator(
+            mass_kg=10.0, area_m2=0.1, Cd=0.5, rho=1.225, g=9.81, dt=0.01,
+            ktas=50.0, surface="concrete", slide_physics=0.5,
+            include_ground_drag=True, terrain_m=0.0, altitude_m=20.0,
+            input_coords=None, input_bearing=(51.0, -1.0, 90.0),
+        )
+        summary, trajectory = calculator.simulate_3d(
+            m=10.0, A=0.1, Cd=0.5, rho=1.225, g=9.81, dt=0.01, alt_m=20.0,
+            ktas=50.0, angle_deg=0.0, surface="concrete",
+        )
+
+        impact_rows = np.flatnonzero(trajectory.event)
+        self.assertEqual(impact_rows.size, summary["impacts"])
+        self.assertEqual(trajectory.event_label(impact_rows[0]), "impact#1")
+        self.assertEqual(trajectory.phase[0], TrajectoryPhase.AIR)
+        self.assertEqual(trajectory.phase[-1], TrajectoryPhase.SLIDE)
+        self.assertAlmostEqual(
+            float(np.hypot(trajectory.x[-1], trajectory.y[-1])),
+            summary["total_dist_xy_m"],
+        )
+
+    def test_mismatched_columns_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "same length"):
+            TrajectoryBuffer.from_columns(
+                x=[0.0, 1.0], y=[0.0], z=[0.0, 0.0], phase=[0, 0]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import CancelledError
+from pathlib import Path
+from unittest.mock import patch
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from services import FileFingerprint, FileFingerprintService
+import services.file_fingerprints as file_fingerprints
+
+
+class FileFingerprintServiceTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name) / "flight.kml"
+        self.path.write_bytes(b"<kml/>" * 1000)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def counting_hash(self):
+        return patch.object(
+            file_fingerprints,
+            "_hash_file",
+            side_effect=file_fingerprints._hash_file,
+        )
+
+    def test_digest_is_memoized_until_the_stat_identity_changes(self):
+        service = FileFingerprintService()
+        with self.counting_hash() as hash_file:
+            first = service.fingerprint(self.path)
+            self.assertEqual(service.fingerprint(str(self.path)), first)
+            self.assertEqual(hash_file.call_count, 1)
+
+            stat = self.path.stat()
+            self.path.write_bytes(b"<kml></kml>" * 1000)
+            os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            second = service.fingerprint(self.path)
+
+        self.assertEqual(hash_file.call_count, 2)
+        self.assertEqual(
+            second,
+            FileFingerprint(
+                11_000,
+                stat.st_mtime_ns + 1_000_000,
+                hashlib.new(
+                    file_fingerprints.FINGERPRINT_DIGEST,
+                    self.path.read_bytes(),
+                ).hexdigest(),
+            ),
+        )
+        info = service.info()
+        self.assertEqual((info.hits, info.misses, info.size), (1, 2, 2))
+
+    def test_foreground_request_joins_a_background_hash(self):
+        service = FileFingerprintService()
+        started = threading.Event()
+        release = threading.Event()
+        real_hash = file_fingerprints._hash_file
+
+        def slow_hash(path, stop=None):
+            started.set()
+            release.wait(5)
+            return real_hash(path, stop)
+
+        with patch.object(file_fingerprints, "_hash_file", side_effect=slow_hash) as hash_file:
+            pending = service.fingerprint_async(self.path)
+            self.assertTrue(started.wait(5))
+            release.set()
+            self.assertEqual(service.fingerprint(self.path), pending.result(5))
+
+        self.assertEqual(hash_file.call_count, 1)
+
+    def test_shutdown_cancels_queued_and_running_background_hashes(self):
+        service = FileFingerprintService(max_workers=1)
+        queued_path = Path(self.tempdir.name) / "queued.kml"
+        queued_path.write_bytes(b"<kml/>")
+        started = threading.Event()
+        release = threading.Event()
+        real_hash = file_fingerprints._hash_file
+
+        def slow_hash(path, stop=None):
+            started.set()
+            release.wait(5)
+            return real_hash(path, stop)
+
+        with (
+            patch.object(file_fingerprints, "_READ_CHUNK_BYTES", 1024),
+            patch.object(file_fingerprints, "_hash_file", side_effect=slow_hash),
+        ):
+            running = service.fingerprint_async(self.path)
+            self.assertTrue(started.wait(5))
+            queued = service.fingerprint_async(queued_path)
+            service.shutdown(cancel_futures=True)
+            release.set()
+
+            self.assertIsInstance(running.exception(5), CancelledError)
+            self.assertIsInstance(queued.exception(5), CancelledError)
+            self.assertEqual(service.info().size, 0)
+            self.assertEqual(
+                service.fingerprint_async(queued_path).result(5),
+                service.fingerprint(queued_path),
+            )
+        service.shutdown()
+
+    def test_unreadable_files_raise_and_are_not_memoized(self):
+        service = FileFingerprintService()
+        missing = Path(self.tempdir.name) / "missing.kml"
+        with self.assertRaises(OSError):
+            service.fingerprint(missing)
+        self.assertIsInstance(service.fingerprint_async(missing).exception(5), OSError)
+        self.assertEqual(service.info().size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
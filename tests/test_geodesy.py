@@ -1,17 +1,30 @@
 import math
 import sys
+import threading
 import unittest
 from pathlib import Path
 
+import numpy as np
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
 from services.geodesy import (
+    EnuBlock,
     EnuCoordinate,
+    ENU_FRAME_CACHE_SIZE,
+    EnuTransposition,
+    FAST_ENU_MAX_ERROR_M,
+    FastLocalEnuFrame,
     LocalEnuFrame,
+    cached_local_enu_frame,
+    clear_enu_frame_cache,
     destination_point,
+    destination_point_array,
     inverse_distance_bearing,
+    enu_frame_cache_info,
+    inverse_distance_bearing_array,
     transpose_wgs84_enu_points,
 )
 from services.runway_alignment import RunwayReference, transpose_geodesic_points
@@ -64,6 +77,60 @@ class Wgs84GeodesicTests(unittest.TestCase):
             with self.subTest(operation=operation), self.assertRaises(ValueError):
                 operation()
 
+    def test_array_geodesics_match_scalar_results(self):
+        latitudes = [-41.32, 51.0, 0.0]
+        longitudes = [174.81, -1.0, 179.9]
+        end_latitudes = [40.96, 51.0, 0.5]
+        end_longitudes = [-5.50, -1.0, -179.8]
+
+        distances, bearings = inverse_distance_bearing_array(
+            latitudes, longitudes, end_latitudes, end_longitudes
+        )
+        final_latitudes, final_longitudes = destination_point_array(
+            latitudes, longitudes, 50_000.0, [10.0, 90.0, 270.0]
+        )
+
+        for index in range(3):
+            self.assertEqual(
+                (distances[index], bearings[index]),
+                inverse_distance_bearing(
+                    latitudes[index],
+                    longitudes[index],
+                    end_latitudes[index],
+                    end_longitudes[index],
+                ),
+            )
+            self.assertEqual(
+                (final_latitudes[index], final_longitudes[index]),
+                destination_point(
+                    latitudes[index],
+                    longitudes[index],
+                    50_000.0,
+                    (10.0, 90.0, 270.0)[index],
+                ),
+            )
+
+    def test_array_inputs_report_the_first_bad_point(self):
+        cases = (
+            (
+                lambda: inverse_distance_bearing_array([0.0, 91.0], 0.0, 1.0, 1.0),
+                "Point 1: Latitude must be between",
+            ),
+            (
+                lambda: destination_point_array(0.0, 0.0, [1.0, 2.0, math.inf], 90.0),
+                "Point 2: Distance must be a finite",
+            ),
+            (
+                lambda: destination_point_array([0.0, 0.0], [0.0, 0.0, 0.0], 1.0, 0.0),
+                "equal-length",
+            ),
+        )
+        for operation, message in cases:
+            with self.subTest(message=message), self.assertRaisesRegex(
+                ValueError, message
+            ):
+                operation()
+
 
 class LocalEnuFrameTests(unittest.TestCase):
     def test_anchor_is_the_enu_origin(self):
@@ -102,6 +169,38 @@ class LocalEnuFrameTests(unittest.TestCase):
         self.assertAlmostEqual(north.east_m, 0.0, places=5)
         self.assertAlmostEqual(north.north_m, 1_000.0, places=5)
 
+    def test_array_inverse_matches_scalar_points_across_the_antimeridian(self):
+        frame = LocalEnuFrame(0.0, 179.95)
+        east = [0.0, 5_000.0, 12_000.0, -3_000.0]
+        north = [0.0, 1_000.0, -2_500.0, 800.0]
+
+        latitudes, longitudes = frame.to_wgs84_array(east, north)
+
+        for index, (east_m, north_m) in enumerate(zip(east, north)):
+            expected = frame.to_wgs84(EnuCoordinate(east_m, north_m, 0.0))
+            self.assertEqual((latitudes[index], longitudes[index]), expected)
+        self.assertTrue(np.all((longitudes >= -180.0) & (longitudes <= 180.0)))
+        with self.assertRaises(ValueError):
+            frame.to_wgs84_array([0.0, math.nan], [0.0, 0.0])
+
+    def test_array_forward_projection_matches_scalar_points(self):
+        frame = LocalEnuFrame(51.0, -1.0)
+        latitudes = [51.0, 51.002, 50.9, 51.3]
+        longitudes = [-1.0, -0.997, -1.2, -0.4]
+
+        block = frame.to_enu_array(latitudes, longitudes)
+
+        self.assertIsInstance(block, EnuBlock)
+        self.assertEqual(len(block), 4)
+        for index, point in enumerate(zip(latitudes, longitudes)):
+            self.assertEqual(block[index], frame.to_enu(*point))
+        with self.assertRaises(ValueError):
+            block.east_m[0] = 1.0
+        with self.assertRaisesRegex(ValueError, "Point 2: Longitude"):
+            frame.to_enu_array([51.0, 51.0, 51.0], [-1.0, -1.0, 181.0])
+        with self.assertRaisesRegex(ValueError, "Point 1: ENU north"):
+            EnuBlock([0.0, 0.0], [0.0, math.nan], 0.0)
+
     def test_invalid_enu_values_fail_explicitly(self):
         with self.assertRaises(ValueError):
             LocalEnuFrame(float("nan"), 0.0)
@@ -163,6 +262,61 @@ class Wgs84EnuTranspositionTests(unittest.TestCase):
 
         self.assertEqual(transpose_geodesic_points(points, source, target), primary)
 
+    def test_fused_pipeline_matches_the_two_frame_path(self):
+        rng = np.random.default_rng(8)
+        for source_origin, target_origin, heading in (
+            ((51.0, -1.0), (-33.9, 151.2), 37.0),
+            ((64.1, -21.9), (0.0, 179.95), -123.4),
+            ((-45.0, 170.0), (45.0, -170.0), 270.0),
+        ):
+            with self.subTest(source=source_origin, target=target_origin):
+                latitudes = source_origin[0] + rng.uniform(-0.9, 0.9, 500)
+                longitudes = source_origin[1] + rng.uniform(-0.9, 0.9, 500)
+                source = LocalEnuFrame(*source_origin).to_enu_array(
+                    latitudes,
+                    longitudes,
+                )
+                cosine = math.cos(math.radians(heading))
+                sine = math.sin(math.radians(heading))
+                expected = LocalEnuFrame(*target_origin).to_wgs84_array(
+                    source.east_m * cosine + source.north_m * sine,
+                    -source.east_m * sine + source.north_m * cosine,
+                    source.up_m,
+                )
+
+                fused = EnuTransposition(source_origin, target_origin, heading)
+                latitude, longitude = fused.transform_array(latitudes, longitudes)
+
+                np.testing.assert_allclose(latitude, expected[0], rtol=0.0, atol=1e-7)
+                longitude_error = np.abs(longitude - expected[1]) % 360.0
+                self.assertLess(
+                    float(np.max(np.minimum(longitude_error, 360.0 - longitude_error))),
+                    1e-7,
+                )
+
+    def test_malformed_route_points_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "triples"):
+            transpose_wgs84_enu_points(
+                ((51.0, -1.0, 0.0), (51.0, -1.0)),
+                (51.0, -1.0),
+                (52.0, 0.0),
+                0.0,
+            )
+        with self.assertRaisesRegex(ValueError, "Route points"):
+            transpose_wgs84_enu_points(
+                ((51.0, -1.0, "high"),),
+                (51.0, -1.0),
+                (52.0, 0.0),
+                0.0,
+            )
+        with self.assertRaisesRegex(ValueError, "Point 1: Latitude"):
+            transpose_wgs84_enu_points(
+                ((51.0, -1.0, 0.0), (91.0, -1.0, 0.0)),
+                (51.0, -1.0),
+                (52.0, 0.0),
+                0.0,
+            )
+
     def test_non_finite_route_altitude_is_rejected(self):
         with self.assertRaisesRegex(ValueError, "Route altitude"):
             transpose_wgs84_enu_points(
@@ -173,5 +327,124 @@ class Wgs84EnuTranspositionTests(unittest.TestCase):
             )
 
 
+class FastLocalEnuFrameTests(unittest.TestCase):
+    ORIGINS = (
+        (51.0, -1.0),
+        (-33.9, 151.2),
+        (0.0, 179.99),
+        (64.1, -21.9),
+        (-77.8, 166.7),
+        (88.5, 0.0),
+    )
+
+    def offsets(self, seed):
+        rng = np.random.default_rng(seed)
+        radius = np.concatenate(([0.0, 100_000.0], rng.uniform(0.0, 100_000.0, 998)))
+        bearing = rng.uniform(0.0, 2.0 * math.pi, radius.size)
+        up = -radius * radius / (2.0 * 6_371_000.0) + rng.uniform(-50.0, 50.0, radius.size)
+        return radius * np.sin(bearing), radius * np.cos(bearing), up
+
+    def test_worst_case_deviation_from_proj_is_within_the_documented_bound(self):
+        worst_horizontal = worst_enu = 0.0
+        for seed, origin in enumerate(self.ORIGINS):
+            exact = LocalEnuFrame(*origin)
+            fast = FastLocalEnuFrame(*origin)
+            east, north, up = self.offsets(seed)
+
+            exact_lat, exact_lon = exact.to_wgs84_array(east, north, up)
+            fast_lat, fast_lon = fast.to_wgs84_array(east, north, up)
+            # Compare the inverse in metres on the ground via the exact frame.
+            delta = exact.to_enu_array(fast_lat, fast_lon)
+            reference = exact.to_enu_array(exact_lat, exact_lon)
+            worst_horizontal = max(
+                worst_horizontal,
+                float(np.max(np.hypot(
+                    delta.east_m - reference.east_m,
+                    delta.north_m - reference.north_m,
+                ))),
+            )
+
+            forward = fast.to_enu_array(exact_lat, exact_lon)
+            for axis in ("east_m", "north_m", "up_m"):
+                worst_enu = max(
+                    worst_enu,
+                    float(np.max(np.abs(getattr(forward, axis) - getattr(reference, axis)))),
+                )
+
+        self.assertLess(worst_horizontal, FAST_ENU_MAX_ERROR_M)
+        self.assertLess(worst_enu, FAST_ENU_MAX_ERROR_M)
+
+    def test_fast_frame_validates_like_the_exact_frame(self):
+        fast = FastLocalEnuFrame(51.0, -1.0)
+        with self.assertRaisesRegex(ValueError, "Point 1: Latitude"):
+            fast.to_enu_array([51.0, 91.0], [-1.0, -1.0])
+        with self.assertRaisesRegex(ValueError, "Point 0: ENU east"):
+            fast.to_wgs84_array([math.nan], [0.0])
+        with self.assertRaises(ValueError):
+            FastLocalEnuFrame(math.inf, 0.0)
+
+
+class EnuFrameCacheTests(unittest.TestCase):
+    def setUp(self):
+        clear_enu_frame_cache()
+        self.addCleanup(clear_enu_frame_cache)
+
+    def test_origins_within_the_quantum_share_one_frame(self):
+        frame = cached_local_enu_frame(51.0, -1.0)
+
+        self.assertIs(cached_local_enu_frame(51.0 + 1e-12, -1.0), frame)
+        self.assertIsNot(cached_local_enu_frame(51.0 + 1e-6, -1.0), frame)
+        self.assertEqual(frame, LocalEnuFrame(51.0, -1.0))
+        info = enu_frame_cache_info()
+        self.assertEqual((info.hits, info.misses, info.size), (1, 2, 2))
+
+    def test_least_recently_used_frames_are_evicted(self):
+        first = cached_local_enu_frame(0.0, 0.0)
+        for index in range(1, ENU_FRAME_CACHE_SIZE):
+            cached_local_enu_frame(0.0, index * 0.01)
+        cached_local_enu_frame(0.0, 0.0)
+        cached_local_enu_frame(1.0, 1.0)
+
+        info = enu_frame_cache_info()
+        self.assertEqual(info.size, ENU_FRAME_CACHE_SIZE)
+        self.assertIs(cached_local_enu_frame(0.0, 0.0), first)
+        before = enu_frame_cache_info().misses
+        cached_local_enu_frame(0.0, 0.01)
+        self.assertEqual(enu_frame_cache_info().misses, before + 1)
+
+    def test_concurrent_lookups_return_one_shared_frame(self):
+        frames = []
+        barrier = threading.Barrier(8)
+
+        def lookup():
+            barrier.wait()
+            frames.append(cached_local_enu_frame(-33.9, 151.2))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(frame) for frame in frames}), 1)
+        info = enu_frame_cache_info()
+        self.assertEqual(info.hits + info.misses, 8)
+        self.assertEqual(info.size, 1)
+
+    def test_repeated_transpositions_reuse_cached_frames(self):
+        points = ((51.001, -1.002, 10.0),)
+        first = transpose_wgs84_enu_points(points, (51.0, -1.0), (52.0, 0.0), 30.0)
+        second = transpose_wgs84_enu_points(points, (51.0, -1.0), (52.0, 0.0), 30.0)
+
+        self.assertEqual(first, second)
+        info = enu_frame_cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_invalid_origin_is_rejected_before_caching(self):
+        with self.assertRaisesRegex(ValueError, "Latitude"):
+            cached_local_enu_frame(95.0, 0.0)
+        self.assertEqual(enu_frame_cache_info().misses, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,11 +4,13 @@ import tempfile
 import unittest
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from unittest.mock import patch
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
+from services import kml_export
 from services.kml_export import (
     KML_NAMESPACE,
     KmlCoordinate,
@@ -19,6 +21,7 @@ from services.kml_export import (
     KmlStyle,
     export_kml,
     render_kml,
+    validate_kml_document,
 )
 
 
@@ -196,6 +199,60 @@ class KmlExportTests(unittest.TestCase):
             self.assertEqual(output.read_text(encoding="utf-8"), "existing")
             self.assertEqual(list(output.parent.glob(f".{output.name}.*.tmp")), [])
 
+    def test_large_documents_stream_in_chunks_matching_the_rendered_bytes(self):
+        coordinates = tuple(
+            KmlCoordinate(-1 + index * 1e-5, 51 + index * 1e-5, 100 + index % 50)
+            for index in range(12_000)
+        )
+        document = KmlDocument(
+            name="Large",
+            styles=track_document().styles,
+            placemarks=(
+                KmlPlacemark(
+                    name="Path",
+                    style_url="#magentaTrackLine",
+                    geometry=KmlLineString(coordinates=coordinates, altitude_mode="absolute"),
+                ),
+            ),
+        )
+        reported_bytes = []
+        coordinates_written = 0
+
+        def coordinate_callback():
+            nonlocal coordinates_written
+            coordinates_written += 1
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            output = Path(temporary_directory) / "output.kml"
+            export_kml(
+                output,
+                document,
+                overwrite=True,
+                coordinate_callback=coordinate_callback,
+                bytes_callback=reported_bytes.append,
+            )
+            written = output.read_bytes()
+
+        self.assertEqual(written, render_kml(document).encode("utf-8"))
+        self.assertEqual(coordinates_written, len(coordinates))
+        self.assertGreater(len(reported_bytes), 1)
+        self.assertEqual(reported_bytes, sorted(reported_bytes))
+        self.assertEqual(reported_bytes[-1], len(written))
+
+    def test_each_document_object_is_validated_once(self):
+        document = track_document()
+        with patch(
+            "services.kml_export._validate_document",
+            wraps=kml_export._validate_document,
+        ) as validate:
+            self.assertIs(validate_kml_document(document), document)
+            render_kml(document)
+            with tempfile.TemporaryDirectory() as temporary_directory:
+                export_kml(Path(temporary_directory) / "output.kml", document, overwrite=True)
+            render_kml(track_document())
+
+        self.assertEqual(validate.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
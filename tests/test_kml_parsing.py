@@ -1,12 +1,16 @@
+import math
 import os
 import sys
 import tempfile
 import unittest
 import xml.etree.ElementTree as ET
+from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import numpy as np
+
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -21,6 +25,7 @@ from services import (
     KmlPoint,
     KmlStructureError,
     KmlTrack,
+    KmlTrackPoints,
     KmlXmlError,
     RunwayReference,
     apply_source_runways,
@@ -105,6 +110,33 @@ class KmlParserTests(unittest.TestCase):
                 track = parse_kml_track(self.fixture(filename))
                 self.assertIsNone(track.source_line_colour)
 
+    def test_streaming_reader_resolves_styles_declared_after_the_path(self):
+        document = (
+            '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+            "<Placemark><name> Late style </name><styleUrl>#late</styleUrl>"
+            "<LineString><coordinates>-0.7,51.2,100 -0.6,51.3,125</coordinates>"
+            "</LineString></Placemark>"
+            '<Style id="late"><LineStyle><color>FF102030</color></LineStyle></Style>'
+            "</Document></kml>"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "late_style.kml"
+            path.write_text(document, encoding="utf-8")
+            track = parse_kml_track(path)
+
+            self.assertEqual(track.placemark_name, "Late style")
+            self.assertEqual(track.source_line_colour, "ff102030")
+            self.assertEqual(len(track.points), 2)
+
+            # Structure and coordinate checks wait for the whole document, so
+            # malformed XML after a bad path is still reported as XML.
+            path.write_text(
+                document.replace("-0.6,51.3,125", "bad").replace("</kml>", ""),
+                encoding="utf-8",
+            )
+            with self.assertRaises(KmlXmlError):
+                parse_kml_track(path)
+
     def test_multiple_supported_geometries_are_not_concatenated(self):
         with self.assertRaises(KmlStructureError) as raised:
             parse_kml_track(self.fixture("multiple_paths.kml"))
@@ -149,6 +181,61 @@ class KmlParserTests(unittest.TestCase):
                 self.assertIn(filename, message)
                 self.assertIn(fragment, message)
 
+    def test_bulk_parsing_reports_the_exact_index_of_a_bad_coordinate(self):
+        tokens = [f"-1.{index:04d},51.0,{index}" for index in range(1, 3_001)]
+        tokens[1_499] = "-1.0,95.0,10"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "long.kml"
+            path.write_text(
+                '<kml xmlns="http://www.opengis.net/kml/2.2"><Placemark>'
+                f"<LineString><coordinates>{' '.join(tokens)}</coordinates>"
+                "</LineString></Placemark></kml>",
+                encoding="utf-8",
+            )
+            with self.assertRaises(KmlCoordinateError) as raised:
+                parse_kml_track(path)
+
+        self.assertIn("coordinate 1500: latitude 95.0 is outside", str(raised.exception))
+
+    def test_tracks_are_columnar_with_a_lazy_point_view(self):
+        track = parse_kml_track(self.fixture("line_string_prefixed_mixed.kml"))
+
+        self.assertIsInstance(track.points, KmlTrackPoints)
+        self.assertEqual(track.latitudes.dtype, float)
+        self.assertEqual(track.altitude_present.tolist(), [False, True])
+        self.assertTrue(math.isnan(track.altitudes[0]))
+        self.assertIsNone(track.timestamps)
+        self.assertEqual(track.points[-1], KmlPoint(51.3, -0.6, 125.0))
+        self.assertEqual(track.points[-2:], tuple(track.points))
+        with self.assertRaises(ValueError):
+            track.latitudes[0] = 0.0
+
+        recorded = parse_kml_track(self.fixture("gx_track.kml"))
+        self.assertEqual(
+            recorded.timestamps.tolist(),
+            [
+                datetime(2026, 1, 1, 0, 0, 0),
+                datetime(2026, 1, 1, 0, 0, 1),
+            ],
+        )
+        self.assertEqual(recorded.points[0].timestamp, "2026-01-01T00:00:00Z")
+
+    def test_timestamps_are_normalized_to_utc(self):
+        points = KmlTrackPoints(
+            [51.0, 51.1, 51.2],
+            [-1.0, -1.1, -1.2],
+            [0.0, 0.0, 0.0],
+            [True, True, True],
+            ["2026-01-01T01:30:00+01:30", "2026-01-01T00:00:00Z", "not a time"],
+        )
+
+        self.assertEqual(
+            points.timestamps[:2].tolist(),
+            [datetime(2026, 1, 1), datetime(2026, 1, 1)],
+        )
+        self.assertTrue(np.isnat(points.timestamps[2]))
+        self.assertEqual(points[2].timestamp, "not a time")
+
     def test_kmz_is_rejected_without_attempting_archive_or_network_access(self):
         with self.assertRaises(KmlStructureError) as raised:
             parse_kml_track(FIXTURES / "not-present.kmz")
@@ -290,7 +377,7 @@ class TranspositionKmlTests(unittest.TestCase):
         with (
             tempfile.TemporaryDirectory() as temp_dir,
             patch(
-                "services.transpose_coordinates.parse_kml_track",
+                "services.transpose_coordinates.cached_parse_kml_track",
                 return_value=track,
             ),
             patch(
@@ -340,7 +427,7 @@ class TranspositionKmlTests(unittest.TestCase):
         with (
             tempfile.TemporaryDirectory() as temp_dir,
             patch(
-                "services.transpose_coordinates.parse_kml_track",
+                "services.transpose_coordinates.cached_parse_kml_track",
                 return_value=track,
             ),
             patch("services.transpose_coordinates.write_kml") as write,
@@ -636,7 +723,7 @@ class TranspositionKmlTests(unittest.TestCase):
                 [self.fixture("line_string_namespaced.kml")], temp_dir, "Field"
             )
             with patch(
-                "services.transpose_coordinates.parse_kml_track",
+                "services.transpose_coordinates.cached_parse_kml_track",
                 side_effect=RuntimeError("internal details"),
             ):
                 result = self.run_plan(plan)
@@ -678,14 +765,15 @@ class TranspositionKmlTests(unittest.TestCase):
             output_path = Path(temp_dir) / "output.kml"
             with (
                 patch(
-                    "services.kml_export.render_kml",
+                    "services.kml_export._document_chunks",
                     side_effect=OSError("render failed"),
                 ),
                 self.assertRaisesRegex(OSError, "render failed"),
             ):
-                write_kml(output_path, [(1.0, 2.0, 3.0)], "Aircraft")
+                write_kml(output_path, [(1.0, 2.0, 3.0), (1.1, 2.1, 3.1)], "Aircraft")
 
             self.assertFalse(output_path.exists())
+            self.assertEqual(list(output_path.parent.iterdir()), [])
 
     def test_kml_document_name_is_xml_escaped_and_utf8_parseable(self):
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -860,7 +948,7 @@ class DebrisKmlTests(unittest.TestCase):
             geometry_kind="line_string",
             placemark_name=None,
         )
-        with patch("pages.debris_page.parse_kml_track", side_effect=[first, second]) as parser:
+        with patch("pages.debris_page.cached_parse_kml_track", side_effect=[first, second]) as parser:
             self.page.select_and_parse_kml(path)
             self.page.select_and_parse_kml(path)
 
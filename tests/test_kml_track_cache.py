@@ -0,0 +1,138 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from services import (
+    KmlCoordinateError,
+    ParsedTrackCache,
+    parse_kml_track,
+)
+import services.kml_track_cache as kml_track_cache
+
+
+FIXTURES = PROJECT_ROOT / "tests" / "fixtures" / "kml"
+
+
+class ParsedTrackCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name)
+        self.path = self.root / "flight.kml"
+        shutil.copyfile(FIXTURES / "gx_track.kml", self.path)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def counting_parser(self):
+        return patch.object(
+            kml_track_cache, "parse_kml_track", side_effect=parse_kml_track
+        )
+
+    def test_unchanged_file_is_parsed_once_and_edits_are_parsed_again(self):
+        cache = ParsedTrackCache()
+        with self.counting_parser() as parser:
+            first = cache.get(self.path)
+            self.assertIs(cache.get(str(self.path)), first)
+            self.assertEqual(parser.call_count, 1)
+
+            self.path.write_text(
+                self.path.read_text(encoding="utf-8").replace("125", "150"),
+                encoding="utf-8",
+            )
+            edited = cache.get(self.path)
+
+        self.assertEqual(parser.call_count, 2)
+        self.assertEqual(edited.points[-1].altitude_m, 150.0)
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.size), (1, 2, 2))
+
+    def test_memory_budget_evicts_least_recently_used_tracks(self):
+        other = self.root / "other.kml"
+        shutil.copyfile(FIXTURES / "line_string_namespaced.kml", other)
+        probe = ParsedTrackCache()
+        probe.get(self.path)
+        budget = probe.info().current_bytes
+
+        cache = ParsedTrackCache(max_bytes=budget)
+        cache.get(self.path)
+        cache.get(other)
+        with self.counting_parser() as parser:
+            cache.get(self.path)
+        self.assertEqual(parser.call_count, 1)
+        self.assertLessEqual(cache.info().current_bytes, budget)
+
+        empty = ParsedTrackCache(max_bytes=0)
+        empty.get(self.path)
+        self.assertEqual(empty.info().size, 0)
+
+    def test_sidecar_round_trips_tracks_across_processes(self):
+        sidecars = self.root / "sidecars"
+        original = ParsedTrackCache(sidecar_dir=sidecars).get(self.path)
+        self.assertEqual(len(list(sidecars.glob("*.npz"))), 1)
+
+        reopened = ParsedTrackCache(sidecar_dir=sidecars)
+        with self.counting_parser() as parser:
+            restored = reopened.get(self.path)
+
+        parser.assert_not_called()
+        self.assertEqual(reopened.info().sidecar_hits, 1)
+        self.assertEqual(restored, original)
+        self.assertEqual(restored.points.timestamps.tolist(), original.points.timestamps.tolist())
+
+        for sidecar in sidecars.glob("*.npz"):
+            sidecar.write_bytes(b"not an archive")
+        with self.assertLogs(kml_track_cache.LOGGER, "WARNING"):
+            self.assertEqual(ParsedTrackCache(sidecar_dir=sidecars).get(self.path), original)
+
+    def test_writing_a_sidecar_removes_stale_temporary_files(self):
+        sidecars = self.root / "sidecars"
+        sidecars.mkdir()
+        stale = sidecars / "crashed.tmp"
+        in_progress = sidecars / "writing.tmp"
+        stale.write_bytes(b"partial")
+        in_progress.write_bytes(b"partial")
+        hour_ago = stale.stat().st_mtime_ns - 3600 * 1_000_000_000
+        os.utime(stale, ns=(hour_ago, hour_ago))
+
+        ParsedTrackCache(sidecar_dir=sidecars).get(self.path)
+
+        self.assertFalse(stale.exists())
+        self.assertTrue(in_progress.exists())
+        self.assertEqual(len(list(sidecars.glob("*.npz"))), 1)
+
+    def test_parse_errors_are_raised_every_time_and_never_cached(self):
+        broken = self.root / "broken.kml"
+        shutil.copyfile(FIXTURES / "out_of_range.kml", broken)
+        cache = ParsedTrackCache()
+        for _ in range(2):
+            with self.assertRaises(KmlCoordinateError):
+                cache.get(broken)
+        self.assertEqual(cache.info().size, 0)
+
+        with self.assertRaises(OSError):
+            cache.get(self.root / "missing.kml")
+
+    def test_a_file_modified_during_parsing_is_not_cached(self):
+        cache = ParsedTrackCache()
+
+        def parse_then_touch(path):
+            track = parse_kml_track(path)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            return track
+
+        with patch.object(kml_track_cache, "parse_kml_track", side_effect=parse_then_touch):
+            cache.get(self.path)
+        self.assertEqual(cache.info().size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
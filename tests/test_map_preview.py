@@ -1,14 +1,17 @@
+import base64
 import math
+import struct
 import sys
 import unittest
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from unittest.mock import patch
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-from services.geodesy import EnuCoordinate, LocalEnuFrame
+from services.geodesy import EnuCoordinate, FastLocalEnuFrame, LocalEnuFrame
 from services.kml_export import (
     KML_NAMESPACE,
     KmlCoordinate,
@@ -26,7 +29,9 @@ from services.map_preview import (
     apply_enu_adjustment,
     kml_colour_to_css,
     preview_payload,
+    preview_tolerance,
     quantize_kml_document,
+    trace_payload,
 )
 
 
@@ -231,6 +236,61 @@ class EnuAdjustmentTests(unittest.TestCase):
         self.assertEqual(second.adjusted_document, direct.adjusted_document)
         self.assertEqual(second.adjustment.east_m, 0.0)
 
+    def test_live_preview_uses_fast_frame_and_exact_restores_export_geometry(self):
+        base = _document()
+        adjustment = TraceAdjustment(east_m=90_000.0, north_m=-40_000.0, yaw_deg=33.0)
+        exact = PreparedTrace("route", "Route", ANCHOR, base, adjustment)
+        live = exact.with_adjustment(adjustment, live_preview=True)
+
+        self.assertTrue(live.live_preview)
+        fast_document = apply_enu_adjustment(base, ANCHOR, adjustment, fast=True)
+        exact_document = apply_enu_adjustment(base, ANCHOR, adjustment)
+        for fast_mark, exact_mark in zip(
+            fast_document.placemarks,
+            exact_document.placemarks,
+            strict=True,
+        ):
+            fast_points = getattr(fast_mark.geometry, "coordinates", None) or (
+                fast_mark.geometry.outer_ring
+            )
+            exact_points = getattr(exact_mark.geometry, "coordinates", None) or (
+                exact_mark.geometry.outer_ring
+            )
+            for fast_point, exact_point in zip(fast_points, exact_points, strict=True):
+                self.assertAlmostEqual(fast_point.latitude, exact_point.latitude, places=10)
+                self.assertAlmostEqual(fast_point.longitude, exact_point.longitude, places=10)
+                self.assertEqual(fast_point.altitude_m, exact_point.altitude_m)
+
+        restored = live.exact()
+        self.assertFalse(restored.live_preview)
+        self.assertEqual(restored.adjusted_document, exact.adjusted_document)
+        self.assertIs(exact.exact(), exact)
+        scene = PreviewScene((live,))
+        self.assertFalse(scene.exact().traces[0].live_preview)
+        self.assertIs(PreviewScene((exact,)).exact().traces[0], exact)
+
+    def test_adjustments_reuse_the_base_projection_and_match_quantized_output(self):
+        base = _document(open_polygon=True)
+        trace = PreparedTrace("route", "Route", ANCHOR, base)
+        adjustment = TraceAdjustment(east_m=75.0, north_m=-20.0, up_m=3.0, yaw_deg=-40.0)
+        trace.with_adjustment(TraceAdjustment(east_m=1.0))
+        trace.with_adjustment(TraceAdjustment(east_m=1.0), live_preview=True)
+
+        with patch.object(
+            LocalEnuFrame, "to_enu_array"
+        ) as exact_projection, patch.object(
+            FastLocalEnuFrame, "to_enu_array"
+        ) as fast_projection:
+            adjusted = trace.with_adjustment(adjustment)
+            trace.with_adjustment(adjustment, live_preview=True)
+        exact_projection.assert_not_called()
+        fast_projection.assert_not_called()
+
+        self.assertEqual(
+            adjusted.adjusted_document,
+            quantize_kml_document(apply_enu_adjustment(base, ANCHOR, adjustment)),
+        )
+
     def test_high_latitude_antimeridian_adjustment_remains_in_requested_enu_frame(self):
         anchor = KmlCoordinate(179.9999, 82.0, 0.0)
         frame = LocalEnuFrame(anchor.latitude, anchor.longitude)
@@ -281,6 +341,19 @@ class CanonicalPayloadTests(unittest.TestCase):
         ]
         self.assertEqual(serialized_line, canonical_line)
 
+    def test_documents_are_quantized_once_and_canonical_results_are_stable(self):
+        document = _document(open_polygon=True)
+        canonical = quantize_kml_document(document)
+
+        with patch("services.map_preview._quantized_coordinate") as quantize_point:
+            self.assertIs(quantize_kml_document(document), canonical)
+            self.assertIs(quantize_kml_document(canonical), canonical)
+        quantize_point.assert_not_called()
+
+        with patch("services.kml_export._validate_document") as validate:
+            render_kml(canonical)
+        validate.assert_not_called()
+
     def test_payload_uses_canonical_coordinates_styles_and_altitude_modes(self):
         trace = PreparedTrace(
             "route-1",
@@ -321,6 +394,111 @@ class CanonicalPayloadTests(unittest.TestCase):
         self.assertEqual(polygon_payload["style"]["fillColor"], "#20304080")
         self.assertEqual(len(polygon_payload["coordinates"]), len(polygon.outer_ring))
 
+    def test_version_two_packs_the_same_coordinates_as_little_endian_doubles(self):
+        scene = PreviewScene(
+            (PreparedTrace("route-1", "Route 1", ANCHOR, _document(open_polygon=True)),)
+        )
+
+        objects = preview_payload(scene)
+        packed = preview_payload(scene, version=2)
+
+        self.assertEqual(packed["version"], 2)
+        for json_geometry, packed_geometry in zip(
+            objects["traces"][0]["geometries"],
+            packed["traces"][0]["geometries"],
+            strict=True,
+        ):
+            self.assertNotIn("coordinates", packed_geometry)
+            data = base64.b64decode(packed_geometry.pop("path"))
+            values = struct.unpack(f"<{len(data) // 8}d", data)
+            self.assertEqual(
+                [
+                    {"lat": lat, "lng": lng, "altitude": altitude}
+                    for lat, lng, altitude in zip(values[0::3], values[1::3], values[2::3])
+                ],
+                json_geometry.pop("coordinates"),
+            )
+            self.assertEqual(packed_geometry, json_geometry)
+        with self.assertRaisesRegex(ValueError, "payload version"):
+            preview_payload(scene, version=3)
+
+    def test_vertex_budget_simplifies_preview_only_and_reports_its_deviation(self):
+        frame = LocalEnuFrame(ANCHOR.latitude, ANCHOR.longitude)
+        positions = [
+            (index * 25.0, 40.0 * math.sin(index / 9.0), 150.0 + 5.0 * math.cos(index / 4.0))
+            for index in range(400)
+        ]
+        document = KmlDocument(
+            name=None,
+            styles=(KmlStyle("path", "ffffffff", 1.0),),
+            placemarks=(
+                KmlPlacemark(
+                    "Path",
+                    "#path",
+                    KmlLineString(
+                        tuple(_point(frame, east, north, up) for east, north, up in positions),
+                        "absolute",
+                    ),
+                ),
+            ),
+        )
+        trace = PreparedTrace("route", "Route", ANCHOR, document)
+        scene = PreviewScene((trace,))
+
+        self.assertEqual(preview_tolerance(scene, 400), 0.0)
+        self.assertIsNone(preview_payload(scene, vertex_budget=400)["traces"][0]["simplification"])
+        payload = preview_payload(scene, vertex_budget=60)["traces"][0]
+
+        simplification = payload["simplification"]
+        kept = payload["geometries"][0]["coordinates"]
+        self.assertLessEqual(simplification["vertexCount"], 60)
+        self.assertEqual(len(kept), simplification["vertexCount"])
+        self.assertEqual(simplification["sourceVertexCount"], 400)
+        self.assertEqual(len(trace.adjusted_document.placemarks[0].geometry.coordinates), 400)
+
+        def enu(point):
+            position = frame.to_enu(point["lat"], point["lng"])
+            return (position.east_m, position.north_m, point["altitude"])
+
+        kept_positions = [enu(point) for point in kept]
+        deviation = 0.0
+        for east, north, up in positions:
+            nearest = math.inf
+            for start, end in zip(kept_positions, kept_positions[1:]):
+                segment = [b - a for a, b in zip(start, end)]
+                offset = [p - a for a, p in zip(start, (east, north, up))]
+                length = sum(value * value for value in segment)
+                along = min(1.0, max(0.0, sum(a * b for a, b in zip(offset, segment)) / length))
+                nearest = min(
+                    nearest,
+                    math.dist(offset, [along * value for value in segment]),
+                )
+            deviation = max(deviation, nearest)
+        self.assertGreater(deviation, 0.0)
+        # Allow for the centimetre-level quantization of the payload itself.
+        self.assertLessEqual(deviation, simplification["maxDeviationM"] + 0.02)
+
+    def test_vertex_budget_drops_stationary_duplicate_points(self):
+        frame = LocalEnuFrame(ANCHOR.latitude, ANCHOR.longitude)
+        parked = _point(frame, 0.0, 0.0, 150.0)
+        coordinates = (
+            *(parked,) * 200,
+            *(_point(frame, index * 25.0, 40.0 * math.sin(index / 9.0), 150.0) for index in range(1, 100)),
+        )
+        document = KmlDocument(
+            name=None,
+            styles=(KmlStyle("path", "ffffffff", 1.0),),
+            placemarks=(KmlPlacemark("Path", "#path", KmlLineString(coordinates, "absolute")),),
+        )
+        scene = PreviewScene((PreparedTrace("parked", "Parked", ANCHOR, document),))
+
+        tolerance = preview_tolerance(scene, 200)
+        self.assertGreater(tolerance, 0.0)
+        simplification = trace_payload(scene.traces[0], tolerance_m=tolerance)["simplification"]
+        self.assertIsNotNone(simplification)
+        self.assertLessEqual(simplification["vertexCount"], 200)
+        self.assertEqual(simplification["sourceVertexCount"], 299)
+
     def test_colour_conversion_is_exact_and_rejects_invalid_input(self):
         self.assertEqual(kml_colour_to_css("aaff00ff"), "#ff00ffaa")
         self.assertEqual(kml_colour_to_css("80403020"), "#20304080")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import json
 import os
 import re
 import sys
@@ -45,6 +47,7 @@ from services import (
     KmlStyle,
     PreparedTrace,
     PreviewScene,
+    preview_tolerance,
 )
 
 
@@ -172,6 +175,38 @@ class PreviewShellPolicyTests(unittest.TestCase):
                 )
 
 
+    def test_scene_requests_require_the_exact_path_and_a_one_time_token(self):
+        token = "A" * 32
+        self.assertEqual(
+            preview_module._scene_from_request_target(
+                f"/secret/scene/3/0/{token}",
+                "/secret/scene",
+            ),
+            (3, 0, token),
+        )
+        for target in (
+            f"/secret/scene/0/1/{token}",
+            f"/secret/scene/3/1/{token}?extra=1",
+            f"/secret/scene/3/1/{token}#fragment",
+            f"/secret/scene/3/01/{token}",
+            "/secret/scene/3/1/short",
+            f"/secret/scenes/3/1/{token}",
+            f"http://127.0.0.1/secret/scene/3/1/{token}",
+            f"/wrong/scene/3/1/{token}",
+        ):
+            with self.subTest(target=target):
+                self.assertIsNone(
+                    preview_module._scene_from_request_target(target, "/secret/scene")
+                )
+
+    def test_gzip_is_used_only_when_accepted(self):
+        self.assertTrue(preview_module._accepts_gzip("gzip, deflate, br"))
+        self.assertTrue(preview_module._accepts_gzip("br;q=1.0, GZIP;q=0.5"))
+        self.assertFalse(preview_module._accepts_gzip("gzip;q=0"))
+        self.assertFalse(preview_module._accepts_gzip("deflate, br"))
+        self.assertFalse(preview_module._accepts_gzip(None))
+
+
 class MapPreviewControlsTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -201,6 +236,7 @@ class MapPreviewControlsTests(unittest.TestCase):
         self.assertEqual(self.widget.scene.traces[0].adjustment.east_m, 125.5)
         self.assertEqual(self.widget.scene.traces[1].adjustment.yaw_deg, 12.3)
 
+        self.assertTrue(self.widget.scene.traces[1].live_preview)
         applied = QSignalSpy(self.widget.scene_applied)
         self.assertFalse(self.widget.apply_button.isEnabled())
         self.widget._failed_generation = None
@@ -210,6 +246,7 @@ class MapPreviewControlsTests(unittest.TestCase):
         self.widget.apply_button.click()
         self.assertEqual(len(applied), 1)
         self.assertIs(applied[0][0], self.widget.scene)
+        self.assertFalse(any(trace.live_preview for trace in applied[0][0].traces))
 
     def test_reset_selected_and_reset_all_do_not_move_other_trace_unintentionally(self):
         with patch.object(self.widget, "_ensure_web_view", return_value=False):
@@ -662,6 +699,159 @@ class MapPreviewControlsTests(unittest.TestCase):
         self.assertIn("No vertices were simplified", self.widget.status_label.text())
         self.assertFalse(self.widget.apply_button.isEnabled())
 
+    def _sent_scene_update(self, *, pending=False):
+        class FakeSceneServer:
+            def __init__(self):
+                self.bodies = []
+
+            def has_pending_scene(self, generation):
+                return pending
+
+            def publish_scene(self, generation, revision, body):
+                self.bodies.append(body)
+                return f"/token/scene/{generation}/{revision}/{len(self.bodies)}"
+
+        server = FakeSceneServer()
+        self.widget._server = server
+        try:
+            with patch.object(self.widget, "_run_javascript") as javascript:
+                self.widget._render_scene()
+        finally:
+            self.widget._server = None
+        javascript.assert_called_once_with(
+            f"window.tasmead.loadScene({self.widget._revision}, "
+            f'"/token/scene/{self.widget._page_generation}/{self.widget._revision}/1");'
+        )
+        (body,) = server.bodies
+        return json.loads(body)
+
+    def test_scene_updates_resend_only_traces_whose_content_changed(self):
+        with patch.object(self.widget, "_ensure_web_view", return_value=False):
+            self.widget.set_scene(scene_with_two_traces(), "test-key")
+        self.widget._shell_ready = True
+        self.widget._failed_generation = None
+
+        initial = self._sent_scene_update()
+        self.assertTrue(initial["fit"])
+        self.assertEqual([trace["id"] for trace in initial["traces"]], ["first", "second"])
+
+        self.widget.axis_controls["east_m"].setValue(10.0)
+        self.widget._render_timer.stop()
+        update = self._sent_scene_update()
+
+        self.assertFalse(update["fit"])
+        self.assertEqual([trace["id"] for trace in update["traces"]], ["first"])
+        self.assertEqual([entry[0] for entry in update["order"]], ["first", "second"])
+        self.assertNotEqual(update["order"][0][1], initial["order"][0][1])
+        self.assertEqual(update["order"][1], initial["order"][1])
+
+        self.widget._begin_page_generation()
+        reloaded = self._sent_scene_update()
+        self.assertTrue(reloaded["fit"])
+        self.assertEqual(len(reloaded["traces"]), 2)
+
+    def test_reported_failure_makes_the_next_update_carry_every_trace(self):
+        with patch.object(self.widget, "_ensure_web_view", return_value=False):
+            self.widget.set_scene(scene_with_two_traces(), "test-key")
+        self.widget._shell_ready = True
+        self.widget._failed_generation = None
+        self._sent_scene_update()
+
+        self.widget._on_render_failed(
+            self.widget._page_generation, "transport", "Scene request failed."
+        )
+        self.widget._failed_generation = None
+        self.widget.axis_controls["east_m"].setValue(10.0)
+        self.widget._render_timer.stop()
+        update = self._sent_scene_update()
+
+        self.assertFalse(update["fit"])
+        self.assertEqual([trace["id"] for trace in update["traces"]], ["first", "second"])
+
+    def test_update_superseding_an_unfetched_one_carries_every_trace(self):
+        with patch.object(self.widget, "_ensure_web_view", return_value=False):
+            self.widget.set_scene(scene_with_two_traces(), "test-key")
+        self.widget._shell_ready = True
+        self.widget._failed_generation = None
+
+        self.assertTrue(self._sent_scene_update()["fit"])
+        self.widget.axis_controls["east_m"].setValue(10.0)
+        self.widget._render_timer.stop()
+        superseding = self._sent_scene_update(pending=True)
+
+        self.assertTrue(superseding["fit"])
+        self.assertEqual([trace["id"] for trace in superseding["traces"]], ["first", "second"])
+        self.widget.axis_controls["east_m"].setValue(20.0)
+        self.widget._render_timer.stop()
+        update = self._sent_scene_update()
+        self.assertFalse(update["fit"])
+        self.assertEqual([trace["id"] for trace in update["traces"]], ["first"])
+
+    def test_packed_paths_are_used_only_when_the_page_supports_them(self):
+        with patch.object(self.widget, "_ensure_web_view", return_value=False):
+            self.widget.set_scene(scene_with_two_traces(), "")
+        self.widget._failed_generation = None
+        generation = self.widget._page_generation
+
+        self.widget._on_shell_ready(generation, 2)
+        self.widget._failed_generation = None
+        packed = self._sent_scene_update()
+        self.assertEqual(packed["version"], 2)
+        self.assertIn("path", packed["traces"][0]["geometries"][0])
+
+        generation = self.widget._begin_page_generation()
+        self.widget._on_shell_ready(generation, 1)
+        self.widget._failed_generation = None
+        fallback = self._sent_scene_update()
+        self.assertEqual(fallback["version"], 1)
+        self.assertIn("coordinates", fallback["traces"][0]["geometries"][0])
+
+    def test_simplified_traces_are_reported_with_their_deviation(self):
+        anchor = KmlCoordinate(-1.0, 51.0, 0.0)
+        document = KmlDocument(
+            name="zigzag",
+            styles=(KmlStyle("track", "aaff00ff", 6.0),),
+            placemarks=(
+                KmlPlacemark(
+                    "zigzag",
+                    "#track",
+                    KmlLineString(
+                        tuple(
+                            KmlCoordinate(-1.0 + index * 1e-4, 51.0 + (index % 2) * 1e-5, 50.0)
+                            for index in range(50)
+                        ),
+                        "absolute",
+                    ),
+                ),
+            ),
+        )
+        scene = PreviewScene((PreparedTrace("zigzag", "Zigzag", anchor, document),))
+        with patch.object(self.widget, "_ensure_web_view", return_value=False):
+            self.widget.set_scene(scene, "test-key")
+        self.widget._shell_ready = True
+        self.widget._failed_generation = None
+
+        with patch.object(
+            preview_module,
+            "preview_tolerance",
+            lambda preview_scene: preview_tolerance(preview_scene, 10),
+        ):
+            update = self._sent_scene_update()
+        self.widget._on_render_acknowledged(
+            self.widget._page_generation, self.widget._revision
+        )
+
+        simplification = update["traces"][0]["simplification"]
+        self.assertLessEqual(simplification["vertexCount"], 10)
+        self.assertEqual(simplification["sourceVertexCount"], 50)
+        self.assertGreater(simplification["maxDeviationM"], 0.0)
+        full_line = self.widget.scene.traces[0].adjusted_document.placemarks[0].geometry
+        self.assertEqual(len(full_line.coordinates), 50)
+        status = self.widget.status_label.text()
+        self.assertIn("Simplified for display only", status)
+        self.assertIn(f"within {simplification['maxDeviationM']:.3f} m", status)
+        self.assertIn("KML export keep every vertex", status)
+
 
 @unittest.skipUnless(
     os.environ.get("TASMEAD_LOOPBACK_SMOKE") == "1",
@@ -720,6 +910,48 @@ class PreviewLoopbackTests(unittest.TestCase):
         finally:
             server.stop()
 
+    def test_published_scenes_are_served_once_and_gzipped_on_request(self):
+        server = PreviewLoopbackServer()
+        try:
+            body = b'{"version":1,"traces":[]}' * 100
+            origin = f"http://127.0.0.1:{server.port}"
+            path = server.publish_scene(4, 7, body)
+            request = urllib.request.Request(
+                origin + path,
+                headers={"Accept-Encoding": "gzip"},
+            )
+            with urllib.request.urlopen(request, timeout=3) as response:
+                self.assertEqual(response.headers["Content-Encoding"], "gzip")
+                self.assertEqual(response.headers["Cache-Control"], "no-store, max-age=0")
+                self.assertEqual(gzip.decompress(response.read()), body)
+            with self.assertRaises(urllib.error.HTTPError) as denied:
+                urllib.request.urlopen(origin + path, timeout=3)
+            self.assertEqual(denied.exception.code, 404)
+
+            plain_path = server.publish_scene(4, 8, body)
+            with self.assertRaises(urllib.error.HTTPError) as denied:
+                urllib.request.urlopen(
+                    origin + plain_path.replace("/4/8/", "/4/9/"),
+                    timeout=3,
+                )
+            self.assertEqual(denied.exception.code, 404)
+            plain_path = server.publish_scene(4, 8, body)
+            with urllib.request.urlopen(origin + plain_path, timeout=3) as response:
+                self.assertIsNone(response.headers["Content-Encoding"])
+                self.assertEqual(response.read(), body)
+
+            superseded_path = server.publish_scene(4, 9, body)
+            self.assertTrue(server.has_pending_scene(4))
+            latest_path = server.publish_scene(4, 10, body)
+            with self.assertRaises(urllib.error.HTTPError) as gone:
+                urllib.request.urlopen(origin + superseded_path, timeout=3)
+            self.assertEqual(gone.exception.code, 410)
+            with urllib.request.urlopen(origin + latest_path, timeout=3) as response:
+                self.assertEqual(response.read(), body)
+            self.assertFalse(server.has_pending_scene(4))
+        finally:
+            server.stop()
+
 
 @unittest.skipUnless(
     WEBENGINE_AVAILABLE and os.environ.get("TASMEAD_WEBENGINE_SMOKE") == "1",
@@ -1,6 +1,8 @@
 import os
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -41,10 +43,19 @@ from services import (
     TranspositionErrorCode,
     TranspositionFileOutcome,
     TranspositionFileStatus,
+    TranspositionCancelled,
+    TranspositionPhase,
+    TranspositionProgress,
     TraceAdjustment,
     create_transposition_plan,
     prepare_transposition,
 )
+from workers import (
+    CancellationToken,
+    RunwayAnalysis,
+    RunwayInferenceQueue,
+    TranspositionWorker,
+)
 
 
 def inferred_track():
@@ -117,10 +128,31 @@ class TransposePageTests(unittest.TestCase):
                 path.parent.mkdir(parents=True, exist_ok=True)
                 path.write_text(valid_kml, encoding="utf-8")
         with (
-            patch("pages.transpose_page.parse_kml_track", return_value=inferred_track()),
+            patch("pages.transpose_page.cached_parse_kml_track", return_value=inferred_track()),
             patch("pages.transpose_page.infer_departure_runway", return_value=inferred_result()),
         ):
             self.page.add_files_to_list([str(path) for path in paths])
+            self.wait_for_source_analysis()
+
+    def wait_for_source_analysis(self, timeout_s=20):
+        deadline = time.monotonic() + timeout_s
+        while not self.page.runway_analysis_queue.is_idle():
+            self.assertLess(
+                time.monotonic(), deadline, "Timed out waiting for runway inference"
+            )
+            self.app.processEvents()
+            time.sleep(0.005)
+        self.app.processEvents()
+
+    def wait_for_transposition(self, timeout_s=20):
+        deadline = time.monotonic() + timeout_s
+        while self.page.has_active_transposition():
+            self.assertLess(
+                time.monotonic(), deadline, "Timed out waiting for the transposition worker"
+            )
+            self.app.processEvents()
+            time.sleep(0.005)
+        self.app.processEvents()
 
     def configure_target(self, runway="24"):
         self.page.target_card.name_input.setText("RAF Fairford")
@@ -271,6 +303,7 @@ class TransposePageTests(unittest.TestCase):
             patch.object(QMessageBox, "warning") as warning,
         ):
             self.page.open_preview()
+            self.wait_for_transposition()
 
         self.assertEqual(
             prepare.call_args.kwargs["input_files"],
@@ -280,6 +313,138 @@ class TransposePageTests(unittest.TestCase):
         self.assertEqual(len(scenes[0].traces), 1)
         warning.assert_not_called()
 
+    def test_added_files_are_analysed_in_the_background_selected_first(self):
+        paths = [self.root / f"flight-{index}.kml" for index in range(4)]
+        for path in paths:
+            path.write_text("<kml/>", encoding="utf-8")
+        release = threading.Event()
+        started = []
+        self.page.runway_analysis_queue.started.connect(
+            lambda path: started.append(Path(path).name)
+        )
+
+        def held_parse(path):
+            self.assertTrue(release.wait(10))
+            return inferred_track()
+
+        with (
+            patch("pages.transpose_page.cached_parse_kml_track", side_effect=held_parse),
+            patch("pages.transpose_page.infer_departure_runway", return_value=inferred_result()),
+        ):
+            self.page.add_files_to_list([str(path) for path in paths])
+            self.app.processEvents()
+            self.assertEqual(
+                [self.page.file_list.item(row).text() for row in range(4)],
+                [
+                    "flight-0.kml — Analysing…",
+                    "flight-1.kml — Analysing…",
+                    "flight-2.kml — Queued",
+                    "flight-3.kml — Queued",
+                ],
+            )
+            self.assertEqual(self.page.source_card.status_label.text(), "Analysing…")
+            self.page.file_list.setCurrentRow(3)
+            release.set()
+            self.wait_for_source_analysis()
+
+        self.assertEqual(
+            started,
+            ["flight-0.kml", "flight-1.kml", "flight-3.kml", "flight-2.kml"],
+        )
+        self.assertEqual(
+            [self.page.file_list.item(row).text() for row in range(4)],
+            [path.name for path in paths],
+        )
+        self.assertEqual(self.page.source_card.status_label.text(), "Auto-detected")
+        self.assertTrue(
+            all(state.analysed for state in self.page.source_states.values())
+        )
+
+    def test_preview_runs_off_the_gui_thread_with_per_file_progress(self):
+        source = self.root / "source.kml"
+        self.add_inferred_files(source)
+        self.configure_target()
+        scenes = []
+        self.page.preview_requested.connect(scenes.append)
+        release = threading.Event()
+        threads = []
+
+        def held_prepare(*, progress_callback, cancellation_check, **kwargs):
+            threads.append(threading.current_thread())
+            batch = prepare_transposition(**kwargs)
+            progress_callback(
+                TranspositionProgress(
+                    TranspositionPhase.PREPARING,
+                    1,
+                    1,
+                    source.resolve(),
+                    "Prepared source.kml (1 of 1).",
+                )
+            )
+            self.assertTrue(release.wait(10))
+            return batch
+
+        with patch("pages.transpose_page.prepare_transposition", side_effect=held_prepare):
+            self.page.open_preview()
+            self.assertTrue(self.page.has_active_transposition())
+            self.assertFalse(self.page.preview_btn.isEnabled())
+            self.assertFalse(self.page.run_btn.isEnabled())
+            self.assertFalse(self.page.cancel_transposition_btn.isHidden())
+            deadline = time.monotonic() + 10
+            while self.page.transposition_progress_bar.value() < 100:
+                self.assertLess(time.monotonic(), deadline)
+                self.app.processEvents()
+                time.sleep(0.005)
+            self.assertEqual(self.page.file_list.item(0).text(), "source.kml — Prepared")
+            self.page.export_committed_scene()
+            release.set()
+            self.wait_for_transposition()
+
+        self.assertIsNot(threads[0], threading.main_thread())
+        self.assertEqual(len(scenes), 1)
+        self.assertTrue(self.page.preview_btn.isEnabled())
+        self.assertTrue(self.page.transposition_progress_bar.isHidden())
+        self.assertEqual(self.page.file_list.item(0).text(), "source.kml")
+
+    def test_cancelled_preparation_reports_nothing_and_restores_controls(self):
+        source = self.root / "source.kml"
+        self.add_inferred_files(source)
+        self.configure_target()
+        started = threading.Event()
+
+        def cancellable_prepare(*, progress_callback, cancellation_check, **kwargs):
+            started.set()
+            deadline = time.monotonic() + 10
+            while not cancellation_check():
+                if time.monotonic() > deadline:
+                    raise AssertionError("The worker was never cancelled")
+                time.sleep(0.005)
+            raise TranspositionCancelled()
+
+        with (
+            patch.object(
+                self.page,
+                "_choose_transposition_inputs",
+                return_value=(str(source.resolve()),),
+            ),
+            patch("pages.transpose_page.prepare_transposition", side_effect=cancellable_prepare),
+            patch.object(QFileDialog, "getExistingDirectory") as folder,
+            patch.object(QMessageBox, "critical") as critical,
+            patch.object(QMessageBox, "information") as information,
+        ):
+            self.page.run_transposition_ui()
+            self.assertTrue(started.wait(10))
+            self.assertTrue(self.page.cancel_transposition())
+            self.assertFalse(self.page.cancel_transposition_btn.isEnabled())
+            self.wait_for_transposition()
+
+        folder.assert_not_called()
+        critical.assert_not_called()
+        information.assert_not_called()
+        self.assertTrue(self.page.run_btn.isEnabled())
+        self.assertIsNone(self.page._prepared_batch)
+
+
     def test_preview_export_uses_its_file_without_opening_selection_dialog(self):
         source = self.root / "source.kml"
         self.add_inferred_files(source)
@@ -322,6 +487,7 @@ class TransposePageTests(unittest.TestCase):
             patch.object(QMessageBox, "warning") as warning,
         ):
             self.page.run_transposition_ui()
+            self.wait_for_transposition()
 
         self.assertEqual(
             prepare.call_args.kwargs["input_files"],
@@ -339,7 +505,7 @@ class TransposePageTests(unittest.TestCase):
         self.page.source_card.coordinate_input.clear()
         self.page._source_form_edited()
         with (
-            patch("pages.transpose_page.parse_kml_track", return_value=inferred_track()),
+            patch("pages.transpose_page.cached_parse_kml_track", return_value=inferred_track()),
             patch(
                 "pages.transpose_page.infer_departure_runway",
                 return_value=inferred_result(),
@@ -359,6 +525,7 @@ class TransposePageTests(unittest.TestCase):
             patch.object(QMessageBox, "warning") as warning,
         ):
             self.page.run_transposition_ui()
+            self.wait_for_transposition()
 
         folder.assert_not_called()
         warning.assert_called_once()
@@ -398,10 +565,11 @@ class TransposePageTests(unittest.TestCase):
             patch("pages.transpose_page.remembered_directory", return_value=initial) as remembered,
             patch.object(QFileDialog, "getOpenFileNames", return_value=([str(source)], "")) as chooser,
             patch("pages.transpose_page.remember_file_selection") as remember,
-            patch("pages.transpose_page.parse_kml_track", return_value=inferred_track()),
+            patch("pages.transpose_page.cached_parse_kml_track", return_value=inferred_track()),
             patch("pages.transpose_page.infer_departure_runway", return_value=inferred_result()),
         ):
             self.page.browse_files()
+            self.wait_for_source_analysis()
 
         remembered.assert_called_once_with(
             FileDialogWorkflow.TRANSPOSITION,
@@ -437,7 +605,7 @@ class TransposePageTests(unittest.TestCase):
         self.assertEqual(first_state.provenance, "Manual override")
 
         with (
-            patch("pages.transpose_page.parse_kml_track", return_value=inferred_track()),
+            patch("pages.transpose_page.cached_parse_kml_track", return_value=inferred_track()),
             patch("pages.transpose_page.infer_departure_runway", return_value=inferred_result()),
         ):
             self.page.file_list.setCurrentRow(1)
@@ -539,6 +707,7 @@ class TransposePageTests(unittest.TestCase):
             patch.object(QFileDialog, "getExistingDirectory") as folder,
         ):
             self.page.run_transposition_ui()
+            self.wait_for_transposition()
 
         question.assert_called_once()
         message = question.call_args.args[2]
@@ -561,6 +730,7 @@ class TransposePageTests(unittest.TestCase):
             patch.object(QFileDialog, "getExistingDirectory", return_value=""),
         ):
             self.page.run_transposition_ui()
+            self.wait_for_transposition()
 
         self.assertEqual(self.page.target_card.runway_input.text(), "24R")
         question.assert_not_called()
@@ -589,7 +759,7 @@ class TransposePageTests(unittest.TestCase):
                 "_choose_transposition_inputs",
                 return_value=(str(first.resolve()), str(second.resolve())),
             ),
-            patch("pages.transpose_page.parse_kml_track", return_value=inferred_track()),
+            patch("pages.transpose_page.cached_parse_kml_track", return_value=inferred_track()),
             patch("pages.transpose_page.infer_departure_runway", return_value=inferred_result()),
             patch.object(QFileDialog, "getExistingDirectory", return_value=str(output_dir)),
             patch("pages.transpose_page.remember_directory") as remember_output,
@@ -598,6 +768,7 @@ class TransposePageTests(unittest.TestCase):
             patch.object(QMessageBox, "information"),
         ):
             self.page.run_transposition_ui()
+            self.wait_for_transposition()
 
         prepared_batch, plan = run.call_args.args
         self.assertEqual(len(plan.jobs), 2)
@@ -609,6 +780,40 @@ class TransposePageTests(unittest.TestCase):
             str(output_dir),
         )
 
+    def test_several_airfields_share_one_preparation_and_write_a_plan_each(self):
+        first = self.root / "first.kml"
+        second = self.root / "second.kml"
+        output_dir = self.root / "outputs"
+        output_dir.mkdir()
+        self.add_inferred_files(first, second)
+        targets = (
+            ("RAF Fairford", RunwayReference(51.68, -1.79, 270.0)),
+            ("Duxford", RunwayReference(52.09, 0.13, 240.0)),
+        )
+
+        with (
+            patch.object(
+                self.page,
+                "_choose_transposition_inputs",
+                return_value=(str(first.resolve()), str(second.resolve())),
+            ),
+            patch.object(self.page, "_choose_transposition_targets", return_value=targets),
+            patch.object(QFileDialog, "getExistingDirectory", return_value=str(output_dir)),
+            patch("pages.transpose_page.remember_directory"),
+            patch.object(QMessageBox, "information") as information,
+        ):
+            self.page.run_multi_target_transposition_ui()
+            self.wait_for_transposition()
+            self.assertTrue(self.page.multi_target_btn.isEnabled())
+
+        information.assert_called_once()
+        self.assertIn("RAF Fairford: 2 of 2 saved", information.call_args.args[2])
+        self.assertIn("Duxford: 2 of 2 saved", information.call_args.args[2])
+        written = sorted(path.name for path in output_dir.glob("*.kml"))
+        self.assertEqual(len(written), 4)
+        self.assertEqual(sum("duxford" in name.casefold() for name in written), 2)
+        self.assertEqual(sum("fairford" in name.casefold() for name in written), 2)
+
     def test_partial_failure_dialog_reports_every_success_and_failure(self):
         first = self.root / "first.kml"
         failed = self.root / "failed.kml"
@@ -645,7 +850,7 @@ class TransposePageTests(unittest.TestCase):
                 "_choose_transposition_inputs",
                 return_value=(str(first.resolve()), str(failed.resolve())),
             ),
-            patch("pages.transpose_page.parse_kml_track", return_value=inferred_track()),
+            patch("pages.transpose_page.cached_parse_kml_track", return_value=inferred_track()),
             patch("pages.transpose_page.infer_departure_runway", return_value=inferred_result()),
             patch.object(QFileDialog, "getExistingDirectory", return_value=str(output_dir)),
             patch.object(self.page, "_edit_output_plan", side_effect=lambda plan, **_: plan),
@@ -653,6 +858,7 @@ class TransposePageTests(unittest.TestCase):
             patch.object(QMessageBox, "warning") as warning,
         ):
             self.page.run_transposition_ui()
+            self.wait_for_transposition()
 
         message = warning.call_args.args[2]
         self.assertIn("Saved 1 of 2", message)
@@ -662,6 +868,50 @@ class TransposePageTests(unittest.TestCase):
         self.assertIn("first.kml:", message)
         self.assertIn("Omitted 2 source coordinate(s)", message)
 
+    def test_cancelled_export_counts_the_whole_batch(self):
+        inputs = tuple(self.root / f"flight-{index}.kml" for index in range(3))
+        output_dir = self.root / "outputs"
+        output_dir.mkdir()
+        self.add_inferred_files(*inputs)
+        self.configure_target()
+        saved = TranspositionFileOutcome(
+            input_path=inputs[0],
+            planned_output_path=output_dir / "flight-0.kml",
+            final_output_path=output_dir / "flight-0.kml",
+            status=TranspositionFileStatus.SUCCEEDED,
+        )
+
+        for outcomes, expected in (
+            ((saved,), "Saved 1 of 3"),
+            ((), "Saved none of the 3"),
+        ):
+            with self.subTest(expected=expected):
+                def cancelled_export(*_args, **_kwargs):
+                    raise TranspositionCancelled(
+                        result=TranspositionBatchResult(outcomes=outcomes)
+                    )
+
+                with (
+                    patch.object(
+                        self.page,
+                        "_choose_transposition_inputs",
+                        return_value=tuple(str(path.resolve()) for path in inputs),
+                    ),
+                    patch("pages.transpose_page.cached_parse_kml_track", return_value=inferred_track()),
+                    patch("pages.transpose_page.infer_departure_runway", return_value=inferred_result()),
+                    patch.object(QFileDialog, "getExistingDirectory", return_value=str(output_dir)),
+                    patch.object(self.page, "_edit_output_plan", side_effect=lambda plan, **_: plan),
+                    patch(
+                        "pages.transpose_page.export_prepared_transposition",
+                        side_effect=cancelled_export,
+                    ),
+                    patch.object(QMessageBox, "information") as information,
+                ):
+                    self.page.run_transposition_ui()
+                    self.wait_for_transposition()
+
+                self.assertIn(expected, information.call_args.args[2])
+
     def test_success_with_processing_warnings_uses_warning_dialog(self):
         source = self.root / "source.kml"
         output_dir = self.root / "outputs"
@@ -688,7 +938,7 @@ class TransposePageTests(unittest.TestCase):
                 "_choose_transposition_inputs",
                 return_value=(str(source.resolve()),),
             ),
-            patch("pages.transpose_page.parse_kml_track", return_value=inferred_track()),
+            patch("pages.transpose_page.cached_parse_kml_track", return_value=inferred_track()),
             patch("pages.transpose_page.infer_departure_runway", return_value=inferred_result()),
             patch.object(QFileDialog, "getExistingDirectory", return_value=str(output_dir)),
             patch.object(self.page, "_edit_output_plan", side_effect=lambda plan, **_: plan),
@@ -697,6 +947,7 @@ class TransposePageTests(unittest.TestCase):
             patch.object(QMessageBox, "information") as information,
         ):
             self.page.run_transposition_ui()
+            self.wait_for_transposition()
 
         warning.assert_called_once()
         self.assertEqual(
@@ -740,6 +991,7 @@ class TransposePageTests(unittest.TestCase):
             patch.object(QMessageBox, "information") as information,
         ):
             self.page.run_transposition_ui()
+            self.wait_for_transposition()
 
         critical.assert_called_once()
         self.assertIn("No KML files were produced", critical.call_args.args[2])
@@ -748,10 +1000,11 @@ class TransposePageTests(unittest.TestCase):
     def test_malformed_input_remains_a_per_file_failure_candidate(self):
         source = self.root / "broken.kml"
         with patch(
-            "pages.transpose_page.parse_kml_track",
+            "pages.transpose_page.cached_parse_kml_track",
             side_effect=KmlStructureError("No path geometry"),
         ):
             self.page.add_files_to_list([str(source)])
+            self.wait_for_source_analysis()
 
         self.assertEqual(self.page.source_card.status_label.text(), "File error")
         self.assertEqual(self.page._review_source_runways(), (None,))
@@ -877,5 +1130,81 @@ class AirfieldPresetManagerTests(unittest.TestCase):
         self.assertEqual(record.preset.data["runway"], "DISPLAY-A")
 
 
+class RunwayInferenceQueueTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def wait_until_idle(self, queue):
+        deadline = time.monotonic() + 10
+        while not queue.is_idle():
+            self.assertLess(time.monotonic(), deadline)
+            self.app.processEvents()
+            time.sleep(0.005)
+
+    def test_prioritised_paths_jump_the_queue_and_discarded_results_are_dropped(self):
+        release = threading.Event()
+
+        def analyser(path):
+            self.assertTrue(release.wait(10))
+            if path == "broken":
+                raise ValueError("Unreadable KML")
+            return RunwayAnalysis(path, altitude_mode="absolute")
+
+        queue = RunwayInferenceQueue(analyser, max_workers=1)
+        results = []
+        queue.analysed.connect(results.append)
+        queue.enqueue(["first", "second", "broken", "fourth", "second"])
+        queue.prioritise("fourth")
+        queue.discard("second")
+        self.assertTrue(queue.is_running("first"))
+        self.assertFalse(queue.is_pending("second"))
+        release.set()
+        self.wait_until_idle(queue)
+        queue.shutdown()
+
+        self.assertEqual([result.path for result in results], ["first", "fourth", "broken"])
+        self.assertEqual(results[-1].error, "Unreadable KML")
+
+
+class TranspositionWorkerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def run_worker(self, task):
+        worker = TranspositionWorker(task, CancellationToken())
+        outcomes = []
+        worker.succeeded.connect(lambda result: outcomes.append(("success", result)))
+        worker.cancelled.connect(lambda result: outcomes.append(("cancelled", result)))
+        worker.failed.connect(lambda failure: outcomes.append(("failure", failure)))
+        worker.finished.connect(lambda: outcomes.append(("finished", None)))
+        worker.run()
+        worker.run()
+        return outcomes
+
+    def test_each_run_emits_one_terminal_signal_then_finished(self):
+        partial_result = TranspositionBatchResult(())
+
+        def cancelled(**_kwargs):
+            raise TranspositionCancelled(result=partial_result)
+
+        def failing(**_kwargs):
+            raise OSError("Disk full")
+
+        self.assertEqual(
+            self.run_worker(lambda **_kwargs: "batch"),
+            [("success", "batch"), ("finished", None)],
+        )
+        self.assertEqual(
+            self.run_worker(cancelled),
+            [("cancelled", partial_result), ("finished", None)],
+        )
+        outcomes = self.run_worker(failing)
+        self.assertEqual([kind for kind, _ in outcomes], ["failure", "finished"])
+        self.assertEqual(outcomes[0][1].exception_type, "OSError")
+        self.assertEqual(outcomes[0][1].message, "Disk full")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from dataclasses import replace
 from pathlib import Path
@@ -15,12 +17,19 @@ FIXTURES = PROJECT_ROOT / "tests" / "fixtures" / "kml"
 from services.kml_export import KmlCoordinate, KmlLineString, render_kml
 from services.map_preview import TraceAdjustment
 from services.runway_alignment import RunwayReference
+import services.transpose_coordinates as transpose_coordinates
 from services.transpose_coordinates import (
+    PreparationCache,
     PreparedTranspositionBatch,
+    TranspositionCancelled,
     TranspositionErrorCode,
+    TranspositionPhase,
     create_transposition_plan,
+    create_transposition_plans,
     export_prepared_transposition,
+    export_prepared_transpositions,
     prepare_transposition,
+    prepare_transposition_targets,
 )
 
 
@@ -153,5 +162,255 @@ class TranspositionPreparationTests(unittest.TestCase):
         self.assertTrue(all(label.startswith("display — ") for label in labels))
 
 
+    def test_parallel_preparation_matches_serial_in_input_order(self):
+        inputs = tuple(
+            self.fixture(name)
+            for name in (
+                "gx_track.kml",
+                "wrong_arity.kml",
+                "line_string_namespaced.kml",
+                "line_string_inline_style.kml",
+            )
+        )
+        runways = (self.source_runway,) * len(inputs)
+        serial = prepare_transposition(
+            input_files=inputs,
+            source_runways=runways,
+            target_runway=self.target_runway,
+            max_workers=1,
+        )
+        progress = []
+        parallel = prepare_transposition(
+            input_files=inputs,
+            source_runways=runways,
+            target_runway=self.target_runway,
+            max_workers=2,
+            progress_callback=progress.append,
+        )
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(
+            [item.input_path for item in parallel.items], list(inputs)
+        )
+        self.assertEqual(parallel.failed_items[0].code, TranspositionErrorCode.INPUT_KML)
+        self.assertEqual([update.completed for update in progress], [0, 1, 2, 3, 4])
+        self.assertEqual(
+            {update.input_path for update in progress[1:]}, set(inputs)
+        )
+        self.assertTrue(
+            all(update.phase is TranspositionPhase.PREPARING for update in progress)
+        )
+
+    def test_cache_re_prepares_only_inputs_whose_key_changed(self):
+        first = self.fixture("line_string_namespaced.kml")
+        second = self.fixture("gx_track.kml")
+        cache = PreparationCache()
+        moved_runway = replace(self.source_runway, true_heading_deg=40.0)
+
+        with patch(
+            "services.transpose_coordinates._prepare_source",
+            wraps=transpose_coordinates._prepare_source,
+        ) as prepare_source:
+            initial = prepare_transposition(
+                input_files=(first, second),
+                source_runways=(self.source_runway, self.source_runway),
+                target_runway=self.target_runway,
+                cache=cache,
+            )
+            edited = prepare_transposition(
+                input_files=(first, second),
+                source_runways=(self.source_runway, moved_runway),
+                target_runway=self.target_runway,
+                cache=cache,
+            )
+            reordered = prepare_transposition(
+                input_files=(second, first),
+                source_runways=(moved_runway, self.source_runway),
+                target_runway=self.target_runway,
+                cache=cache,
+            )
+
+        self.assertEqual(
+            [call.args[0] for call in prepare_source.call_args_list],
+            [first, second, second],
+        )
+        self.assertIs(edited.items[0], initial.items[0])
+        self.assertNotEqual(edited.items[1].document, initial.items[1].document)
+        self.assertEqual(
+            [item.trace.trace_id for item in reordered.items],
+            ["transposition-0", "transposition-1"],
+        )
+        self.assertIs(reordered.items[1].document, initial.items[0].document)
+        self.assertEqual(
+            reordered,
+            prepare_transposition(
+                input_files=(second, first),
+                source_runways=(moved_runway, self.source_runway),
+                target_runway=self.target_runway,
+            ),
+        )
+
+    def test_cache_is_sized_to_each_batch(self):
+        count = transpose_coordinates.PREPARATION_CACHE_SIZE + 8
+        source = self.fixture("line_string_namespaced.kml").read_bytes()
+        cache = PreparationCache()
+        with tempfile.TemporaryDirectory() as temporary:
+            inputs = []
+            for index in range(count):
+                path = Path(temporary) / f"flight-{index}.kml"
+                path.write_bytes(source)
+                inputs.append(path)
+
+            with patch(
+                "services.transpose_coordinates._prepare_source",
+                wraps=transpose_coordinates._prepare_source,
+            ) as prepare_source:
+                for _ in range(3):
+                    prepare_transposition(
+                        input_files=inputs,
+                        source_runways=(self.source_runway,) * count,
+                        target_runway=self.target_runway,
+                        max_workers=1,
+                        cache=cache,
+                    )
+                self.assertEqual(len(cache), count)
+                # A smaller batch shrinks the cache back but keeps its own hits.
+                for _ in range(2):
+                    prepare_transposition(
+                        input_files=inputs[:3],
+                        source_runways=(self.source_runway,) * 3,
+                        target_runway=self.target_runway,
+                        max_workers=1,
+                        cache=cache,
+                    )
+
+        self.assertEqual(prepare_source.call_count, count)
+        self.assertEqual(len(cache), transpose_coordinates.PREPARATION_CACHE_SIZE)
+
+    def test_fan_out_parses_once_and_matches_single_target_preparation(self):
+        inputs = (
+            self.fixture("gx_track.kml"),
+            self.fixture("wrong_arity.kml"),
+            self.fixture("line_string_namespaced.kml"),
+        )
+        runways = (self.source_runway,) * len(inputs)
+        targets = (self.target_runway, RunwayReference(52.3, 0.4, 217.5))
+        with patch(
+            "services.transpose_coordinates.cached_parse_kml_track",
+            wraps=transpose_coordinates.cached_parse_kml_track,
+        ) as parse:
+            batches = prepare_transposition_targets(
+                targets, input_files=inputs, source_runways=runways
+            )
+        self.assertEqual(parse.call_count, len(inputs))
+
+        self.assertEqual(len(batches), 2)
+        for target, batch in zip(targets, batches):
+            single = prepare_transposition(
+                input_files=inputs, source_runways=runways, target_runway=target
+            )
+            self.assertEqual(batch.target_runway, target)
+            self.assertEqual(batch.failed_items, single.failed_items)
+            for fanned, expected in zip(batch.prepared, single.prepared):
+                self.assertEqual(fanned.trace.label, expected.trace.label)
+                self.assertEqual(fanned.trace.anchor, expected.trace.anchor)
+                self.assertEqual(fanned.warnings, expected.warnings)
+                for actual, wanted in zip(
+                    fanned.document.placemarks[0].geometry.coordinates,
+                    expected.document.placemarks[0].geometry.coordinates,
+                ):
+                    self.assertAlmostEqual(actual.latitude, wanted.latitude, places=9)
+                    self.assertAlmostEqual(actual.longitude, wanted.longitude, places=9)
+                    self.assertEqual(actual.altitude_m, wanted.altitude_m)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plans = create_transposition_plans(inputs, temp_dir, ("Field", "Field"))
+            results = export_prepared_transpositions(
+                tuple(zip(batches, plans)), max_workers=2
+            )
+            output_names = {
+                output.output_path.name
+                for result in results
+                for output in result.successful
+            }
+        self.assertEqual([result.success_count for result in results], [2, 2])
+        self.assertEqual(len(output_names), 4)
+
+    def test_cancellation_stops_between_files(self):
+        inputs = (
+            self.fixture("line_string_namespaced.kml"),
+            self.fixture("gx_track.kml"),
+        )
+        batch = self.prepare(("line_string_namespaced.kml", "gx_track.kml"))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plan = create_transposition_plan(inputs, temp_dir, "Field")
+            progress = []
+            with self.assertRaises(TranspositionCancelled) as raised:
+                export_prepared_transposition(
+                    batch,
+                    plan,
+                    max_workers=1,
+                    progress_callback=progress.append,
+                    cancellation_check=lambda: len(progress) > 1,
+                )
+
+            written = raised.exception.result
+            self.assertEqual(written.total_count, 1)
+            self.assertTrue(written.successful[0].output_path.is_file())
+            self.assertFalse(plan.jobs[1].output_path.exists())
+
+        with self.assertRaises(TranspositionCancelled):
+            prepare_transposition(
+                input_files=inputs,
+                source_runways=(self.source_runway,) * 2,
+                target_runway=self.target_runway,
+                cancellation_check=lambda: True,
+            )
+
+
+    def test_cancelled_threaded_export_reports_every_file_it_wrote(self):
+        source = self.fixture("line_string_namespaced.kml").read_bytes()
+        started = threading.Event()
+        write_kml = transpose_coordinates.write_kml
+
+        def slow_write(*args, **kwargs):
+            started.set()
+            time.sleep(0.1)
+            return write_kml(*args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as temp_dir:
+            inputs = []
+            for index in range(8):
+                path = Path(input_dir) / f"flight-{index}.kml"
+                path.write_bytes(source)
+                inputs.append(path)
+            batch = prepare_transposition(
+                input_files=inputs,
+                source_runways=(self.source_runway,) * len(inputs),
+                target_runway=self.target_runway,
+                max_workers=1,
+            )
+            plan = create_transposition_plan(inputs, temp_dir, "Field")
+            with (
+                patch("services.transpose_coordinates.write_kml", side_effect=slow_write),
+                self.assertRaises(TranspositionCancelled) as raised,
+            ):
+                export_prepared_transposition(
+                    batch,
+                    plan,
+                    max_workers=4,
+                    cancellation_check=started.is_set,
+                )
+            time.sleep(0.3)
+
+            written = raised.exception.result
+            self.assertGreater(written.success_count, 0)
+            self.assertLess(written.success_count, len(inputs))
+            self.assertEqual(
+                {outcome.output_path for outcome in written.successful},
+                set(Path(temp_dir).glob("*.kml")),
+            )
+
+
 if __name__ == "__main__":
     unittest.main()